@@ -0,0 +1,73 @@
+"""
+ConfigX Benchmarks - bench_async.py
+
+Event-loop latency under durable write load. A ticker task sleeps 1 ms in
+a loop and records how late it wakes up, while writer tasks update a
+persistent ConfigX either with resolve() (fsync on the loop) or with
+aresolve() (fsync on the WAL's I/O thread, shared between writers).
+
+Usage:
+    python benchmarks/bench_async.py [writers] [writes_per_writer]
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+
+import asyncio
+import shutil
+import sys
+import tempfile
+import time
+
+from configx import ConfigX
+
+
+async def run(mode: str, writers: int, writes: int):
+    storage = tempfile.mkdtemp()
+    cfg = ConfigX(persistent=True, storage_dir=storage)
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            t0 = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append((time.perf_counter() - t0 - 0.001) * 1000)
+
+    async def writer(w: int):
+        for i in range(writes):
+            query = f"load.w{w}.n{i % 8}={i}"
+            if mode == "aresolve":
+                await cfg.aresolve(query)
+            else:
+                cfg.resolve(query)
+                await asyncio.sleep(0)
+
+    tick = asyncio.create_task(ticker())
+    t0 = time.perf_counter()
+    await asyncio.gather(*(writer(w) for w in range(writers)))
+    elapsed = time.perf_counter() - t0
+    done.set()
+    await tick
+
+    await cfg.aclose()
+    shutil.rmtree(storage)
+
+    lags.sort()
+    p99 = lags[int(len(lags) * 0.99)] if lags else 0.0
+    print(
+        f"{mode:9} {writers * writes / elapsed:9.0f} writes/s   "
+        f"loop lag p50 {lags[len(lags) // 2] if lags else 0.0:7.2f} ms   "
+        f"p99 {p99:7.2f} ms   max {lags[-1] if lags else 0.0:7.2f} ms"
+    )
+
+
+def main():
+    writers = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    writes = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    for mode in ("resolve", "aresolve"):
+        asyncio.run(run(mode, writers, writes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+ConfigX Benchmarks - bench_concurrency.py
+
+Multithreaded write stress test for ConfigTree + WAL.
+Every thread writes to its own top-level subtree, so writers only contend
+on the WAL append; throughput should grow as threads are added because the
+fsync of one writer overlaps with the work of the others.
+
+Usage:
+    python benchmarks/bench_concurrency.py [ops_per_thread]
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import time
+
+from configx.core.tree import ConfigTree
+from configx.storage.runtime import StorageRuntime
+
+
+def run(threads: int, ops: int) -> float:
+    """
+    Run `threads` writers doing `ops` sets each; returns ops/second.
+    """
+    tmpdir = tempfile.mkdtemp()
+    try:
+        runtime = StorageRuntime(
+            os.path.join(tmpdir, "snapshot.cx"),
+            os.path.join(tmpdir, "wal.cx"),
+        )
+        tree = ConfigTree(runtime=runtime)
+        runtime.start(tree)
+
+        def worker(tid: int):
+            for i in range(ops):
+                tree.set(f"worker_{tid}.keys.k{i}", i)
+
+        pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+
+        start = time.perf_counter()
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        return (threads * ops) / elapsed
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def main():
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print(f"{'threads':>8} {'ops/s':>12} {'speedup':>8}")
+    baseline = None
+    for threads in (1, 2, 4, 8):
+        rate = run(threads, ops)
+        baseline = baseline or rate
+        print(f"{threads:>8} {rate:>12.0f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+ConfigX Benchmarks - bench_construction.py
+
+Start-up cost of ConfigX: `import configx`, the first ConfigX() of a process
+(which builds the ConfigXQL parser tables, or loads them with parser_cache),
+and every later ConfigX(), which should reuse the process-wide parser.
+Each cold measurement runs in a fresh interpreter.
+
+Exits with status 1 if a measurement is over its budget (milliseconds).
+
+Usage:
+    python benchmarks/bench_construction.py [--import-ms 250] [--first-ms 150] [--next-ms 2]
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# the repository root, so the benchmark runs against this checkout
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COLD = """
+import time
+t0 = time.perf_counter()
+import configx
+t1 = time.perf_counter()
+configx.ConfigX(parser_cache={cache!r})
+t2 = time.perf_counter()
+print((t1 - t0) * 1000, (t2 - t1) * 1000)
+"""
+
+
+def cold(cache, runs: int):
+    """Median (import_ms, first_construction_ms) over `runs` fresh processes."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", COLD.format(cache=cache)],
+            capture_output=True, text=True, env=env, check=True,
+        ).stdout.split()
+        samples.append((float(out[0]), float(out[1])))
+
+    samples.sort(key=lambda s: s[0] + s[1])
+    return samples[len(samples) // 2]
+
+
+def warm(n: int) -> float:
+    """Average ms of a ConfigX() once the parser exists."""
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    from configx import ConfigX
+
+    ConfigX()
+    t0 = time.perf_counter()
+    for _ in range(n):
+        ConfigX()
+    return (time.perf_counter() - t0) * 1000 / n
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--import-ms", type=float, default=250.0)
+    ap.add_argument("--first-ms", type=float, default=150.0)
+    ap.add_argument("--next-ms", type=float, default=2.0)
+    args = ap.parse_args()
+
+    cache_file = os.path.join(tempfile.mkdtemp(), "configxql.lark.cache")
+    cold(cache_file, 1)  # populate the table cache
+
+    import_ms, first_ms = cold(None, args.runs)
+    _, cached_ms = cold(cache_file, args.runs)
+    next_ms = warm(200)
+
+    rows = [
+        ("import configx", import_ms, args.import_ms),
+        ("first ConfigX()", first_ms, args.first_ms),
+        ("first ConfigX(parser_cache)", cached_ms, args.first_ms),
+        ("next ConfigX()", next_ms, args.next_ms),
+    ]
+
+    failed = False
+    for name, value, budget in rows:
+        ok = value <= budget
+        failed |= not ok
+        print(f"{name:30} {value:8.2f} ms   (budget {budget:.0f} ms){'' if ok else '  OVER BUDGET'}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+ConfigX Benchmarks - bench_execute.py
+
+Per-call cost of running a repeated ConfigXQL query: execute() on cached
+query text, the callable from compile(), and the equivalent direct
+ConfigTree call as the floor.
+
+Usage:
+    python benchmarks/bench_execute.py [iterations]
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+
+import sys
+import time
+
+from configx.core.tree import ConfigTree
+from configx.qlang.interpreter import ConfigXQLInterpreter
+
+CASES = [
+    ("get", "agents.a17.limits.max_retries", lambda t: t.get("agents.a17.limits.max_retries")),
+    ("set", "agents.a17.limits.max_retries=5", lambda t: t.set("agents.a17.limits.max_retries", 5)),
+    ("safe get", "agents.a17.missing!", None),
+]
+
+
+def per_call_us(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) * 1e6 / n
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    tree = ConfigTree()
+    tree.set("agents.a17.limits.max_retries", 3)
+    q = ConfigXQLInterpreter(tree)
+
+    for name, query, direct in CASES:
+        run = q.compile(query)
+        rows = [
+            ("execute(text)", lambda: q.execute(query)),
+            ("compile(text)()", run),
+        ]
+        if direct is not None:
+            rows.append(("tree call", lambda: direct(tree)))
+
+        print(f"{name}: {query}")
+        for label, fn in rows:
+            print(f"  {label:18} {per_call_us(fn, n):8.3f} us/call")
+
+
+if __name__ == "__main__":
+    main()
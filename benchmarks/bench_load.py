@@ -0,0 +1,80 @@
+"""
+ConfigX Benchmarks - bench_load.py
+
+Importing a JSON document into a persistent ConfigX: ConfigX.load_json
+(streaming parse, one merge, one checkpoint) against setting every leaf
+through the WAL, with json.load alone as the parse-speed floor.
+
+Usage:
+    python benchmarks/bench_load.py [records]
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from configx import ConfigX
+
+
+def leaves(data, prefix=""):
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from leaves(value, path)
+        else:
+            yield path, value
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    tmpdir = tempfile.mkdtemp()
+
+    try:
+        data = {
+            "users": {
+                f"u{i}": {"name": f"user{i}", "score": i, "ratio": i / 7, "active": i % 2 == 0}
+                for i in range(records)
+            }
+        }
+        path = os.path.join(tmpdir, "data.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        mb = os.path.getsize(path) / 1e6
+
+        t0 = time.perf_counter()
+        with open(path, encoding="utf-8") as f:
+            json.load(f)
+        parse = time.perf_counter() - t0
+
+        cfg = ConfigX(persistent=True, storage_dir=os.path.join(tmpdir, "bulk"))
+        t0 = time.perf_counter()
+        cfg.load_json(path)
+        bulk = time.perf_counter() - t0
+        cfg.close()
+
+        # per-leaf writes, one fsync each: capped, then extrapolated
+        cfg = ConfigX(persistent=True, storage_dir=os.path.join(tmpdir, "set"))
+        sample = list(leaves(data))
+        total = len(sample)
+        sample = sample[:2000]
+        t0 = time.perf_counter()
+        for key, value in sample:
+            cfg._tree.set(key, value)
+        per_leaf = (time.perf_counter() - t0) / len(sample) * total
+        cfg.close()
+
+        print(f"{mb:.1f} MB, {total} leaves")
+        print(f"  json.load only          {parse:8.2f} s")
+        print(f"  load_json (bulk)        {bulk:8.2f} s")
+        print(f"  set() per leaf (est.)   {per_leaf:8.2f} s")
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+ConfigX Benchmarks - bench_parse.py
+
+Per-query parse cost of ConfigXQL: the fast-path scanner, the full Lark
+parser, and ConfigXQLParser.parse (scanner with Lark fallback). Each query
+is parsed uncached; the statement cache would hide the difference.
+
+Usage:
+    python benchmarks/bench_parse.py [iterations]
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+
+import sys
+import time
+
+from configx.qlang.fastpath import scan
+from configx.qlang.parser import ConfigXQLParser, get_lark
+
+QUERIES = [
+    "app.ui.theme",
+    "app.ui.theme!",
+    'app.ui.theme="dark"',
+    "agents.a17.limits.max_retries=5",
+    "metrics.cpu.load=0.75",
+    "flags.beta=true",
+    "sessions.s42-",
+    "agents.a17!move=a18",   # not a fast-path form: always Lark
+]
+
+
+def per_query_us(parse, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        for q in QUERIES:
+            parse(q)
+    return (time.perf_counter() - t0) * 1e6 / (n * len(QUERIES))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    lark = get_lark()
+
+    rows = [
+        ("lark", lark.parse),
+        ("fast path (scan)", scan),
+        ("ConfigXQLParser.parse", ConfigXQLParser().parse),
+        ("ConfigXQLParser(fast_path=False)", ConfigXQLParser(fast_path=False).parse),
+    ]
+
+    base = None
+    for name, parse in rows:
+        us = per_query_us(parse, n)
+        base = base or us
+        print(f"{name:34} {us:8.2f} us/query   {base / us:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
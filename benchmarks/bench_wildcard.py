@@ -0,0 +1,75 @@
+"""
+ConfigX Benchmarks - bench_wildcard.py
+
+Wildcard matching over a large tree: `users` holds `n` users of 9 nodes
+each (1M nodes by default). Times the streaming select() for a [.] and a
+[..] pattern, the first match of a stream, and a persistent bulk update
+whose WAL entries are fsynced once.
+
+Usage:
+    python benchmarks/bench_wildcard.py [users]
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from configx.core.tree import ConfigTree
+from configx.storage.runtime import StorageRuntime
+
+
+def build(n: int) -> dict:
+    return {
+        "users": {
+            f"u{i}": {
+                "userId": i,
+                "active": i % 2 == 0,
+                "profile": {"name": f"user {i}", "age": 20 + i % 50, "tier": "free"},
+                "limits": {"rpm": 60},
+            }
+            for i in range(n)
+        }
+    }
+
+
+def timed(label: str, fn):
+    t0 = time.perf_counter()
+    result = fn()
+    print(f"{label:38} {(time.perf_counter() - t0) * 1000:10.1f} ms   {result}")
+    return result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 111_112
+
+    tree = ConfigTree()
+    t0 = time.perf_counter()
+    tree.load_dict(build(n))
+    print(f"built {n} users (~{n * 9:,} nodes) in {time.perf_counter() - t0:.1f} s\n")
+
+    timed("select users.[.].active", lambda: sum(1 for _ in tree.select("users.[.].active")))
+    timed("select [..].age", lambda: sum(1 for _ in tree.select("[..].age")))
+    timed("select users.[*]", lambda: sum(1 for _ in tree.select("users.[*]")))
+    timed("first match of [..].tier", lambda: next(tree.select("[..].tier"))[0])
+
+    # bulk update with the WAL on: one group commit for every write
+    updates = min(n, 10_000)
+    tmpdir = tempfile.mkdtemp()
+    try:
+        runtime = StorageRuntime(os.path.join(tmpdir, "snapshot.cx"), os.path.join(tmpdir, "wal.cx"))
+        small = ConfigTree(runtime=runtime)
+        runtime.start(small)
+        small.load_dict(build(updates))
+
+        timed(f"persistent set users.[.].active ({updates})",
+              lambda: small.set_matching("users.[.].active", True))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+configx.core.accounting
+
+Per-subtree memory accounting for ConfigTree.
+
+Every node carries the totals of its subtree in `Node.usage`
+([nodes, leaves, bytes]). The totals are built once when accounting is
+enabled and from then on adjusted incrementally: a set/delete/move only
+touches the counters of the nodes on its own path, so reading the usage of
+any subtree is O(1) and nothing is ever re-walked.
+
+Byte counts are estimates (object sizes as reported by sys.getsizeof plus a
+fixed per-node overhead), meant for comparing subtrees and enforcing a
+budget, not for exact heap accounting.
+
+Developed & Maintained by Aditya Gaur, 2025
+
+"""
+
+from __future__ import annotations
+import heapq
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .node import Node
+from .columnar import NumericColumn
+from .events import Change, TreeListener
+from .errors import ConfigMemoryBudgetError
+
+
+def _estimate_node_overhead() -> int:
+    node = Node(name="")
+    return (
+        sys.getsizeof(node)
+        + sys.getsizeof(node.__dict__)
+        + sys.getsizeof(node.metadata)
+        + sys.getsizeof(node.children)
+    )
+
+
+# fixed cost of one Node object with its empty metadata/children dicts
+NODE_BYTES = _estimate_node_overhead()
+
+# a packed column slot: 8-byte value plus its name/slot entries
+SLOT_BYTES = 8 + 2 * 8 + 64
+
+
+def leaf_bytes(name: str, value) -> int:
+    """Approximate bytes of a standalone node holding `value`."""
+    size = NODE_BYTES + sys.getsizeof(name)
+    if value is not None:
+        size += sys.getsizeof(value)
+    return size
+
+
+def _own_usage(name: str, value) -> List[int]:
+    return [1, 0 if value is None else 1, leaf_bytes(name, value)]
+
+
+class MemoryAccounting(TreeListener):
+    """
+    Keeps Node.usage current for a ConfigTree and enforces an optional budget.
+    """
+
+    def __init__(self, tree, budget: Optional[int] = None):
+        self.tree = tree
+        self.budget = budget
+        self._lock = threading.Lock()
+        self.rebuild()
+
+    # ------------------------------------------------------------------
+    # Totals
+    # ------------------------------------------------------------------
+
+    def rebuild(self):
+        """Count the whole tree once (used on enable and after a reset)."""
+        with self._lock:
+            self._count(self.tree.root)
+
+    def _count(self, node: Node) -> List[int]:
+        usage = _own_usage(node.name, node.value)
+        children = node.children
+
+        if isinstance(children, NumericColumn):
+            for name in children.names:
+                usage[0] += 1
+                usage[1] += 1
+                usage[2] += SLOT_BYTES + sys.getsizeof(name)
+            children = children.nodes
+
+        for child in list(children.values()):
+            sub = self._count(child)
+            usage[0] += sub[0]
+            usage[1] += sub[1]
+            usage[2] += sub[2]
+
+        node.usage = usage
+        return usage
+
+    def count(self, node: Node) -> List[int]:
+        """Count a detached subtree in place (e.g. one just loaded from disk)."""
+        return self._count(node)
+
+    def usage_of(self, node: Node) -> List[int]:
+        """Totals of `node`'s subtree (counted on demand for uncounted leaves)."""
+        if node.usage is not None:
+            return node.usage
+        if not node.children and node.value is not None:
+            # uncounted leaf: one that just left a packed column
+            return [1, 1, SLOT_BYTES + sys.getsizeof(node.name)]
+        return self._count(node)
+
+    @property
+    def total_bytes(self) -> int:
+        return self.tree.root.usage[2] if self.tree.root.usage else 0
+
+    # ------------------------------------------------------------------
+    # Budget
+    # ------------------------------------------------------------------
+
+    def admit(self, path: str, value, missing: int, current: Optional[Node] = None):
+        """
+        Raise ConfigMemoryBudgetError if writing `value` at `path`, creating
+        `missing` new nodes on the way, would exceed the budget. `current`
+        is the leaf being overwritten; its value is freed by the write.
+        """
+        if self.budget is None:
+            return
+
+        name = path.rsplit(".", 1)[-1]
+        needed = missing * NODE_BYTES + leaf_bytes(name, value)
+        if current is not None:
+            needed -= leaf_bytes(name, current.value)
+        if needed > 0 and self.total_bytes + needed > self.budget:
+            raise ConfigMemoryBudgetError(path, needed, self.budget)
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    def on_change(self, change: Change):
+        if change.op == "RESET":
+            self.rebuild()
+            return
+
+        with self._lock:
+            if change.op == "SET":
+                self._on_set(change)
+            elif change.op == "DELETE":
+                self._remove(change.path, change.node)
+            elif change.op == "MOVE":
+                self._remove(change.path, change.node)
+                self._rename(change.node, change.path, change.dst)
+                self._attach(change.dst, change.node)
+
+    def _path_nodes(self, parts: List[str]) -> List[Node]:
+        node = self.tree.root
+        out = [node]
+        for part in parts:
+            node = node.children.get(part)
+            if node is None:
+                break
+            out.append(node)
+        return out
+
+    @staticmethod
+    def _add(nodes: List[Node], delta: List[int]):
+        for node in nodes:
+            usage = node.usage
+            if usage is not None:
+                usage[0] += delta[0]
+                usage[1] += delta[1]
+                usage[2] += delta[2]
+
+    def _on_set(self, change: Change):
+        parts = change.path.split(".")
+        nodes = self._path_nodes(parts[:-1])
+        parent = nodes[-1]
+        name = parts[-1]
+
+        children = parent.children
+        if isinstance(children, NumericColumn) and name in children.slots:
+            leaf = None
+            if change.old is None:
+                delta = [1, 1, SLOT_BYTES + sys.getsizeof(name)]
+            else:
+                delta = [0, 0, 0]
+        else:
+            leaf = children.get(name)
+            after = _own_usage(name, change.value)
+            if leaf.usage is None:
+                # a brand new node, or one just promoted out of a column slot
+                before = [0, 0, 0] if change.old is None else self.usage_of(leaf)
+                delta = [a - b for a, b in zip(after, before)]
+                leaf.usage = after
+            else:
+                # only the node's own value changed; its subtree is untouched
+                before = _own_usage(name, change.old)
+                delta = [0, after[1] - before[1], after[2] - before[2]]
+                self._add([leaf], delta)
+
+        self._link(nodes, delta)
+
+    def _remove(self, path: str, node: Node):
+        parts = path.split(".")
+        totals = self.usage_of(node)
+        self._add(self._path_nodes(parts[:-1]), [-totals[0], -totals[1], -totals[2]])
+
+    def _rename(self, node: Node, src: str, dst: str):
+        if node.usage is None:
+            return
+        old_name, new_name = src.rsplit(".", 1)[-1], dst.rsplit(".", 1)[-1]
+        self._add([node], [0, 0, sys.getsizeof(new_name) - sys.getsizeof(old_name)])
+
+    def _attach(self, path: str, node: Node):
+        parts = path.split(".")
+        self._link(self._path_nodes(parts[:-1]), list(self.usage_of(node)))
+
+    def _link(self, nodes: List[Node], delta: List[int]):
+        """
+        Add `delta` (the totals of a new or grown child) to the path `nodes`.
+        Nodes without totals were created by this very write: they get the
+        totals of the chain below them instead.
+        """
+        first_new = next((i for i, n in enumerate(nodes) if n.usage is None), len(nodes))
+
+        for node in reversed(nodes[first_new:]):
+            own = _own_usage(node.name, node.value)
+            node.usage = [own[0] + delta[0], own[1] + delta[1], own[2] + delta[2]]
+            delta = list(node.usage)
+
+        self._add(nodes[:first_new], delta)
+
+    def recount(self, parts: List[str]):
+        """
+        Recount the node at `parts` after its children changed representation
+        (e.g. got packed into a column) and adjust its ancestors.
+        """
+        with self._lock:
+            nodes = self._path_nodes(parts)
+            node = nodes[-1]
+            before = list(node.usage) if node.usage else [0, 0, 0]
+            after = self._count(node)
+            self._add(nodes[:-1], [a - b for a, b in zip(after, before)])
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def heaviest(self, top: int = 10, depth: int = 2) -> List[Tuple[str, Dict[str, int]]]:
+        """
+        The `top` heaviest subtrees (by bytes) among the interior nodes at
+        most `depth` levels below the root.
+        """
+        candidates = []
+
+        def visit(node: Node, path: str, level: int):
+            for key, child in list(node.children.items()):
+                usage = self.usage_of(child)
+                if usage[0] <= 1:  # leaf; also keeps spilled subtrees on disk
+                    continue
+                child_path = f"{path}.{key}" if path else key
+                candidates.append((usage[2], child_path, child))
+                if level < depth:
+                    visit(child, child_path, level + 1)
+
+        visit(self.tree.root, "", 1)
+        best = heapq.nlargest(top, candidates, key=lambda c: c[0])
+        return [(path, _report(self.usage_of(node))) for _, path, node in best]
+
+
+def _report(usage: List[int]) -> Dict[str, int]:
+    return {"nodes": usage[0], "leaves": usage[1], "bytes": usage[2]}
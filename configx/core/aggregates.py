@@ -0,0 +1,253 @@
+"""
+configx.core.aggregates
+
+Materialized count/sum/min/max over the children of one node.
+
+A SubtreeAggregate takes one number per child of its node: the child's own
+value, or the value at `field` below it (products.*.price for
+path="products", field="price"). It listens to the tree, so set/delete/move
+and WAL replay keep it current:
+
+    count, sum    O(1), kept as running totals
+    min, max      O(1), ends of a sorted array updated with bisect
+
+The sum is kept exact: integers in one total, finite floats in another as
+integer multiples of 2**-1074 (the smallest float), so removing a huge value
+never leaves the rounding error of adding it behind. Reading it rounds once,
+like math.fsum() over the current values.
+
+Children without a numeric value at `field` are left out.
+
+Developed & Maintained by Aditya Gaur, 2025
+
+"""
+
+from __future__ import annotations
+from bisect import bisect_left, insort
+from collections import Counter
+import math
+import threading
+from typing import Any, Dict, List, Optional
+
+from .node import Node
+from .events import Change, TreeListener
+from .columnar import column_type
+
+
+AGGREGATES = ("count", "sum", "min", "max")
+
+# every finite float is a whole multiple of 2**-FLOAT_SCALE
+_FLOAT_SCALE = 1074
+_FLOAT_UNIT = 1 << _FLOAT_SCALE
+
+
+def _scaled(value: float) -> int:
+    """Finite `value` as an exact integer multiple of 2**-_FLOAT_SCALE."""
+    numerator, denominator = value.as_integer_ratio()
+    return numerator << (_FLOAT_SCALE + 1 - denominator.bit_length())
+
+
+def numeric_value(node: Node, field: List[str], visits: Optional[List[int]] = None) -> Any:
+    """
+    The number at the split relative path `field` below `node` (the node's
+    own value for an empty field), or None if there is no numeric leaf there.
+    Nodes walked below `node` are added to `visits` if given.
+    """
+    for part in field:
+        node = node.children.get(part)
+        if node is None:
+            return None
+        if visits is not None:
+            visits[0] += 1
+
+    if node.children or column_type(node.value) is None:
+        return None
+    return node.value
+
+
+class SubtreeAggregate(TreeListener):
+    """
+    Running count/sum/min/max of `field` over the children of `path`.
+    """
+
+    def __init__(self, tree, path: str, field: Optional[str] = None):
+        self.tree = tree
+        self.path = path
+        self.field = field
+        self._base = tree._split(path)
+        self._field = tree._split(field) if field else []
+
+        self._lock = threading.Lock()
+        self._values: Dict[str, Any] = {}
+        self._sorted: List[Any] = []
+
+        # exact running sum, see the module docstring: integer total, scaled
+        # float total, number of floats, and counts of inf/-inf/nan by repr
+        self._total = 0
+        self._float_total = 0
+        self._floats = 0
+        self._nonfinite: Counter = Counter()
+
+        self.rebuild()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def rebuild(self):
+        """Recompute from the tree (used on creation and after a reset)."""
+        with self._lock:
+            self._rebuild()
+
+    def _rebuild(self):
+        self._clear()
+
+        node = self.tree._walk(self.path)
+        if node is None:
+            return
+
+        for key, child in list(node.children.items()):
+            self._add(key, numeric_value(child, self._field))
+
+    def on_change(self, change: Change):
+        if change.op == "RESET":
+            self.rebuild()
+            return
+
+        with self._lock:
+            if change.op == "SET":
+                key = self._child_key(change.path, exact=True)
+                if key is not None:
+                    self._remove(key)
+                    self._add(key, change.value if column_type(change.value) else None)
+                else:
+                    # a set below the field turns a counted leaf into a branch
+                    key = self._child_key(change.path, below=True)
+                    if key is not None:
+                        self._remove(key)
+                        child = self.tree._walk(".".join(self._base + [key]))
+                        if child is not None:
+                            self._add(key, numeric_value(child, self._field))
+
+            elif change.op in ("DELETE", "MOVE"):
+                self._detach(change.path)
+
+                if change.op == "MOVE":
+                    self._attach(change.dst, change.node)
+
+    def _child_key(self, path: str, exact: bool = False, below: bool = False) -> Optional[str]:
+        """
+        The child of the aggregated node whose number `path` can change:
+        `path` is the child's field (exact=True), lies below the field
+        (below=True), or also a node on the way to it (neither). None if
+        `path` cannot affect the aggregate.
+        """
+        parts = path.split(".")
+        base = len(self._base)
+        if len(parts) <= base or parts[:base] != self._base:
+            return None
+
+        rest = parts[base + 1:]
+        if exact:
+            return parts[base] if rest == self._field else None
+        if below:
+            field = len(self._field)
+            return parts[base] if len(rest) > field and rest[:field] == self._field else None
+        return parts[base] if rest == self._field[:len(rest)] else None
+
+    def _covers(self, path: str) -> bool:
+        """True if `path` is the aggregated node or one of its ancestors."""
+        parts = path.split(".")
+        return len(parts) <= len(self._base) and self._base[:len(parts)] == parts
+
+    def _detach(self, path: str):
+        if self._covers(path):
+            self._clear()
+            return
+
+        key = self._child_key(path)
+        if key is not None:
+            self._remove(key)
+
+    def _attach(self, path: str, node: Node):
+        if self._covers(path):
+            self._rebuild()
+            return
+
+        key = self._child_key(path)
+        if key is not None:
+            # node sits at `path`, i.e. somewhere on the way to the field
+            depth = len(path.split(".")) - len(self._base) - 1
+            self._remove(key)
+            self._add(key, numeric_value(node, self._field[depth:]))
+
+    def _clear(self):
+        self._values.clear()
+        self._sorted = []
+        self._total = 0
+        self._float_total = 0
+        self._floats = 0
+        self._nonfinite.clear()
+
+    def _add(self, key: str, value):
+        if value is None:
+            return
+
+        self._values[key] = value
+        self._count(value, 1)
+        insort(self._sorted, value)
+
+    def _remove(self, key: str):
+        value = self._values.pop(key, None)
+        if value is None:
+            return
+
+        self._count(value, -1)
+        del self._sorted[bisect_left(self._sorted, value)]
+
+    def _count(self, value, sign: int):
+        """Add `value` to the running sum (sign=1) or take it out (sign=-1)."""
+        if isinstance(value, int):
+            self._total += sign * value
+            return
+
+        self._floats += sign
+        if math.isfinite(value):
+            self._float_total += sign * _scaled(value)
+        else:
+            self._nonfinite[repr(value)] += sign
+
+    def _sum(self):
+        if not self._floats:
+            return self._total
+
+        special = [float(name) for name, n in self._nonfinite.items() if n]
+        if special:
+            return sum(special)
+
+        # int / int is correctly rounded, so this rounds the exact sum once
+        exact = self._total * _FLOAT_UNIT + self._float_total
+        try:
+            return exact / _FLOAT_UNIT
+        except OverflowError:
+            return math.copysign(math.inf, exact)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def result(self, op: str) -> Any:
+        """Value of one of AGGREGATES; min/max are None when empty."""
+        with self._lock:
+            if op == "count":
+                return len(self._values)
+            if op == "sum":
+                return self._sum()
+            if op == "min":
+                return self._sorted[0] if self._sorted else None
+            if op == "max":
+                return self._sorted[-1] if self._sorted else None
+        raise ValueError(f"Unknown aggregate: {op}")
+
+    def __len__(self) -> int:
+        return len(self._values)
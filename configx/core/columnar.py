@@ -0,0 +1,322 @@
+"""
+configx.core.columnar
+
+Columnar children : a drop-in children map for nodes with many sibling
+INT or FLOAT leaves (metrics, scores, embedding dimensions ...).
+
+Instead of one Node object per leaf, NumericColumn keeps the leaf values in a
+single packed `array.array` keyed by child name. Any child that does not fit
+the column (other types, interior nodes, leaves carrying metadata) is kept as
+a regular Node next to it, so the map can hold anything a plain dict can.
+Reading a packed child materializes a short-lived leaf Node. Children are
+iterated in insertion order, packed or not, just like a plain dict.
+
+ConfigTree packs a parent automatically once it holds enough same-typed
+numeric leaves; get/set/delete semantics do not change.
+
+Developed & Maintained by Aditya Gaur, 2025
+
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, Iterator, List, Optional
+
+from .node import Node
+
+# numpy is optional (array.array is used without it) and only imported by
+# the first aggregate, so importing configx does not pay for it
+_np: Any = None
+
+
+def _numpy():
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = False
+    return _np or None
+
+
+# minimum number of same-typed numeric leaves before a parent gets packed
+COLUMN_MIN = 64
+
+_TYPECODES = {"INT": "q", "FLOAT": "d"}
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+
+# epoch of materialized leaves: never matches a tree epoch, so a writer
+# always has to go through NumericColumn.promote() to get a real node
+_CELL_EPOCH = -1
+
+
+def column_type(value) -> Optional[str]:
+    """
+    Return the column type ("INT"/"FLOAT") a value can be packed as, or None.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return "INT" if _INT64_MIN <= value <= _INT64_MAX else None
+    if isinstance(value, float):
+        return "FLOAT"
+    return None
+
+
+def _packable(node: Node) -> Optional[str]:
+    if node.children or node.metadata:
+        return None
+    return column_type(node.value)
+
+
+class NumericColumn:
+    """
+    Children map storing same-typed numeric leaves in one packed array.
+    """
+
+    def __init__(self, type_: str):
+        self.type: str = type_
+        self.values: array = array(_TYPECODES[type_])
+        self.versions: array = array("q")
+        self.names: List[str] = []
+        self.slots: Dict[str, int] = {}
+
+        # children that cannot live in the column
+        self.nodes: Dict[str, Node] = {}
+
+        # every child name, packed or not, in insertion order: packed slots
+        # are reused on removal, the iteration order is not
+        self.order: Dict[str, None] = {}
+
+        # odd while slots are being moved, bumped twice per move, so
+        # lock-free readers can detect a slot that changed under them
+        self._moves = 0
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def pack(cls, children, minimum: int = COLUMN_MIN) -> Optional["NumericColumn"]:
+        """
+        Build a column from a plain children dict, or return None when it
+        holds fewer than `minimum` leaves of the dominant numeric type.
+        """
+        counts = {"INT": 0, "FLOAT": 0}
+        for child in children.values():
+            kind = _packable(child)
+            if kind:
+                counts[kind] += 1
+
+        kind = max(counts, key=counts.get)
+        if counts[kind] < minimum:
+            return None
+
+        column = cls(kind)
+        for key, child in children.items():
+            if _packable(child) == kind:
+                column._append(key, child.value, child.version)
+            else:
+                column.nodes[key] = child
+                column.order[key] = None
+        return column
+
+    def _append(self, key: str, value, version: int = 1):
+        # the slot is published last, once its value can be read
+        self.names.append(key)
+        self.values.append(value)
+        self.versions.append(version)
+        self.slots[key] = len(self.names) - 1
+        self.order[key] = None
+
+    # ------------------------------------------------------------------
+    # Packed leaf access
+    # ------------------------------------------------------------------
+
+    def accepts(self, key: str, value) -> bool:
+        """
+        True if `value` can be written to the packed slot of `key` in place.
+        """
+        return key in self.slots and column_type(value) == self.type
+
+    def assign(self, key: str, value, version: int):
+        """
+        Overwrite the packed value of `key` and set its version; the caller
+        checked accepts().
+        """
+        idx = self.slots[key]
+        self.values[idx] = value
+        self.versions[idx] = version
+
+    def promote(self, key: str, epoch: int) -> Node:
+        """
+        Move a packed child out of the column into a regular, writable Node.
+        """
+        idx = self.slots[key]
+        node = Node(
+            name=key,
+            value=self.values[idx],
+            type=self.type,
+            version=self.versions[idx],
+            epoch=epoch,
+        )
+
+        # loose first, so a concurrent reader finds the child in one of the two
+        self.nodes[key] = node
+        self._remove_slot(key)
+        return node
+
+    def _remove_slot(self, key: str):
+        # swap-remove keeps deletion O(1); only the storage slot moves,
+        # `order` is untouched
+        self._moves += 1
+        try:
+            idx = self.slots.pop(key)
+            value = self.values[idx]
+            version = self.versions[idx]
+            last = len(self.names) - 1
+
+            if idx != last:
+                moved = self.names[last]
+                self.names[idx] = moved
+                self.values[idx] = self.values[last]
+                self.versions[idx] = self.versions[last]
+                self.slots[moved] = idx
+
+            self.names.pop()
+            self.values.pop()
+            self.versions.pop()
+        finally:
+            self._moves += 1
+        return value, version
+
+    def _cell(self, key: str) -> Optional[Node]:
+        """
+        Leaf Node of a packed child, or None if `key` is not packed.
+        Readers take no lock: a read that overlapped a slot move is retried.
+        """
+        while True:
+            moves = self._moves
+            idx = self.slots.get(key)
+            if idx is None:
+                return None
+            try:
+                value = self.values[idx]
+                version = self.versions[idx]
+            except IndexError:
+                continue
+
+            if moves == self._moves and not moves & 1:
+                return Node(name=key, value=value, type=self.type, version=version, epoch=_CELL_EPOCH)
+
+    # ------------------------------------------------------------------
+    # Aggregates over the packed values
+    # ------------------------------------------------------------------
+
+    def _vector(self):
+        np = _numpy()
+        if np is None:
+            return None
+        return np.frombuffer(self.values, dtype=np.int64 if self.type == "INT" else np.float64)
+
+    def packed_sum(self):
+        vector = self._vector()
+        total = vector.sum() if vector is not None else sum(self.values)
+        return total.item() if hasattr(total, "item") else total
+
+    def packed_min(self):
+        if not self.values:
+            return None
+        vector = self._vector()
+        result = vector.min() if vector is not None else min(self.values)
+        return result.item() if hasattr(result, "item") else result
+
+    def packed_max(self):
+        if not self.values:
+            return None
+        vector = self._vector()
+        result = vector.max() if vector is not None else max(self.values)
+        return result.item() if hasattr(result, "item") else result
+
+    # ------------------------------------------------------------------
+    # Mapping protocol (what ConfigTree/Node expect of `children`)
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __contains__(self, key) -> bool:
+        return key in self.order
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self.order)
+
+    def keys(self):
+        return list(self)
+
+    def __getitem__(self, key: str) -> Node:
+        cell = self._cell(key)
+        if cell is not None:
+            return cell
+        return self.nodes[key]
+
+    def get(self, key: str, default=None):
+        cell = self._cell(key)
+        if cell is not None:
+            return cell
+        return self.nodes.get(key, default)
+
+    def __setitem__(self, key: str, node: Node):
+        kind = _packable(node)
+
+        if key in self.slots:
+            if kind == self.type:
+                idx = self.slots[key]
+                self.values[idx] = node.value
+                self.versions[idx] = node.version
+                return
+            self.nodes[key] = node
+            self._remove_slot(key)
+            return
+
+        if key not in self.nodes and kind == self.type:
+            self._append(key, node.value, node.version)
+            return
+
+        self.nodes[key] = node
+        self.order[key] = None
+
+    def pop(self, key: str, *default):
+        if key in self.slots:
+            value, version = self._remove_slot(key)
+            del self.order[key]
+            return Node(name=key, value=value, type=self.type, version=version)
+
+        node = self.nodes.pop(key, *default)
+        self.order.pop(key, None)
+        return node
+
+    def items(self):
+        found = []
+        for key in self:
+            node = self.get(key)
+            if node is not None:
+                found.append((key, node))
+        return found
+
+    def values(self):
+        return [node for _, node in self.items()]
+
+    def copy(self) -> "NumericColumn":
+        clone = NumericColumn(self.type)
+        clone.values = array(self.values.typecode, self.values)
+        clone.versions = array("q", self.versions)
+        clone.names = list(self.names)
+        clone.slots = dict(self.slots)
+        clone.nodes = dict(self.nodes)
+        clone.order = dict(self.order)
+        return clone
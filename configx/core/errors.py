@@ -71,6 +71,36 @@ class ConfigTypeMismatchError(ConfigValueError):
 
 
 
+# Resource errors
+
+class ConfigMemoryBudgetError(ConfigXError):
+    """Raised when a write would take the tree past its memory budget."""
+    def __init__(self, path: str, needed: int, budget: int):
+        super().__init__(
+            f'Writing "{path}" needs ~{needed} bytes, which exceeds the memory budget of {budget} bytes.'
+        )
+        self.path = path
+        self.needed = needed
+        self.budget = budget
+
+
+
+# Query errors
+
+class ConfigQueryError(ConfigXError):
+    """Raised when a ConfigXQL query is valid syntax but cannot be executed."""
+    pass
+
+
+
+# Transaction errors
+
+class ConfigTransactionError(ConfigXError):
+    """Raised when a transaction is used after it was committed or rolled back."""
+    pass
+
+
+
 # Import/export errors
 
 class ConfigImportError(ConfigXError):
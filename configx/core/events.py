@@ -0,0 +1,55 @@
+"""
+configx.core.events
+
+Change events emitted by ConfigTree after every applied mutation.
+Listeners (watchers, indexes, accounting ...) register with
+ConfigTree.add_listener() and receive one Change per mutation.
+
+Developed & Maintained by Aditya Gaur, 2025
+
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .node import Node
+
+
+@dataclass(frozen=True)
+class Change:
+    # "SET" | "DELETE" | "MOVE" | "RESET" (whole tree replaced)
+    op: str
+    path: str
+
+    # SET: the new value and the value it replaced (None for a new leaf)
+    value: Any = None
+    old: Any = None
+
+    # DELETE: the detached node, MOVE: the moved node
+    node: Optional[Node] = None
+
+    # MOVE: destination path
+    dst: Optional[str] = None
+
+
+class TreeListener:
+    """
+    Base class for ConfigTree listeners.
+    """
+
+    def on_change(self, change: Change):
+        """Called after every mutation, while the writer still holds its lock."""
+        pass
+
+    def flush(self):
+        """Called when the outermost ConfigTree.batch() of a thread ends."""
+        pass
+
+    def discard(self):
+        """
+        Called instead of RESET when ConfigTree.commit() fails and restores
+        the tree, still inside its batch: anything built from the rolled-back
+        changes is rebuilt, anything held back for flush() is dropped.
+        """
+        self.on_change(Change("RESET", ""))
@@ -0,0 +1,257 @@
+"""
+configx.core.index
+
+Secondary value indexes for ConfigTree.
+
+A ValueIndex maps leaf values to the set of paths holding them, for every
+leaf whose key name (e.g. `theme`) or full path (e.g. `agents.*.theme`,
+`users.**.score`) it was declared for. It listens to the tree, so set/delete/
+move and WAL replay keep it current. Comparable values (numbers, strings) are
+also kept in a sorted array, so range lookups are a bisect instead of a scan.
+
+Developed & Maintained by Aditya Gaur, 2025
+
+"""
+
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .node import Node
+from .events import Change, TreeListener
+
+
+OPERATORS = ("==", "!=", ">=", "<=", ">", "<")
+
+
+def _match_pattern(pattern: List[str], parts: List[str]) -> bool:
+    """
+    Match a split path against a split pattern with `*` / `**` segments.
+    """
+    if not pattern:
+        return not parts
+
+    head = pattern[0]
+    if head == "**":
+        return any(_match_pattern(pattern[1:], parts[i:]) for i in range(len(parts) + 1))
+
+    if not parts:
+        return False
+
+    if head == "*" or head == parts[0]:
+        return _match_pattern(pattern[1:], parts[1:])
+
+    return False
+
+
+def _value_key(value) -> Optional[Tuple[str, Any]]:
+    """
+    Hashable index key of a value; type-tagged so 1, 1.0 and True differ.
+    Returns None for values that cannot be indexed.
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return (Node.infer_type(value), value)
+
+
+def _sort_key(key: Tuple[str, Any]) -> Optional[Tuple[int, Any]]:
+    kind, value = key
+    if kind in ("INT", "FLOAT"):
+        return (0, value)
+    if kind == "STR":
+        return (1, value)
+    return None
+
+
+def iter_leaves(node: Node, path: str) -> Iterator[Tuple[str, Node]]:
+    """
+    Yield (path, leaf) for every leaf at or below `node` (located at `path`).
+    """
+    if not node.children:
+        yield path, node
+        return
+
+    for key, child in list(node.children.items()):
+        yield from iter_leaves(child, f"{path}.{key}" if path else key)
+
+
+class ValueIndex(TreeListener):
+    """
+    value -> paths index over the leaves selected by `key` or `pattern`.
+    """
+
+    def __init__(self, tree, key: Optional[str] = None, pattern: Optional[str] = None):
+        if (key is None) == (pattern is None):
+            raise ValueError("Declare an index with exactly one of key= or pattern=.")
+
+        self.tree = tree
+        self.key = key
+        self.pattern = pattern
+        self._pattern_parts = tree._split(pattern) if pattern else None
+
+        self._lock = threading.Lock()
+        self._by_value: Dict[Tuple[str, Any], Set[str]] = {}
+        self._by_path: Dict[str, Tuple[str, Any]] = {}
+        self._sorted: List[Tuple[int, Any]] = []
+
+        self.rebuild()
+
+    # ------------------------------------------------------------------
+    # Coverage
+    # ------------------------------------------------------------------
+
+    def selects(self, path: str) -> bool:
+        """True if the leaf at `path` belongs in this index."""
+        parts = path.split(".")
+        if self.key is not None:
+            return parts[-1] == self.key
+        return _match_pattern(self._pattern_parts, parts)
+
+    def covers(self, key: str, under: Optional[str] = None) -> bool:
+        """
+        True if a search for `key` below `under` can be answered from the
+        index alone:
+
+            key index           every leaf named `key`
+            prefix.**.key       searches at or below `prefix`
+            agents.*.score      searches at or above the leaf level of the
+                                pattern (root, agents, agents.<id>); the
+                                pattern is taken to name every `score` leaf
+                                in that part of the tree
+        """
+        if self.key is not None:
+            return self.key == key
+
+        pat = self._pattern_parts
+        if pat[-1] != key:
+            return False
+
+        base = under.split(".") if under else []
+
+        if len(pat) >= 2 and pat[-2] == "**":
+            prefix = pat[:-2]
+            return len(prefix) <= len(base) and _match_pattern(prefix, base[:len(prefix)])
+
+        if "**" in pat:
+            return False
+        return len(base) < len(pat) and _match_pattern(pat[:len(base)], base)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def rebuild(self):
+        """Re-index the whole tree (used on creation and after a reset)."""
+        with self._lock:
+            self._by_value.clear()
+            self._by_path.clear()
+            self._sorted = []
+
+            for path, leaf in iter_leaves(self.tree.root, ""):
+                if path and self.selects(path):
+                    self._add(path, leaf.value)
+
+    def on_change(self, change: Change):
+        if change.op == "RESET":
+            self.rebuild()
+            return
+
+        with self._lock:
+            if change.op == "SET":
+                if self.selects(change.path):
+                    self._remove(change.path)
+                    self._add(change.path, change.value)
+            elif change.op == "DELETE":
+                self._remove_subtree(change.path, change.node)
+            elif change.op == "MOVE":
+                self._remove_subtree(change.path, change.node)
+                for path, leaf in iter_leaves(change.node, change.dst):
+                    if self.selects(path):
+                        self._add(path, leaf.value)
+
+    def _remove_subtree(self, path: str, node: Node):
+        for leaf_path, _ in iter_leaves(node, path):
+            self._remove(leaf_path)
+
+    def _add(self, path: str, value):
+        key = _value_key(value)
+        if key is None or value is None:
+            return
+
+        bucket = self._by_value.get(key)
+        if bucket is None:
+            bucket = self._by_value[key] = set()
+            sort_key = _sort_key(key)
+            if sort_key is not None:
+                insort(self._sorted, sort_key)
+
+        bucket.add(path)
+        self._by_path[path] = key
+
+    def _remove(self, path: str):
+        key = self._by_path.pop(path, None)
+        if key is None:
+            return
+
+        bucket = self._by_value[key]
+        bucket.discard(path)
+        if not bucket:
+            del self._by_value[key]
+            sort_key = _sort_key(key)
+            if sort_key is not None:
+                idx = bisect_left(self._sorted, sort_key)
+                if idx < len(self._sorted) and self._sorted[idx] == sort_key:
+                    del self._sorted[idx]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def lookup(self, op: str, value) -> Set[str]:
+        """
+        Paths whose value satisfies `<leaf> op value`.
+        """
+        with self._lock:
+            if op == "==":
+                key = _value_key(value)
+                if key is None:
+                    return set()
+                found = set(self._by_value.get(key, ()))
+                # numbers compare by value: 5 == 5.0
+                if key[0] in ("INT", "FLOAT"):
+                    other = "FLOAT" if key[0] == "INT" else "INT"
+                    found |= self._by_value.get((other, value), set())
+                return found
+
+            if op == "!=":
+                key = _value_key(value)
+                return {p for p, k in self._by_path.items() if k != key}
+
+            sort_key = _sort_key(_value_key(value) or ("JSON", None))
+            if sort_key is None:
+                return set()
+
+            keys = self._sorted
+            if op == ">":
+                lo, hi = bisect_right(keys, sort_key), bisect_left(keys, (sort_key[0] + 1,))
+            elif op == ">=":
+                lo, hi = bisect_left(keys, sort_key), bisect_left(keys, (sort_key[0] + 1,))
+            elif op == "<":
+                lo, hi = bisect_left(keys, (sort_key[0],)), bisect_left(keys, sort_key)
+            elif op == "<=":
+                lo, hi = bisect_left(keys, (sort_key[0],)), bisect_right(keys, sort_key)
+            else:
+                raise ValueError(f"Unknown operator: {op}")
+
+            found: Set[str] = set()
+            for rank, v in keys[lo:hi]:
+                found |= self._by_value.get(("STR", v) if rank else ("INT", v), set())
+                if rank == 0:
+                    found |= self._by_value.get(("FLOAT", v), set())
+            return found
+
+    def __len__(self) -> int:
+        return len(self._by_path)
@@ -18,7 +18,7 @@ Developed & Maintained by Aditya Gaur, 2025
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 @dataclass
 class Node:
@@ -28,6 +28,18 @@ class Node:
     metadata: Dict[str, Any] = field(default_factory=dict)
     children: Dict[str, "Node"] = field(default_factory=dict)
 
+    # Tree revision of the last assignment (0 = never assigned); revisions
+    # never repeat within a tree. Used by ConfigTree.compare_and_set().
+    version: int = field(default=0, compare=False)
+
+    # Structural-sharing ownership tag. A ConfigTree may mutate a node in place
+    # only while the node's epoch matches the tree's current write epoch.
+    epoch: int = field(default=0, repr=False, compare=False)
+
+    # Subtree totals [nodes, leaves, bytes] kept by MemoryAccounting;
+    # None when accounting is off or the node has not been counted yet.
+    usage: Optional[List[int]] = field(default=None, repr=False, compare=False)
+
     def is_leaf(self) -> bool:
         """
         is_leaf :
@@ -37,6 +49,27 @@ class Node:
         :rtype: bool
         """
         return len(self.children) == 0
+
+    def copy(self, epoch: int = 0) -> "Node":
+        """
+        copy :
+        Shallow copy of this node. The children map is copied, the child nodes
+        themselves are shared with the original.
+
+        :param epoch: Write epoch that will own the copy
+        :return: A new node with the same name, value, type and children
+        :rtype: Node
+        """
+        return Node(
+            name=self.name,
+            value=self.value,
+            type=self.type,
+            metadata=dict(self.metadata),
+            children=self.children.copy(),
+            version=self.version,
+            epoch=epoch,
+            usage=list(self.usage) if self.usage is not None else None,
+        )
     
     def to_primitive(self):
         """
@@ -45,7 +78,9 @@ class Node:
         """
 
         if self.children:
-            return {k: v.to_primitive() for k, v in self.children.items()}
+            # list() takes the items in one step, so a concurrent writer
+            # adding a child cannot break the iteration
+            return {k: v.to_primitive() for k, v in list(self.children.items())}
 
         # leaf with value -> return that
         if self.value is not None:
@@ -76,6 +111,7 @@ class Node:
         else:
             node.value = data
             node.type = Node.infer_type(data)
+            node.version = 1
 
         return node
     
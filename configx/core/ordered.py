@@ -0,0 +1,110 @@
+"""
+configx.core.ordered
+
+Ordered children index : a drop-in children map for nodes with many children.
+SortedChildren behaves exactly like the plain dict used for Node.children and
+additionally keeps its keys in a sorted array, maintained with bisect on every
+insert and delete. ConfigTree.scan() uses it for prefix and range scans
+without sorting the children on every call.
+
+Developed & Maintained by Aditya Gaur, 2025
+
+"""
+
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterator, List, Optional
+
+
+_MISSING = object()
+
+
+class SortedChildren(dict):
+    """
+    dict of child nodes with a sorted key array alongside it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sorted_keys: List[str] = sorted(super().keys())
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            insort(self.sorted_keys, key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._forget(key)
+
+    def pop(self, key, default=_MISSING):
+        if key in self:
+            value = super().pop(key)
+            self._forget(key)
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._forget(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        super().clear()
+        self.sorted_keys = []
+
+    def copy(self) -> "SortedChildren":
+        clone = SortedChildren()
+        dict.update(clone, self)
+        clone.sorted_keys = list(self.sorted_keys)
+        return clone
+
+    def _forget(self, key):
+        idx = bisect_left(self.sorted_keys, key)
+        if idx < len(self.sorted_keys) and self.sorted_keys[idx] == key:
+            del self.sorted_keys[idx]
+
+    def irange(
+        self,
+        prefix: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Yield keys in sorted order, restricted to `prefix` and to the
+        half-open range [start, end).
+
+        Every step re-bisects from the last key returned, so the iterator
+        stays valid while children are inserted or deleted concurrently.
+        """
+        keys = self.sorted_keys
+        lower = start
+        if prefix is not None and (lower is None or lower < prefix):
+            lower = prefix
+
+        idx = bisect_left(keys, lower) if lower is not None else 0
+
+        while True:
+            keys = self.sorted_keys
+            if idx >= len(keys):
+                return
+
+            key = keys[idx]
+            if end is not None and key >= end:
+                return
+            if prefix is not None and not key.startswith(prefix):
+                return
+
+            yield key
+            idx = bisect_right(self.sorted_keys, key)
@@ -0,0 +1,302 @@
+"""
+configx.core.textindex
+
+Inverted token index for keyword search.
+
+Every leaf is indexed under the tokens of its key name (`lastObservation` ->
+lastobservation, last, observation) and, for STR leaves, of its value.
+Queries are whitespace-separated terms that must all match (AND); a term
+ending in `*` matches every token with that prefix. Results are ranked by
+tf-idf.
+
+The index is bounded: once it holds more than `max_postings` postings, the
+least selective tokens (those on the most leaves) are dropped. Queries that
+use a dropped token verify candidates against the tree instead, so results
+stay exact; only speed degrades.
+
+Developed & Maintained by Aditya Gaur, 2025
+
+"""
+
+from __future__ import annotations
+from bisect import bisect_left, insort
+from collections import Counter
+import json
+import math
+import os
+import re
+import threading
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .events import Change, TreeListener
+from .index import iter_leaves
+
+
+_WORD = re.compile(r"[a-z0-9]+")
+_CAMEL = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|[0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens of free text."""
+    return _WORD.findall(text.lower())
+
+
+def leaf_tokens(path: str, value) -> Counter:
+    """Token counts of a leaf: its key name (plus camelCase parts) and STR value."""
+    key = path.rsplit(".", 1)[-1]
+    tokens = Counter(tokenize(key))
+    for part in _CAMEL.findall(key):
+        part = part.lower()
+        if part not in tokens:
+            tokens[part] += 1
+
+    if isinstance(value, str):
+        tokens.update(tokenize(value))
+    return tokens
+
+
+class TokenIndex(TreeListener):
+    """
+    token -> {path: term frequency} index over the leaves of a ConfigTree.
+    """
+
+    def __init__(self, tree, max_postings: Optional[int] = None, persist: bool = False):
+        self.tree = tree
+        self.max_postings = max_postings
+
+        # saved next to the snapshot on checkpoint when True
+        self.persist = persist
+
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._docs: Dict[str, Tuple[str, ...]] = {}
+        self._vocab: List[str] = []
+        self._dropped: Set[str] = set()
+        self._size = 0
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def rebuild(self):
+        """Re-index every leaf of the tree."""
+        with self._lock:
+            self._postings.clear()
+            self._docs.clear()
+            self._vocab = []
+            self._dropped = set()
+            self._size = 0
+
+            for path, leaf in iter_leaves(self.tree.root, ""):
+                if path:
+                    self._add(path, leaf.value)
+            self._enforce_budget()
+
+    def on_change(self, change: Change):
+        if change.op == "RESET":
+            self.rebuild()
+            return
+
+        with self._lock:
+            if change.op == "SET":
+                self._remove(change.path)
+                self._add(change.path, change.value)
+            else:
+                for path, _ in iter_leaves(change.node, change.path):
+                    self._remove(path)
+                if change.op == "MOVE":
+                    for path, leaf in iter_leaves(change.node, change.dst):
+                        self._add(path, leaf.value)
+            self._enforce_budget()
+
+    def _add(self, path: str, value):
+        tokens = leaf_tokens(path, value)
+        kept = []
+        for token, tf in tokens.items():
+            if token in self._dropped:
+                continue
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                insort(self._vocab, token)
+            postings[path] = tf
+            kept.append(token)
+
+        self._docs[path] = tuple(kept)
+        self._size += len(kept)
+
+    def _remove(self, path: str):
+        tokens = self._docs.pop(path, None)
+        if tokens is None:
+            return
+
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(path, None)
+            if not postings:
+                self._forget(token)
+        self._size -= len(tokens)
+
+    def _forget(self, token: str):
+        del self._postings[token]
+        idx = bisect_left(self._vocab, token)
+        if idx < len(self._vocab) and self._vocab[idx] == token:
+            del self._vocab[idx]
+
+    def _enforce_budget(self):
+        if self.max_postings is None or self._size <= self.max_postings:
+            return
+
+        # drop the least selective tokens first, down to 90% of the budget
+        # so the next few inserts do not trigger another pass
+        target = int(self.max_postings * 0.9)
+        for token in sorted(self._postings, key=lambda t: len(self._postings[t]), reverse=True):
+            if self._size <= target:
+                break
+            for path in self._postings[token]:
+                self._docs[path] = tuple(t for t in self._docs[path] if t != token)
+            self._size -= len(self._postings[token])
+            self._forget(token)
+            self._dropped.add(token)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _expand(self, term: str) -> List[str]:
+        if not term.endswith("*"):
+            return [term] if term in self._postings else []
+
+        prefix = term[:-1]
+        idx = bisect_left(self._vocab, prefix)
+        out = []
+        while idx < len(self._vocab) and self._vocab[idx].startswith(prefix):
+            out.append(self._vocab[idx])
+            idx += 1
+        return out
+
+    def _is_dropped(self, term: str) -> bool:
+        if term.endswith("*"):
+            prefix = term[:-1]
+            return any(t.startswith(prefix) for t in self._dropped)
+        return term in self._dropped
+
+    def search(self, query: str, under: Optional[str] = None, limit: Optional[int] = None) -> List[str]:
+        """
+        Paths of the leaves matching every term of `query`, best first.
+        """
+        terms = [t.lower() for t in query.split() if t.strip("*")]
+        if not terms:
+            return []
+
+        with self._lock:
+            n_docs = max(len(self._docs), 1)
+            scores: Optional[Dict[str, float]] = None
+            unverified: List[str] = []
+
+            for term in terms:
+                if self._is_dropped(term):
+                    unverified.append(term)
+                    continue
+
+                term_scores: Dict[str, float] = {}
+                for token in self._expand(term):
+                    postings = self._postings[token]
+                    idf = math.log(1 + n_docs / len(postings))
+                    for path, tf in postings.items():
+                        term_scores[path] = term_scores.get(path, 0.0) + tf * idf
+
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {p: s + term_scores[p] for p, s in scores.items() if p in term_scores}
+
+                if not scores:
+                    return []
+
+        if scores is None:
+            # every term was dropped from the index: scan the candidates
+            candidates = self._scan(under)
+            scores = {p: 0.0 for p in candidates}
+
+        if under is not None:
+            prefix = under + "."
+            scores = {p: s for p, s in scores.items() if p.startswith(prefix)}
+
+        if unverified:
+            scores = {p: s for p, s in scores.items() if self._verify(p, unverified)}
+
+        ranked = sorted(scores, key=lambda p: (-scores[p], p))
+        return ranked[:limit] if limit is not None else ranked
+
+    def _scan(self, under: Optional[str]) -> Iterator[str]:
+        node = self.tree.root if under is None else self.tree._walk(under)
+        if node is None:
+            return iter(())
+        return (p for p, _ in iter_leaves(node, under or "") if p)
+
+    def _verify(self, path: str, terms: List[str]) -> bool:
+        node = self.tree._walk(path)
+        if node is None:
+            return False
+        tokens = leaf_tokens(path, node.value)
+        for term in terms:
+            if term.endswith("*"):
+                if not any(t.startswith(term[:-1]) for t in tokens):
+                    return False
+            elif term not in tokens:
+                return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, file_path: str, stamp=None):
+        """
+        Write the index to `file_path`. `stamp` identifies the snapshot the
+        index belongs to; load() refuses files with a different stamp.
+        """
+        with self._lock:
+            data = {
+                "stamp": stamp,
+                "max_postings": self.max_postings,
+                "postings": self._postings,
+                "dropped": sorted(self._dropped),
+            }
+            tmp = file_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, file_path)
+
+    def load(self, file_path: str, stamp=None) -> bool:
+        """
+        Load an index written by save(). Returns False (leaving the index
+        untouched) if the file is missing or belongs to another snapshot.
+        """
+        if not os.path.exists(file_path):
+            return False
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("stamp") != stamp:
+            return False
+
+        with self._lock:
+            self._postings = {t: dict(p) for t, p in data["postings"].items()}
+            self._dropped = set(data["dropped"])
+            self._vocab = sorted(self._postings)
+
+            docs: Dict[str, List[str]] = {}
+            for token, postings in self._postings.items():
+                for path in postings:
+                    docs.setdefault(path, []).append(token)
+            self._docs = {p: tuple(t) for p, t in docs.items()}
+            self._size = sum(len(t) for t in self._docs.values())
+        return True
+
+    def __len__(self) -> int:
+        return len(self._docs)
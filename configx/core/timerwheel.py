@@ -0,0 +1,168 @@
+"""
+configx.core.timerwheel
+
+Hierarchical timer wheel used to expire keys with a TTL.
+
+Level 0 has `slots` buckets of one tick each; every higher level has the
+same number of buckets, each covering a whole turn of the level below.
+A deadline is filed at the lowest level whose span can hold it, and moves
+down a level whenever the wheel reaches its bucket. Advancing the clock
+therefore only touches the buckets that come due, and the keys inside
+them: the cost is proportional to what is actually expiring, not to the
+number of keys with a TTL.
+
+Cancelling or rescheduling is lazy: the current deadline of every key is
+kept in a dict, and bucket entries that no longer match it are skipped.
+
+Developed & Maintained by Aditya Gaur, 2025
+
+"""
+
+from __future__ import annotations
+import math
+from typing import Dict, Hashable, List, Set
+
+
+class TimerWheel:
+    """
+    Tracks deadlines (absolute times, e.g. time.time()) for hashable keys.
+    advance(now) returns the keys whose deadline has passed.
+    """
+
+    def __init__(self, now: float, tick: float = 0.1, slots: int = 64, levels: int = 4):
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+
+        self._wheels: List[List[Set[Hashable]]] = [
+            [set() for _ in range(slots)] for _ in range(levels)
+        ]
+
+        # deadlines beyond the span of the top level
+        self._overflow: Set[Hashable] = set()
+
+        # deadlines that were already in the past when scheduled
+        self._ready: Set[Hashable] = set()
+
+        # current deadline (in ticks) of every scheduled key
+        self._deadlines: Dict[Hashable, int] = {}
+
+        # last tick processed
+        self._current = int(now // tick)
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key) -> bool:
+        return key in self._deadlines
+
+    def keys(self) -> List[Hashable]:
+        return list(self._deadlines)
+
+    def deadline(self, key) -> float:
+        """Deadline of `key` rounded up to the wheel's tick."""
+        return self._deadlines[key] * self.tick
+
+    def copy(self) -> "TimerWheel":
+        """Independent wheel with the same schedule (O(scheduled keys))."""
+        clone = TimerWheel.__new__(TimerWheel)
+        clone.tick, clone.slots, clone.levels = self.tick, self.slots, self.levels
+        clone._wheels = [[set(bucket) for bucket in wheel] for wheel in self._wheels]
+        clone._overflow = set(self._overflow)
+        clone._ready = set(self._ready)
+        clone._deadlines = dict(self._deadlines)
+        clone._current = self._current
+        return clone
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def schedule(self, key, when: float):
+        """Expire `key` at time `when` (replaces any earlier schedule)."""
+        due = math.ceil(when / self.tick)
+        self._deadlines[key] = due
+
+        # already passed: the bucket is behind the clock, return it next advance
+        if due <= self._current:
+            self._ready.add(key)
+        else:
+            self._place(key, due)
+
+    def cancel(self, key) -> bool:
+        return self._deadlines.pop(key, None) is not None
+
+    def _place(self, key, due: int):
+        delta = due - self._current
+        span = 1
+        for level in range(self.levels):
+            if delta < span * self.slots:
+                self._wheels[level][(due // span) % self.slots].add(key)
+                return
+            span *= self.slots
+        self._overflow.add(key)
+
+    # ------------------------------------------------------------------
+    # Expiry
+    # ------------------------------------------------------------------
+
+    def due(self, now: float) -> bool:
+        """True if advance(now) would process at least one tick."""
+        return bool(self._ready) or (
+            bool(self._deadlines) and int(now // self.tick) > self._current
+        )
+
+    def advance(self, now: float) -> List[Hashable]:
+        """Move the clock to `now` and return (and forget) every expired key."""
+        target = int(now // self.tick)
+        expired: List[Hashable] = []
+
+        if self._ready:
+            ready, self._ready = self._ready, set()
+            for key in ready:
+                if self._deadlines.get(key, self._current + 1) <= self._current:
+                    del self._deadlines[key]
+                    expired.append(key)
+
+        while self._current < target:
+            if not self._deadlines:
+                # nothing scheduled: jump instead of stepping through empty buckets
+                self._current = target
+                break
+
+            self._current += 1
+            tick = self._current
+
+            # cascade higher levels whose bucket boundary we just crossed
+            span = self.slots
+            for level in range(1, self.levels):
+                if tick % span:
+                    break
+                self._refile(self._wheels[level], (tick // span) % self.slots)
+                span *= self.slots
+            else:
+                if tick % span == 0 and self._overflow:
+                    pending, self._overflow = self._overflow, set()
+                    for key in pending:
+                        if key in self._deadlines:
+                            self._place(key, self._deadlines[key])
+
+            bucket = self._wheels[0][tick % self.slots]
+            if bucket:
+                self._wheels[0][tick % self.slots] = set()
+                for key in bucket:
+                    if self._deadlines.get(key, tick + 1) <= tick:
+                        del self._deadlines[key]
+                        expired.append(key)
+
+        return expired
+
+    def _refile(self, wheel: List[Set[Hashable]], slot: int):
+        bucket = wheel[slot]
+        if not bucket:
+            return
+        wheel[slot] = set()
+        for key in bucket:
+            due = self._deadlines.get(key)
+            if due is not None:
+                self._place(key, due)
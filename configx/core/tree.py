@@ -8,28 +8,95 @@ It has one job:
 
 Refer rules.md for rules of a ConfigX Node.
 
+Concurrency model
+-----------------
+- Reads (get, to_dict) take no lock. Each node is read atomically; use
+  pin() for a consistent multi-key view.
+- Writes lock the top-level subtree they touch (striped locks keyed by the
+  first path segment), so writers on disjoint top-level subtrees run in
+  parallel while writers on the same subtree are serialized.
+- The WAL record is written while that lock is held, so WAL order matches
+  application order for every subtree.
+- Whole-tree operations (pin, fork, load_dict, checkpoints) take every stripe.
+
 Developed & Maintained by Aditya Gaur, 2025
 
 """
 
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from contextlib import contextmanager
+from array import array
 import struct
 import io
+import itertools
 import os
+import re
+import threading
+import time
 
 from .node import Node
+from .events import Change
+from .ordered import SortedChildren
+from .index import ValueIndex, OPERATORS, iter_leaves
+from .textindex import TokenIndex
+from .accounting import MemoryAccounting, _report
+from .aggregates import AGGREGATES, SubtreeAggregate, numeric_value
+from .timerwheel import TimerWheel
+from .transaction import apply_entry
+from .columnar import NumericColumn, COLUMN_MIN, column_type
 from .errors import (
     ConfigPathNotFoundError,
     ConfigInvalidPathError,
     ConfigStrictModeError,
     ConfigNodeStructureError,
     ConfigInvalidFormatError,
+    ConfigValueError,
 )
 
+# Node.metadata key holding a node's absolute expiry time (time.time() based)
+EXPIRES_AT = "expires_at"
+
+# wildcard segments of select() patterns
+ANY_CHILD = "[.]"        # exactly one segment
+ANY_DEPTH = "[..]"       # any number of segments, including none
+ANY_DESCENDANT = "[*]"   # one or more segments
+WILDCARDS = (ANY_CHILD, ANY_DEPTH, ANY_DESCENDANT)
+
+# a pattern segment: a wildcard (which contains dots itself) or a plain key
+_PATTERN_SEGMENT = re.compile(r"\[\.\.\]|\[\.\]|\[\*\]|[^.]+")
+
+
+class _Revision:
+    """
+    Tree-wide write counter. Every write takes the next value as the new
+    version of the node it writes, so a version is never handed out twice,
+    not even to a node that was deleted and created again.
+    """
+
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def next(self) -> int:
+        with self._lock:
+            self.value += 1
+            return self.value
+
+    def observe(self, version: int):
+        """Make sure later writes get versions above `version`."""
+        with self._lock:
+            if version > self.value:
+                self.value = version
+
 
 class ConfigTree:
+    # number of striped write locks; top-level keys hash onto a stripe
+    LOCK_STRIPES = 64
+
     def __init__(self, strict_mode: bool = False, runtime=None):
         """
         Create a ConfigTree.
@@ -46,7 +113,53 @@ class ConfigTree:
 
         self.runtime = runtime
 
-    def _split(self, path: str) -> List[str]:
+        # current write epoch; nodes owned by an older epoch are shared with
+        # pinned versions and get path-copied instead of mutated in place
+        self._epoch: int = 0
+
+        # write locks: one stripe per top-level subtree hash, plus a short
+        # lock guarding replacement of the root node itself
+        self._locks = [threading.RLock() for _ in range(self.LOCK_STRIPES)]
+        self._root_lock = threading.Lock()
+
+        # change listeners (watchers, indexes ...) and per-thread batch depth
+        self._listeners: List[Any] = []
+        self._local = threading.local()
+
+        # secondary value indexes, see create_index()
+        self.indexes: List[ValueIndex] = []
+
+        # keyword index, see create_text_index()
+        self.text_index: Optional[TokenIndex] = None
+
+        # materialized aggregates by (path, field), see create_aggregate()
+        self.aggregates: Dict[Tuple[str, Optional[str]], SubtreeAggregate] = {}
+
+        # paths whose children keep a sorted index ("" = root), see
+        # index_children(); re-applied when load_dict()/bulk_load() replace
+        # those nodes
+        self._sorted_paths: Set[str] = set()
+
+        # per-subtree memory counters, see enable_accounting()
+        self.accounting: Optional[MemoryAccounting] = None
+
+        # spills cold subtrees to disk, see enable_paging()
+        self.pager = None
+
+        # pending TTL deadlines by path, created on first expire()
+        self._wheel: Optional[TimerWheel] = None
+        self._wheel_lock = threading.Lock()
+
+        # source of node versions, shared with forks (see version())
+        self._revision = _Revision()
+
+    @property
+    def revision(self) -> int:
+        """Highest node version handed out so far."""
+        return self._revision.value
+
+    @staticmethod
+    def _split(path: str) -> List[str]:
         """
         Normalize and split a dotted path into parts.
         Examples:
@@ -63,52 +176,279 @@ class ConfigTree:
 
         return parts
 
-    def _walk(self, path: str, create_missing: bool = False):
+    @staticmethod
+    def _split_pattern(pattern: str) -> List[str]:
+        """
+        _split for select() patterns: "users.[.].active" -> ["users", "[.]", "active"]
+        """
+        if pattern is None:
+            raise ConfigInvalidPathError(str(pattern), "Path cannot be None.")
+
+        parts = _PATTERN_SEGMENT.findall(pattern.strip())
+        if len(parts) == 0:
+            raise ConfigInvalidPathError(pattern, "Path cannot be empty.")
+
+        return parts
+
+    def _walk(self, path: str, create_missing: bool = False, for_write: bool = False):
         """
         Walk the tree and return the node at `path`.
         If create_missing is True, intermediate nodes are created as interior nodes.
         Returns None if a required node is missing and create_missing is False.
+
+        Walks that create nodes, or that pass for_write=True, path-copy every
+        node on the way down that is still shared with a pinned version, so the
+        returned node can be mutated in place.
         """
-        parts = self._split(path)
-        node = self.root
+        return self._walk_parts(self._split(path), path, create_missing, for_write)
+
+    def _walk_parts(
+        self,
+        parts: List[str],
+        path: str,
+        create_missing: bool = False,
+        for_write: bool = False,
+    ):
+        """
+        _walk over an already split path; `path` is only used for errors.
+        An empty `parts` list walks to the root.
+        """
+        for_write = for_write or create_missing
+        node = self._own_root() if for_write else self.root
+        pager = self.pager
+        visits = getattr(self._local, "visits", None)
+
+        # reads treat expired nodes as missing, even before they are swept
+        expiring = not for_write and self._expiring()
+        now = time.time() if expiring else 0.0
 
         for idx, part in enumerate(parts):
-            # Node exists → descend
-            if part in node.children:
-                node = node.children[part]
-                continue
+            node = self._child(node, part, path, create_missing, for_write)
+            if node is None:
+                return None
 
-            # Node missing
-            if create_missing:
-                # Strict mode disallows creating missing nodes
-                if self.strict_mode:
-                    raise ConfigStrictModeError(path)
+            if visits is not None:
+                visits[0] += 1
 
-                # Create new interior node
-                new_node = Node(name=part)
-                node.children[part] = new_node
-                node = new_node
-                continue
+            if expiring and _expired(node, now):
+                return None
 
-            # Missing but not allowed to create
-            return None
+            # reaching a paging unit marks it recently used (and faults it in)
+            if pager is not None and idx == pager.depth - 1:
+                pager.touch(tuple(parts[:idx + 1]), node)
 
         return node
 
-    
+    def _child(
+        self,
+        node: Node,
+        part: str,
+        path: str,
+        create_missing: bool = False,
+        for_write: bool = False,
+    ):
+        """
+        Single step of _walk: return child `part` of `node`, following the
+        same create/copy rules. Returns None if missing and not created.
+        """
+        # Node exists → descend
+        if part in node.children:
+            child = node.children[part]
+            if for_write:
+                child = self._own(node, part, child)
+            return child
+
+        # Node missing
+        if create_missing:
+            # Strict mode disallows creating missing nodes
+            if self.strict_mode:
+                raise ConfigStrictModeError(path)
+
+            # Create new interior node
+            new_node = Node(name=part, epoch=self._epoch)
+            node.children[part] = new_node
+            return new_node
+
+        # Missing but not allowed to create
+        return None
+
+    def _own_root(self) -> Node:
+        """
+        Return a root node that belongs to the current write epoch,
+        copying it first if it is shared with a pinned version.
+        """
+        if self.root.epoch != self._epoch:
+            with self._root_lock:
+                if self.root.epoch != self._epoch:
+                    self.root = self.root.copy(self._epoch)
+        return self.root
+
+    def _own(self, parent: Node, key: str, child: Node) -> Node:
+        """
+        Return a writable `child` of an already-owned `parent`.
+        Shared children are copied and re-linked into the parent;
+        packed numeric leaves are promoted out of their column.
+        """
+        if isinstance(parent.children, NumericColumn) and key in parent.children.slots:
+            return parent.children.promote(key, self._epoch)
+
+        if child.epoch != self._epoch:
+            child = child.copy(self._epoch)
+            parent.children[key] = child
+        return child
+
+    def _maybe_pack(self, parent: Node, value: Any, parts: List[str]):
+        """
+        Switch `parent` to columnar children once it holds enough numeric
+        leaves. Checked at power-of-two sizes only, so a parent that never
+        qualifies costs amortized O(1) per insert.
+        """
+        children = parent.children
+        n = len(children)
+        if (
+            type(children) is dict
+            and n >= COLUMN_MIN
+            and n & (n - 1) == 0
+            and column_type(value) is not None
+        ):
+            packed = NumericColumn.pack(children)
+            if packed is not None:
+                parent.children = packed
+                if self.accounting is not None:
+                    self.accounting.recount(parts)
+
+    def _count_missing(self, parts: List[str]) -> Tuple[int, Optional[Node]]:
+        """
+        Number of nodes a set on `parts` would have to create, and the node
+        it would overwrite (None if there is none yet).
+        """
+        node = self.root
+        for idx, part in enumerate(parts):
+            node = node.children.get(part)
+            if node is None:
+                return len(parts) - idx, None
+        return 0, node
+
+    @contextmanager
+    def _write_lock(self, *keys: str):
+        """
+        Hold the write locks of the top-level subtrees `keys`.
+        Stripes are taken in index order, so multi-subtree writers
+        cannot deadlock against each other.
+        """
+        stripes = sorted({hash(key) % self.LOCK_STRIPES for key in keys})
+        for idx in stripes:
+            self._locks[idx].acquire()
+        try:
+            yield
+        finally:
+            for idx in reversed(stripes):
+                self._locks[idx].release()
+
+    @contextmanager
+    def _exclusive(self):
+        """
+        Hold every write lock, blocking all writers (readers are unaffected).
+        Stripes are always taken in index order, so this cannot deadlock
+        against single-stripe writers.
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
     def get(self, path: str) -> Any:
         """
         Return a primitive value for a leaf node or a dict for an interior node.
         Raises KeyError if path does not exist.
         """
-        node = self._walk(path, create_missing=False)
+        return self._get(self._split(path), path)
+
+    def _get(self, parts: List[str], path: str) -> Any:
+        """
+        get() over an already split path. Compiled ConfigXQL statements call
+        the _get/_set/_delete forms directly with their path split once.
+        """
+        node = self._walk_parts(parts, path)
         if node is None:
             raise ConfigPathNotFoundError(path)
 
+        if node.children and self._expiring():
+            return _live_primitive(node, time.time())
+
         return node.to_primitive()
-    
 
-    def set(self, path: str, value: Any, _internal: bool = False) -> Any:
+    def _get_many(self, requests: List[Tuple[List[str], str]]) -> List[Any]:
+        """
+        _get() for several (parts, path) requests in one traversal: paths are
+        walked in sorted order, each one continuing from the deepest node it
+        shares with the previous one, so a common prefix is walked only once.
+
+        Returns the values in request order, with a ConfigPathNotFoundError
+        in place of every missing path.
+        """
+        results: List[Any] = [None] * len(requests)
+        pager = self.pager
+        visits = getattr(self._local, "visits", None)
+        expiring = self._expiring()
+        now = time.time() if expiring else 0.0
+
+        # nodes[d] is the node `d` segments down the previously walked path
+        nodes = [self.root]
+        previous: List[str] = []
+
+        for i in sorted(range(len(requests)), key=lambda i: requests[i][0]):
+            parts, path = requests[i]
+
+            # segments shared with the previous path (and walked successfully)
+            walked = len(nodes) - 1
+            shared = 0
+            for before, part in zip(previous, parts):
+                if shared == walked or before != part:
+                    break
+                shared += 1
+            del nodes[shared + 1:]
+            previous = parts
+
+            node = nodes[shared]
+            for part in parts[shared:]:
+                node = self._child(node, part, path)
+                if node is None:
+                    break
+
+                if visits is not None:
+                    visits[0] += 1
+
+                if expiring and _expired(node, now):
+                    node = None
+                    break
+
+                # nodes holds the idx + 1 nodes above this one
+                if pager is not None and len(nodes) == pager.depth:
+                    pager.touch(tuple(parts[:len(nodes)]), node)
+
+                nodes.append(node)
+
+            if node is None:
+                results[i] = ConfigPathNotFoundError(path)
+            elif node.children and expiring:
+                results[i] = _live_primitive(node, now)
+            else:
+                results[i] = node.to_primitive()
+
+        return results
+
+
+    def set(
+        self,
+        path: str,
+        value: Any,
+        _internal: bool = False,
+        _version: Optional[int] = None,
+    ) -> Any:
         """
         Set a leaf value at `path`. Creates intermediate nodes if permitted.
         Enforces strict rule: a node that currently has children cannot be converted
@@ -118,18 +458,74 @@ class ConfigTree:
         CRUD Ruleset : Validate -> Log -> Mutate 
 
         _internal : If enabled, No WAL logged
+        _version : version to give the node instead of the next revision
+                   (WAL replay and transaction commits)
         
         """
 
+        return self._set(self._split(path), path, value, _internal, _version)
+
+    def _set(
+        self,
+        parts: List[str],
+        path: str,
+        value: Any,
+        _internal: bool = False,
+        _version: Optional[int] = None,
+    ) -> Any:
+        """
+        set() over an already split path.
+        """
         #validate 
-        parts = self._split(path)
         if not parts:
             raise ConfigInvalidPathError(path, "Empty path is not allowed.")
 
+        if not _internal and self._expiring():
+            self._reap(parts)
+
+        with self._write_lock(parts[0]):
+            return self._set_locked(parts, path, value, _internal, _version)
+
+    def _set_locked(
+        self,
+        parts: List[str],
+        path: str,
+        value: Any,
+        _internal: bool,
+        _version: Optional[int] = None,
+    ) -> Any:
+        """
+        Body of set(); the caller holds the write lock of parts[0].
+        """
+        if self.accounting is not None and self.accounting.budget is not None:
+            self.accounting.admit(path, value, *self._count_missing(parts))
+
         # walk and create intermediates if allowed
-        node = self._walk(path, create_missing=True)
-        if node is None:
-            raise ConfigPathNotFoundError(path)
+        parent = self._walk_parts(parts[:-1], path, create_missing=True)
+        key = parts[-1]
+
+        # packed numeric sibling: write straight into the column slot
+        children = parent.children
+        if isinstance(children, NumericColumn) and children.accepts(key, value):
+            if key not in children and self.strict_mode:
+                raise ConfigStrictModeError(path)
+
+            version = self._next_version(_version)
+
+            #log
+            if not _internal and self.runtime:
+                self.runtime.before_set(path, value, version)
+
+            old_value = children[key].value if key in children else None
+
+            #mutate
+            children.assign(key, value, version)
+
+            if self._listeners:
+                self._emit(Change("SET", path, value=value, old=old_value))
+            return value
+
+        node = self._child(parent, key, path, create_missing=True, for_write=True)
 
         # strict rule: cannot assign to interior node
         if len(node.children) > 0:
@@ -138,18 +534,28 @@ class ConfigTree:
                 "Cannot assign value to an interior node; it has children."
             )
         
+        version = self._next_version(_version)
+
         #log
         if not _internal and self.runtime:
-            self.runtime.before_set(path, value)
+            self.runtime.before_set(path, value, version)
+
+        old_value = node.value
 
         #apply mutation, safe to set: assign value and infer type
         node.value = value
         node.type = Node.infer_type(value)
+        node.version = version
         
         # ensure children remain empty for strictness (defensive)
         node.children = {}
 
-        return node.value
+        if self._listeners:
+            self._emit(Change("SET", path, value=value, old=old_value))
+
+        self._maybe_pack(parent, value, parts[:-1])
+
+        return value
 
     def delete(self, path: str, _internal: bool = False) -> bool:
         """
@@ -160,36 +566,178 @@ class ConfigTree:
         
         _internal : If enabled, No WAL logged
         """
-        #validate
-        parts = self._split(path)
+        return self._delete(self._split(path), path, _internal)
 
+    def _delete(self, parts: List[str], path: str, _internal: bool = False) -> bool:
+        """
+        delete() over an already split path.
+        """
+        #validate
         if len(parts) == 1 and parts[0] == "root":
             raise ConfigNodeStructureError(path, "Cannot delete root node.")
 
-        parent_path = ".".join(parts[:-1])
-        parent = self._walk(parent_path, create_missing=False) if parent_path else self.root
+        with self._write_lock(parts[0]):
+            parent = self._walk_parts(parts[:-1], path)
 
-        if parent is None:
-            return False
+            if parent is None:
+                return False
 
-        key = parts[-1]
+            key = parts[-1]
 
-        if key not in parent.children:
-            return False
+            if key not in parent.children:
+                return False
+
+            # re-walk for writing only once the delete is known to happen,
+            # so a missing path never copies shared nodes
+            parent = self._walk_parts(parts[:-1], path, for_write=True)
         
-        #log 
-        if not _internal and self.runtime:
-            self.runtime.before_delete(path)
+            #log 
+            if not _internal and self.runtime:
+                self.runtime.before_delete(path)
     
-        #mutate
-        parent.children.pop(key)
-        return True
+            #mutate
+            removed = parent.children.pop(key)
+
+            if self._listeners:
+                self._emit(Change("DELETE", path, node=removed))
+            return True
+
+    def move(self, src: str, dst: str, _internal: bool = False) -> bool:
+        """
+        Move (re-parent/rename) the node at `src` to `dst`.
+        The subtree itself is not copied: the node object is detached from its
+        parent and attached under the new one, so the cost does not depend on
+        the size of the subtree. Returns True.
+
+        Enforces the same rules as set: in strict mode the parent of `dst`
+        must exist, and a leaf holding a value cannot become interior.
+        `dst` must not exist yet and cannot lie inside `src`.
+
+        CRUD Ruleset : Validate -> Log -> Mutate
+
+        _internal : If enabled, No WAL logged
+        """
+        #validate
+        src_parts = self._split(src)
+        dst_parts = self._split(dst)
+
+        if dst_parts[:len(src_parts)] == src_parts:
+            raise ConfigNodeStructureError(
+                dst, f'Cannot move "{src}" into itself.'
+            )
+
+        with self._write_lock(src_parts[0], dst_parts[0]):
+            if self._walk(src) is None:
+                raise ConfigPathNotFoundError(src)
+
+            if self._walk(dst) is not None:
+                raise ConfigNodeStructureError(dst, "Destination already exists.")
+
+            # deepest existing ancestor of dst decides strict/structure rules
+            node = self.root
+            depth = 0
+            for part in dst_parts[:-1]:
+                child = node.children.get(part)
+                if child is None:
+                    break
+                node = child
+                depth += 1
+
+            if depth < len(dst_parts) - 1 and self.strict_mode:
+                raise ConfigStrictModeError(dst)
+
+            if node is not self.root and not node.children and node.value is not None:
+                raise ConfigNodeStructureError(
+                    dst,
+                    "Cannot move under a leaf node; it holds a value."
+                )
+
+            #log
+            if not _internal and self.runtime:
+                self.runtime.before_move(src, dst)
+
+            #mutate: detach, rename, attach
+            src_parent = (
+                self._walk(".".join(src_parts[:-1]), for_write=True)
+                if len(src_parts) > 1 else self._own_root()
+            )
+            moved = self._own(src_parent, src_parts[-1], src_parent.children[src_parts[-1]])
+            src_parent.children.pop(src_parts[-1])
+
+            dst_parent = (
+                self._walk(".".join(dst_parts[:-1]), create_missing=True)
+                if len(dst_parts) > 1 else self._own_root()
+            )
+            moved.name = dst_parts[-1]
+            dst_parent.children[dst_parts[-1]] = moved
+
+            if self._expiring():
+                self._rekey_expiry(src, dst)
+
+            if self._listeners:
+                self._emit(Change("MOVE", src, node=moved, dst=dst))
+
+            return True
+
+    def version(self, path: str) -> int:
+        """
+        Version of the node at `path`: 0 if it does not exist (or never held
+        a value), else the tree revision of its last write. Versions only go
+        up across the whole tree, and survive the WAL and snapshots, so a
+        node that is deleted and set again never gets an old version back.
+        """
+        node = self._walk(path)
+        return 0 if node is None else node.version
+
+    def _next_version(self, version: Optional[int] = None) -> int:
+        """Version of a write: the next revision, or `version` if given."""
+        if version is None:
+            return self._revision.next()
+        self._revision.observe(version)
+        return version
+
+    def compare_and_set(
+        self,
+        path: str,
+        expected: Any,
+        value: Any,
+        by_value: bool = False,
+    ) -> bool:
+        """
+        Set `path` to `value` only if it is unchanged since it was read.
+        `expected` is the version seen by the caller (0 = path must not
+        exist), or with by_value=True the value seen. The check and the
+        write happen under the path's write lock, so no lock is held across
+        the caller's read-modify-write. Returns False if the check failed.
+        """
+        #validate
+        parts = self._split(path)
+
+        if self._expiring():
+            self._reap(parts)
+
+        with self._write_lock(parts[0]):
+            node = self._walk_parts(parts, path)
+
+            if by_value:
+                current = None if node is None or node.children else node.value
+                if node is None or not _compare(current, "==", expected):
+                    return False
+            elif (0 if node is None else node.version) != expected:
+                return False
+
+            self._set_locked(parts, path, value, _internal=False)
+            return True
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the entire tree into a nested Python dict of primitives.
         """
-        return self.root.to_primitive() if self.root.children else {}
+        if not self.root.children:
+            return {}
+        if self._expiring():
+            return _live_primitive(self.root, time.time())
+        return self.root.to_primitive()
 
     def load_dict(self, data: Dict[str, Any]):
         """
@@ -199,18 +747,842 @@ class ConfigTree:
         if not isinstance(data, dict):
             raise ConfigInvalidFormatError("Top-level configuration must be a dict.")
 
-        self.root = Node(name="root")
+        root = Node(name="root")
 
         for key, value in data.items():
             if not isinstance(key, str):
                 raise ConfigInvalidFormatError("All keys must be strings.")
 
-            self.root.children[key] = Node.from_primitive(key, value)
+            root.children[key] = Node.from_primitive(key, value)
+
+        # swap the fully built root in, so readers never see a partial tree
+        with self._exclusive():
+            _stamp_versions(root, self._revision.next())
+            self._replace_root(root)
+
+    def bulk_load(self, nodes: Iterable[Node]) -> int:
+        """
+        Merge already built top-level nodes (e.g. Node.from_primitive(key,
+        value) per key) into the tree, without going through set(): no WAL
+        entries, no per-key locking or change events. Branches are merged
+        key by key, a leaf replaces whatever was there, and an existing
+        branch cannot be replaced by a leaf (ConfigNodeStructureError).
+
+        The nodes are consumed before any lock is taken, and the merged tree
+        is swapped in at once: readers never see a partial load, and on an
+        error nothing changes. Listeners are rebuilt once (RESET), and the
+        memory budget is not checked. Returns the number of top-level nodes
+        merged.
+
+        With a storage runtime the load is not durable until the next
+        checkpoint (ConfigX.load_json runs one).
+        """
+        staged = list(nodes)
+
+        with self._exclusive():
+            # every loaded leaf gets one new revision as its version
+            version = self._revision.next()
+            for node in staged:
+                _stamp_versions(node, version)
+
+            # pinning makes _own() copy every existing node the merge touches
+            self.pin()
+            root = self.root.copy(self._epoch)
+            for node in staged:
+                self._graft(root, node, node.name)
+
+            # no rebuild_expiry(): loaded nodes carry no TTL, and sweep()
+            # skips deadlines whose node was replaced
+            self.root = root
+            self._restore_sorted_children()
+            if self._listeners:
+                self._emit(Change("RESET", ""))
+
+        return len(staged)
+
+    def _graft(self, parent: Node, node: Node, path: str):
+        """Merge `node` into the children of `parent`, an owned node."""
+        existing = parent.children.get(node.name)
+        if existing is None or node.type is not None:
+            if existing is not None and existing.children:
+                raise ConfigNodeStructureError(path, "Cannot replace a branch with a value.")
+            parent.children[node.name] = node
+            return
+
+        if not existing.children:
+            if existing.value is not None:
+                parent.children[node.name] = node  # value -> branch, as set() does
+            elif node.children:
+                existing = self._own(parent, node.name, existing)
+                existing.children = node.children
+            return
+
+        existing = self._own(parent, node.name, existing)
+        for key, child in list(node.children.items()):
+            self._graft(existing, child, f"{path}.{key}")
+
+    def _replace_root(self, root: Node):
+        """Install `root` as the whole tree (caller holds every write lock)."""
+        self.root = root
+        self.rebuild_expiry()
+        self._restore_sorted_children()
+
+        if self._listeners:
+            self._emit(Change("RESET", ""))
+
+    # -------------------------------------------------------------------------
+    # CHANGE LISTENERS
+    # -------------------------------------------------------------------------
+
+    def add_listener(self, listener):
+        """
+        Register a listener (see configx.core.events.TreeListener).
+        Its on_change() is called after every applied set/delete/move.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _emit(self, change: Change):
+        for listener in list(self._listeners):
+            listener.on_change(change)
+
+    def in_batch(self) -> bool:
+        """True while the calling thread is inside ConfigTree.batch()."""
+        return getattr(self._local, "batch_depth", 0) > 0
+
+    @contextmanager
+    def batch(self):
+        """
+        Group the mutations made by this thread inside the block.
+        Listeners still see every change, but can hold back their output
+        until the outermost batch ends (e.g. watchers deliver one batched
+        callback instead of one per change). With a storage runtime, the
+        batch's WAL entries are fsynced once, when the block ends.
+        """
+        depth = getattr(self._local, "batch_depth", 0)
+        self._local.batch_depth = depth + 1
+
+        # the outermost batch is also one group commit in the WAL
+        group = getattr(self.runtime, "group", None) if depth == 0 else None
+        try:
+            if group is None:
+                yield
+            else:
+                with group():
+                    yield
+        finally:
+            self._local.batch_depth = depth
+            if depth == 0:
+                for listener in list(self._listeners):
+                    listener.flush()
+
+    def commit(self, entries: List[Dict[str, Any]]):
+        """
+        Apply a transaction's mutations (WAL-style entries, see
+        configx.core.transaction) as one unit. Every writer is held off
+        meanwhile; with a storage runtime the entries are logged as one WAL
+        group closed by a COMMIT record and fsynced once. If a mutation (or
+        the log write) fails, the tree is restored to its state before the
+        first one and nothing is logged.
+
+        Readers are not blocked and can see the mutations being applied;
+        use pin() for a consistent view.
+        """
+        with self._exclusive():
+            # pinning makes the writes below path-copy, so `before` stays intact
+            before = self.pin().root
+            with self.batch():
+                try:
+                    for entry in entries:
+                        apply_entry(self, entry)
+
+                    # logged last: only a fully applied transaction is written
+                    log = getattr(self.runtime, "log_transaction", None)
+                    if log is not None:
+                        log(entries)
+                except BaseException:
+                    # restored before the batch ends, so watchers never
+                    # receive the changes that were rolled back
+                    self.root = before
+                    self.rebuild_expiry()
+                    for listener in list(self._listeners):
+                        listener.discard()
+                    raise
+
+    def _scan_leaves(self, node: Node, path: str) -> Iterator[Tuple[str, Node]]:
+        """iter_leaves() that adds every node below `node` to count_visits()."""
+        visits = getattr(self._local, "visits", None)
+        if visits is None:
+            return iter_leaves(node, path)
+        return _counted_leaves(node, path, visits)
+
+    @contextmanager
+    def count_visits(self):
+        """
+        Count the nodes this thread walks through inside the block:
+
+            with tree.count_visits() as visits:
+                tree.get("a.b.c")
+            visits[0]   # 3
+        """
+        outer = getattr(self._local, "visits", None)
+        visits = [0]
+        self._local.visits = visits
+        try:
+            yield visits
+        finally:
+            self._local.visits = outer
+            if outer is not None:
+                outer[0] += visits[0]
+
+    # -------------------------------------------------------------------------
+    # SECONDARY INDEXES & SEARCH
+    # -------------------------------------------------------------------------
+
+    def create_index(self, key: Optional[str] = None, pattern: Optional[str] = None) -> ValueIndex:
+        """
+        Declare a value index over every leaf named `key` (e.g. "theme") or
+        every leaf matching `pattern` (e.g. "agents.*.theme", "users.**.score").
+        The index is built once from the current tree and kept up to date by
+        set/delete/move from then on.
+        """
+        with self._exclusive():
+            index = ValueIndex(self, key=key, pattern=pattern)
+            self.indexes.append(index)
+            self.add_listener(index)
+        return index
+
+    def drop_index(self, index: ValueIndex):
+        if index in self.indexes:
+            self.indexes.remove(index)
+            self.remove_listener(index)
+
+    def find_index(self, key: str, path: Optional[str] = None) -> Optional[ValueIndex]:
+        """Return an index that can answer searches for `key` below `path`."""
+        for index in self.indexes:
+            if index.covers(key, path):
+                return index
+        return None
+
+    def search(self, path: Optional[str], key: str, op: str, value: Any) -> List[str]:
+        """
+        Return the sorted paths of all leaves named `key` at any depth below
+        `path` (root if None) whose value satisfies `leaf op value`.
+        op is one of ==, !=, >, >=, <, <=.
+
+        Answered from a covering index when one exists, by a scan otherwise.
+        """
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator: {op}")
+
+        base = None if path is None else ".".join(self._split(path))
+
+        index = self.find_index(key, base)
+        if index is not None:
+            found = index.lookup(op, value)
+            if base is not None:
+                prefix = base + "."
+                found = {p for p in found if p.startswith(prefix)}
+            return sorted(found)
+
+        node = self.root if base is None else self._walk(base)
+        if node is None:
+            raise ConfigPathNotFoundError(path)
+
+        return sorted(
+            p for p, leaf in self._scan_leaves(node, base or "")
+            if p.rsplit(".", 1)[-1] == key and p != base and _compare(leaf.value, op, value)
+        )
+
+    def create_text_index(self, max_postings: Optional[int] = None, persist: bool = False) -> TokenIndex:
+        """
+        Maintain an inverted token index over key names and STR values,
+        used by search_text(). `max_postings` bounds its size; with
+        persist=True a StorageRuntime saves it next to each snapshot.
+        """
+        with self._exclusive():
+            if self.text_index is not None:
+                self.remove_listener(self.text_index)
+
+            index = TokenIndex(self, max_postings=max_postings, persist=persist)
+            index.rebuild()
+            self.text_index = index
+            self.add_listener(index)
+        return index
+
+    def search_text(self, path: Optional[str], query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Paths of the leaves below `path` (root if None) whose key name or
+        string value contains every term of `query`, best match first.
+        Terms ending in `*` are prefix matches.
+        """
+        base = None if path is None else ".".join(self._split(path))
+
+        node = self.root if base is None else self._walk(base)
+        if node is None:
+            raise ConfigPathNotFoundError(path)
+
+        if self.text_index is not None:
+            return self.text_index.search(query, under=base, limit=limit)
+
+        # no index: index the subtree on the fly
+        scratch = TokenIndex(self)
+        for p, leaf in self._scan_leaves(node, base or ""):
+            if p and p != base:
+                scratch._add(p, leaf.value)
+        return scratch.search(query, limit=limit)
+
+    # -------------------------------------------------------------------------
+    # MEMORY ACCOUNTING
+    # -------------------------------------------------------------------------
+
+    def enable_accounting(self, budget: Optional[int] = None) -> MemoryAccounting:
+        """
+        Start keeping per-subtree node/leaf/byte counters. The tree is counted
+        once; afterwards every set/delete/move adjusts only the counters on its
+        own path. With a `budget` (approximate bytes), a set that would exceed
+        it is rejected with ConfigMemoryBudgetError before anything is logged.
+        """
+        with self._exclusive():
+            if self.accounting is None:
+                self.accounting = MemoryAccounting(self, budget=budget)
+                self.add_listener(self.accounting)
+            else:
+                self.accounting.budget = budget
+        return self.accounting
+
+    def memory_usage(self, path: Optional[str] = None) -> Dict[str, int]:
+        """
+        Node count, leaf (value) count and approximate bytes of the subtree
+        at `path` (whole tree if None). O(1) once accounting is enabled.
+        """
+        if self.accounting is None:
+            self.enable_accounting()
+
+        node = self.root if path is None else self._walk(path)
+        if node is None:
+            raise ConfigPathNotFoundError(path)
+
+        return _report(self.accounting.usage_of(node))
+
+    # -------------------------------------------------------------------------
+    # EXPIRY (TTL)
+    # -------------------------------------------------------------------------
+
+    def expire(self, path: str, seconds: float) -> bool:
+        """
+        Delete the node at `path` (with its subtree) `seconds` from now.
+        Until it is swept, an expired node is already invisible to get().
+        """
+        if seconds <= 0:
+            raise ConfigValueError(f'TTL for "{path}" must be positive, got {seconds}.')
+        return self.expire_at(path, time.time() + seconds)
+
+    def persist(self, path: str) -> bool:
+        """Remove the TTL of `path`, if any."""
+        return self.expire_at(path, None)
+
+    def ttl(self, path: str) -> Optional[float]:
+        """Seconds until `path` expires, or None if it has no TTL."""
+        node = self._walk(path)
+        if node is None:
+            raise ConfigPathNotFoundError(path)
+
+        when = node.metadata.get(EXPIRES_AT)
+        return None if when is None else max(0.0, when - time.time())
+
+    def expire_at(self, path: str, when: Optional[float], _internal: bool = False) -> bool:
+        """
+        Set the absolute expiry time (time.time() based) of `path`;
+        None removes it. The deadline is kept in Node.metadata["expires_at"].
+
+        CRUD Ruleset : Validate -> Log -> Mutate
+
+        _internal : If enabled, No WAL logged
+        """
+        #validate
+        parts = self._split(path)
+
+        with self._write_lock(parts[0]):
+            if self._walk_parts(parts, path) is None:
+                raise ConfigPathNotFoundError(path)
+
+            #log
+            if not _internal and self.runtime:
+                self.runtime.before_expire(path, when)
+
+            #mutate
+            node = self._walk_parts(parts, path, for_write=True)
+            with self._wheel_lock:
+                if when is None:
+                    node.metadata.pop(EXPIRES_AT, None)
+                    if self._wheel is not None:
+                        self._wheel.cancel(path)
+                else:
+                    node.metadata[EXPIRES_AT] = when
+                    if self._wheel is None:
+                        self._wheel = TimerWheel(now=time.time())
+                    self._wheel.schedule(path, when)
+
+            return True
+
+    def sweep(self, now: Optional[float] = None) -> List[str]:
+        """
+        Delete every node whose TTL has passed and return their paths.
+        Only the timer-wheel buckets that came due are visited.
+        """
+        if self._wheel is None:
+            return []
+
+        now = time.time() if now is None else now
+        with self._wheel_lock:
+            due = self._wheel.advance(now)
+
+        removed = []
+        for path in due:
+            node = self._peek(self._split(path))
+            when = node.metadata.get(EXPIRES_AT) if node is not None else None
+            if when is None:
+                continue
+
+            if when > now:
+                # deadline moved after it was filed: keep waiting
+                with self._wheel_lock:
+                    self._wheel.schedule(path, when)
+                continue
+
+            if self.delete(path):
+                removed.append(path)
+
+        return removed
+
+    def rebuild_expiry(self):
+        """
+        Re-file every TTL found in node metadata, e.g. after the whole tree
+        was replaced by a snapshot load.
+        """
+        wheel = TimerWheel(now=time.time())
+
+        stack = [("", self.root)]
+        while stack:
+            path, node = stack.pop()
+
+            when = node.metadata.get(EXPIRES_AT)
+            if when is not None and path:
+                wheel.schedule(path, when)
+
+            children = node.children
+            if isinstance(children, NumericColumn):
+                children = children.nodes
+            for key, child in list(children.items()):
+                stack.append((f"{path}.{key}" if path else key, child))
+
+        with self._wheel_lock:
+            self._wheel = wheel if len(wheel) else None
+
+    def _expiring(self) -> bool:
+        """True while any node carries a TTL."""
+        wheel = self._wheel
+        return wheel is not None and len(wheel) > 0
+
+    def _peek(self, parts: List[str]) -> Optional[Node]:
+        """Plain lookup: no copying, paging bookkeeping or expiry checks."""
+        node = self.root
+        for part in parts:
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def _reap(self, parts: List[str]):
+        """
+        Before a write: run the sweeper if a tick came due, and delete an
+        expired node on the written path so the write starts from scratch.
+        """
+        now = time.time()
+        if self._wheel.due(now):
+            self.sweep(now)
+
+        node = self.root
+        for idx, part in enumerate(parts):
+            node = node.children.get(part)
+            if node is None:
+                return
+            if _expired(node, now):
+                self.delete(".".join(parts[:idx + 1]))
+                return
+
+    def _rekey_expiry(self, src: str, dst: str):
+        """TTLs are filed by path: follow a moved subtree."""
+        prefix = src + "."
+        with self._wheel_lock:
+            for key in self._wheel.keys():
+                if key == src or key.startswith(prefix):
+                    when = self._wheel.deadline(key)
+                    self._wheel.cancel(key)
+                    self._wheel.schedule(dst + key[len(src):], when)
+
+    # -------------------------------------------------------------------------
+    # PAGING
+    # -------------------------------------------------------------------------
+
+    def enable_paging(self, page_path: str, max_resident: int, depth: int = 2):
+        """
+        Keep at most `max_resident` subtrees at `depth` (e.g. depth=2 for
+        `agents.<id>`) in memory. The least recently accessed ones are
+        spilled to `page_path` and loaded back transparently on access.
+        Returns the Pager, whose stats() reports hits/misses/evictions.
+        """
+        # imported here: the page format lives in the storage layer
+        from configx.storage.pager import Pager
+
+        with self._exclusive():
+            if self.pager is not None:
+                self.pager.close()
+            self.pager = Pager(self, page_path, max_resident, depth=depth)
+        return self.pager
+
+    def disable_paging(self):
+        """Load every spilled subtree back and stop paging."""
+        with self._exclusive():
+            if self.pager is not None:
+                self.pager.close(restore=True)
+                self.pager = None
+
+    # -------------------------------------------------------------------------
+    # AGGREGATES
+    # -------------------------------------------------------------------------
+
+    def aggregate(self, path: str, op: str, field: Optional[str] = None) -> Any:
+        """
+        Aggregate one number per child of `path`: the child's own value, or
+        the value at the relative keypath `field` below it ("price").
+        op is one of "count", "sum", "min", "max"; children without a number
+        there are ignored, except by a plain count (field=None), which is the
+        number of children.
+
+        Answered in O(1) by a matching create_aggregate(); otherwise the
+        children are streamed once, and packed numeric children are reduced
+        as one array instead of node by node.
+        """
+        if op not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate: {op}")
+
+        node = self._walk(path)
+        if node is None:
+            raise ConfigPathNotFoundError(path)
+
+        children = node.children
+        if op == "count" and field is None:
+            return len(children)
+
+        materialized = self.aggregates.get(self._aggregate_key(path, field))
+        if materialized is not None:
+            return materialized.result(op)
+
+        packed = None
+        if field is None and isinstance(children, NumericColumn) and op != "count":
+            packed = {
+                "sum": children.packed_sum,
+                "min": children.packed_min,
+                "max": children.packed_max,
+            }[op]()
+            loose = children.nodes.values()
+        else:
+            loose = children.values()
+
+        visits = getattr(self._local, "visits", None)
+        if visits is not None:
+            visits[0] += len(children)
+
+        parts = self._split(field) if field else []
+        values = (
+            v for v in (numeric_value(c, parts, visits) for c in list(loose))
+            if v is not None
+        )
+        if packed is not None:
+            values = itertools.chain(values, (packed,))
+
+        if op == "count":
+            return sum(1 for _ in values)
+        if op == "sum":
+            return sum(values)
+        return (min if op == "min" else max)(values, default=None)
+
+    def create_aggregate(self, path: str, field: Optional[str] = None) -> SubtreeAggregate:
+        """
+        Materialize the aggregates of `path` (and `field`, see aggregate()):
+        built once from the current tree, then updated by every set/delete/
+        move, so count and sum are O(1) and min/max read the ends of a
+        sorted array instead of scanning the children.
+        """
+        key = self._aggregate_key(path, field)
+        with self._exclusive():
+            existing = self.aggregates.get(key)
+            if existing is not None:
+                return existing
+
+            materialized = SubtreeAggregate(self, key[0], field=key[1])
+            self.aggregates[key] = materialized
+            self.add_listener(materialized)
+        return materialized
+
+    def drop_aggregate(self, aggregate: SubtreeAggregate):
+        key = self._aggregate_key(aggregate.path, aggregate.field)
+        if self.aggregates.get(key) is aggregate:
+            del self.aggregates[key]
+            self.remove_listener(aggregate)
+
+    def _aggregate_key(self, path: str, field: Optional[str]) -> Tuple[str, Optional[str]]:
+        return ".".join(self._split(path)), ".".join(self._split(field)) if field else None
+
+    # -------------------------------------------------------------------------
+    # ORDERED SCANS
+    # -------------------------------------------------------------------------
+
+    def index_children(self, path: Optional[str] = None):
+        """
+        Keep the children of the node at `path` (root if None) in a sorted
+        index, so scan() on it no longer sorts all children per call.
+        The index is maintained on every insert/delete from then on.
+        """
+        with self._exclusive() if path is None else self._write_lock(self._split(path)[0]):
+            node = self._own_root() if path is None else self._walk(path, for_write=True)
+            if node is None:
+                raise ConfigPathNotFoundError(path)
+
+            if not isinstance(node.children, SortedChildren):
+                node.children = SortedChildren(node.children)
+            self._sorted_paths.add("" if path is None else ".".join(self._split(path)))
+
+    def _restore_sorted_children(self):
+        """
+        Index the children of every index_children() path again after the
+        nodes there were replaced by a load (caller holds every write lock).
+        """
+        for path in self._sorted_paths:
+            node = self._own_root() if not path else self._walk(path, for_write=True)
+            if node is not None and type(node.children) is dict:
+                node.children = SortedChildren(node.children)
+
+    def scan(
+        self,
+        path: Optional[str] = None,
+        prefix: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream (key, value) pairs for the children of `path` (root if None)
+        in sorted key order.
+
+        :param prefix: only keys starting with this prefix
+        :param start: first key to include (inclusive)
+        :param end: key to stop at (exclusive)
+        :param limit: maximum number of pairs to yield
+        """
+        node = self.root if path is None else self._walk(path)
+        if node is None:
+            raise ConfigPathNotFoundError(path)
+
+        children = node.children
+        if isinstance(children, SortedChildren):
+            keys = children.irange(prefix=prefix, start=start, end=end)
+        else:
+            keys = (
+                k for k in sorted(children)
+                if (prefix is None or k.startswith(prefix))
+                and (start is None or k >= start)
+                and (end is None or k < end)
+            )
+
+        count = 0
+        for key in keys:
+            if limit is not None and count >= limit:
+                return
+
+            child = children.get(key)
+            if child is None:
+                continue
+
+            yield key, child.to_primitive()
+            count += 1
+
+    # -------------------------------------------------------------------------
+    # WILDCARD SELECTION
+    # -------------------------------------------------------------------------
+
+    def select(self, pattern: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream (path, value) for every node matching `pattern`, a keypath
+        whose segments may be wildcards:
+
+            users.[.].active    [.]  exactly one segment
+            [..].userId         [..] any number of segments, including none
+            app.[*]             [*]  one or more segments
+
+        The tree is walked depth-first as the generator is consumed; no
+        intermediate copy of the tree is built.
+        """
+        now = time.time() if self._expiring() else None
+        for parts, node in self._select(self._split_pattern(pattern), now):
+            value = node.to_primitive() if now is None else _live_primitive(node, now)
+            yield ".".join(parts), value
+
+    def set_matching(self, pattern: str, value: Any) -> int:
+        """
+        Set every existing value matching `pattern` (see select()) to `value`.
+        Never creates keys. The writes run as one batch, so they reach the
+        WAL as a single group commit. Returns the number of values written.
+        """
+        now = time.time() if self._expiring() else None
+        paths = [
+            ".".join(parts)
+            for parts, node in self._select(self._split_pattern(pattern), now)
+            if not node.children and node.value is not None
+        ]
+
+        with self.batch():
+            for path in paths:
+                self.set(path, value)
+        return len(paths)
+
+    def delete_matching(self, pattern: str) -> int:
+        """
+        Delete every node matching `pattern` (see select()) in one batch.
+        Returns the number of nodes deleted.
+        """
+        now = time.time() if self._expiring() else None
+        paths = [".".join(parts) for parts, _ in self._select(self._split_pattern(pattern), now)]
+
+        with self.batch():
+            # a match below an already deleted match is simply gone
+            return sum(self.delete(path) for path in paths)
+
+    def _select(self, parts: List[str], now: Optional[float]) -> Iterator[Tuple[Tuple[str, ...], Node]]:
+        """
+        (path parts, node) for every match of the split pattern `parts`.
+        Expired nodes are skipped when `now` is given.
+        """
+        steps = pattern_steps(parts)
+
+        # two [..] can reach the same node along different splits of its path
+        seen = set() if steps.count(ANY_DEPTH) > 1 else None
+
+        for path, node in self._match(self.root, steps, now):
+            if not path:
+                continue  # the root itself is never a match
+            if seen is not None:
+                if path in seen:
+                    continue
+                seen.add(path)
+            yield path, node
+
+    def _match(self, node: Node, steps: List[str], now: Optional[float]) -> Iterator[Tuple[Tuple[str, ...], Node]]:
+        """
+        Depth-first matching of `steps` below `node` with an explicit stack,
+        so a deep tree costs one generator instead of one per level.
+        """
+        n = len(steps)
+        path: Tuple[str, ...] = ()
+        i = 0
+        visits = getattr(self._local, "visits", None)
+
+        # open wildcard levels: (children, iterator over their keys, path, step of the children)
+        stack: List[Tuple[Any, Iterator[str], Tuple[str, ...], int]] = []
+
+        while True:
+            # follow plain keys from (node, path, i) until a match or a wildcard
+            while True:
+                if visits is not None:
+                    visits[0] += 1
+
+                if i == n:
+                    yield path, node
+                    break
+
+                step = steps[i]
+                if step == ANY_DEPTH:
+                    # zero segments now, the children (still at [..]) afterwards;
+                    # list() takes the keys in one step, as in Node.to_primitive
+                    stack.append((node.children, iter(list(node.children)), path, i))
+                    i += 1
+                    continue
+
+                if step == ANY_CHILD:
+                    stack.append((node.children, iter(list(node.children)), path, i + 1))
+                    break
+
+                child = node.children.get(step)
+                if child is None or (now is not None and _expired(child, now)):
+                    break
+                node, path, i = child, path + (step,), i + 1
+
+            # resume the innermost wildcard level with its next child
+            while stack:
+                children, keys, parent_path, i = stack[-1]
+                for key in keys:
+                    child = children.get(key)
+                    if child is not None and (now is None or not _expired(child, now)):
+                        node, path = child, parent_path + (key,)
+                        break
+                else:
+                    stack.pop()
+                    continue
+                break
+            else:
+                return
 
     def set_strict_mode(self, enabled: bool):
         """Allow toggling strict mode at runtime."""
         self.strict_mode = bool(enabled)
 
+    # -------------------------------------------------------------------------
+    # VERSIONS: structural sharing
+    # -------------------------------------------------------------------------
+
+    def pin(self) -> "ConfigTreeView":
+        """
+        Pin the current state of the tree and return a read-only view of it.
+
+        O(1): the current root is captured and the write epoch is advanced,
+        so every later set/delete path-copies the nodes it touches instead of
+        mutating them. Untouched subtrees stay shared between the live tree
+        and every pinned view.
+        """
+        with self._exclusive():
+            view = ConfigTreeView(
+                self.root, expiring=self._expiring(), revision=self._revision.value
+            )
+            self._epoch += 1
+        return view
+
+    def fork(self) -> "ConfigTree":
+        """
+        Return an independent tree that starts from the current state.
+
+        The fork shares all nodes with this tree until either side writes.
+        It has no runtime attached, so its mutations are never logged.
+        """
+        view = self.pin()
+        forked = ConfigTree(strict_mode=self.strict_mode)
+        forked.root = view.root
+        forked._epoch = self._epoch
+
+        # versions written in the fork (and committed from it) are drawn
+        # from the same counter, so they never clash with this tree's
+        forked._revision = self._revision
+
+        # TTLs keep running in the fork: expired keys stay hidden there too
+        with self._wheel_lock:
+            if self._wheel is not None:
+                forked._wheel = self._wheel.copy()
+        return forked
+
     # -------------------------------------------------------------------------
     # PERSISTENCE LAYER: Custom Binary Format
     # -------------------------------------------------------------------------
@@ -338,4 +1710,142 @@ class ConfigTree:
             child = self._read_node(f)
             node.children[child.name] = child
 
-        return node
\ No newline at end of file
+        return node
+
+def _compare(left: Any, op: str, right: Any) -> bool:
+    """
+    Evaluate `left op right` for search scans; incomparable values never match.
+    """
+    if left is None:
+        return False
+    if op == "==":
+        return left == right and isinstance(left, bool) == isinstance(right, bool)
+    if op == "!=":
+        return not _compare(left, "==", right)
+    if isinstance(left, bool) or isinstance(right, bool):
+        return False
+    try:
+        if op == ">":
+            return left > right
+        if op == ">=":
+            return left >= right
+        if op == "<":
+            return left < right
+        if op == "<=":
+            return left <= right
+    except TypeError:
+        return False
+    return False
+
+
+def pattern_steps(parts: List[str]) -> List[str]:
+    """
+    Matching steps of a split select() pattern: [*] becomes [.] + [..], and
+    repeated [..] collapse into one.
+    """
+    steps: List[str] = []
+    for part in parts:
+        if part == ANY_DESCENDANT:
+            steps.append(ANY_CHILD)
+            part = ANY_DEPTH
+        if part == ANY_DEPTH and steps and steps[-1] == ANY_DEPTH:
+            continue
+        steps.append(part)
+    return steps
+
+
+def _expired(node: Node, now: float) -> bool:
+    when = node.metadata.get(EXPIRES_AT)
+    return when is not None and when <= now
+
+
+def _live_primitive(node: Node, now: float) -> Any:
+    """
+    Node.to_primitive() that leaves out expired descendants.
+    """
+    if node.children:
+        return {
+            k: _live_primitive(v, now)
+            for k, v in list(node.children.items())
+            if not _expired(v, now)
+        }
+    return node.value if node.value is not None else {}
+
+
+def _stamp_versions(node: Node, version: int):
+    """
+    Give every leaf below a freshly built `node` (versioned 1 by
+    Node.from_primitive) the tree revision `version`.
+    """
+    if node.version:
+        node.version = version
+
+    children = node.children
+    if isinstance(children, NumericColumn):
+        children.versions[:] = array("q", [version]) * len(children.versions)
+        children = children.nodes
+    for child in children.values():
+        _stamp_versions(child, version)
+
+
+def _counted_leaves(node: Node, path: str, visits: List[int]) -> Iterator[Tuple[str, Node]]:
+    if not node.children:
+        yield path, node
+        return
+
+    children = list(node.children.items())
+    visits[0] += len(children)
+    for key, child in children:
+        yield from _counted_leaves(child, f"{path}.{key}" if path else key, visits)
+
+
+class ConfigTreeView:
+    """
+    Read-only version of a ConfigTree, as returned by ConfigTree.pin().
+
+    A view never changes, no matter what is written to the tree afterwards.
+    Keys whose TTL has passed read as missing, as they do in the tree.
+    """
+
+    def __init__(self, root: Node, expiring: bool = False, revision: int = 0):
+        self.root: Node = root
+
+        # whether any node carried a TTL when the view was pinned
+        self.expiring = expiring
+
+        # ConfigTree.revision at the time of the pin (saved with snapshots)
+        self.revision = revision
+
+    def _walk(self, path: str) -> Optional[Node]:
+        node = self.root
+        now = time.time() if self.expiring else 0.0
+        for part in ConfigTree._split(path):
+            node = node.children.get(part)
+            if node is None:
+                return None
+            if self.expiring and _expired(node, now):
+                return None
+        return node
+
+    def get(self, path: str) -> Any:
+        """
+        Return a primitive value for a leaf node or a dict for an interior node,
+        as of the moment this view was pinned.
+        """
+        node = self._walk(path)
+        if node is None:
+            raise ConfigPathNotFoundError(path)
+
+        if self.expiring:
+            return _live_primitive(node, time.time())
+        return node.to_primitive()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the pinned tree into a nested Python dict of primitives.
+        """
+        if not self.root.children:
+            return {}
+        if self.expiring:
+            return _live_primitive(self.root, time.time())
+        return self.root.to_primitive()
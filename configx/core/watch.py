@@ -0,0 +1,256 @@
+"""
+configx.core.watch
+
+Change subscriptions for ConfigTree.
+
+Watch patterns are keypaths whose segments may be `*` (exactly one segment)
+or `**` (any number of segments, including none):
+
+    app.ui.theme        one key
+    agents.*.status     the status of every agent
+    sessions.**         anything below sessions
+
+A pattern fires when the changed node, or one of its ancestors, matches it.
+Deleting or moving a node also fires the patterns below it, and replacing
+the whole tree (RESET: load_dict, bulk loads) fires every pattern.
+
+Subscriptions live in a trie keyed by pattern segment, so a change only
+visits the branches of the trie that can match its path instead of testing
+every watcher.
+
+Developed & Maintained by Aditya Gaur, 2025
+
+"""
+
+from __future__ import annotations
+import queue
+import threading
+import warnings
+from typing import Any, Callable, Dict, List, Optional
+
+from .events import Change, TreeListener
+
+
+class Watch:
+    """
+    Handle returned by WatchRegistry.subscribe(); cancel() unsubscribes.
+    """
+
+    def __init__(self, registry: "WatchRegistry", pattern: str, callback: Callable, threaded: bool):
+        self.registry = registry
+        self.pattern = pattern
+        self.callback = callback
+        self.threaded = threaded
+
+    def cancel(self):
+        self.registry.unsubscribe(self)
+
+
+class _TrieNode:
+    __slots__ = ("children", "watches")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.watches: List[Watch] = []
+
+    def all_watches(self):
+        yield from self.watches
+        for child in self.children.values():
+            yield from child.all_watches()
+
+
+class WatchRegistry(TreeListener):
+    """
+    Trie of watch patterns attached to a ConfigTree as a listener.
+
+    Callbacks receive a list of Change objects: one change for a single
+    mutation, all changes of a ConfigTree.batch() at once. Threaded watches
+    are called on a background worker thread, so slow callbacks never hold
+    up writers.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self._root = _TrieNode()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+
+        tree.add_listener(self)
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+    # ------------------------------------------------------------------
+
+    def subscribe(self, pattern: str, callback: Callable[[List[Change]], Any], threaded: bool = False) -> Watch:
+        parts = self.tree._split(pattern)
+        watch = Watch(self, pattern, callback, threaded)
+
+        with self._lock:
+            node = self._root
+            for part in parts:
+                node = node.children.setdefault(part, _TrieNode())
+            node.watches.append(watch)
+
+        return watch
+
+    def unsubscribe(self, watch: Watch):
+        with self._lock:
+            node = self._root
+            for part in self.tree._split(watch.pattern):
+                node = node.children.get(part)
+                if node is None:
+                    return
+            if watch in node.watches:
+                node.watches.remove(watch)
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def match(self, path: str, descendants: bool = False) -> List[Watch]:
+        """
+        Watches whose pattern matches `path` or one of its ancestors.
+        With descendants=True, watches on nodes below `path` match too.
+        """
+        found: Dict[int, Watch] = {}
+        parts = self.tree._split(path)
+        self._match(self._root, parts, 0, descendants, found)
+        return list(found.values())
+
+    def _match(self, node: _TrieNode, parts: List[str], i: int, descendants: bool, found: Dict[int, Watch]):
+        # the pattern so far already covers an ancestor of the changed node
+        for w in node.watches:
+            found[id(w)] = w
+
+        if i == len(parts):
+            tail = node.children.get("**")
+            if tail is not None:
+                for w in tail.watches:
+                    found[id(w)] = w
+            if descendants:
+                for w in node.all_watches():
+                    found[id(w)] = w
+            return
+
+        exact = node.children.get(parts[i])
+        if exact is not None:
+            self._match(exact, parts, i + 1, descendants, found)
+
+        star = node.children.get("*")
+        if star is not None:
+            self._match(star, parts, i + 1, descendants, found)
+
+        tail = node.children.get("**")
+        if tail is not None:
+            for j in range(i, len(parts) + 1):
+                self._match(tail, parts, j, descendants, found)
+
+    # ------------------------------------------------------------------
+    # Listener hooks
+    # ------------------------------------------------------------------
+
+    def on_change(self, change: Change):
+        if not self._root.children and not self._root.watches:
+            return
+
+        if change.op == "RESET":
+            # the whole tree was replaced: every watch may have changed
+            with self._lock:
+                watches = list(self._root.all_watches())
+        else:
+            watches = self.match(change.path, descendants=change.op != "SET")
+
+        if change.dst is not None:
+            watches += [w for w in self.match(change.dst, descendants=True) if w not in watches]
+
+        if not watches:
+            return
+
+        if self.tree.in_batch():
+            pending = self._pending()
+            for w in watches:
+                pending.setdefault(w, []).append(change)
+            return
+
+        for w in watches:
+            self._deliver(w, [change])
+
+    def flush(self):
+        pending = self._pending()
+        if not pending:
+            return
+
+        self._local.pending = {}
+        for w, changes in pending.items():
+            self._deliver(w, changes)
+
+    def discard(self):
+        # a failed commit: the tree is back as it was, nothing to report
+        self._local.pending = {}
+
+    def _pending(self) -> Dict[Watch, List[Change]]:
+        pending = getattr(self._local, "pending", None)
+        if pending is None:
+            pending = self._local.pending = {}
+        return pending
+
+    # ------------------------------------------------------------------
+    # Delivery
+    # ------------------------------------------------------------------
+
+    def _deliver(self, watch: Watch, changes: List[Change]):
+        if not watch.threaded:
+            # the write is already applied and logged: a failing callback
+            # is reported, never raised into the writer
+            self._call(watch, changes)
+            return
+
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._queue = queue.Queue()
+                    self._worker = threading.Thread(
+                        target=self._run, name="configx-watch", daemon=True
+                    )
+                    self._worker.start()
+
+        self._queue.put((watch, changes))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._call(*item)
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _call(watch: Watch, changes: List[Change]):
+        try:
+            watch.callback(changes)
+        except Exception as exc:
+            # a failing callback must not stop delivery to the others
+            warnings.warn(
+                f'Watch callback for "{watch.pattern}" raised {exc!r}',
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+    def wait(self):
+        """Block until every queued threaded notification has been delivered."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self):
+        """Stop the delivery thread (after draining it) and detach from the tree."""
+        self.tree.remove_listener(self)
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+            self._queue = None
@@ -0,0 +1,74 @@
+"""
+ConfigXQL - Statement cache
+
+Bounded LRU map from query text to its parsed (immutable) AST and the
+compiled callable built from it, so a query string that was seen before
+skips the Lark parse and the compile step entirely.
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+
+from collections import OrderedDict
+import threading
+from typing import Dict, Optional
+
+from configx.qlang.parser import ASTNode
+
+
+class StatementCache:
+    """
+    LRU cache of parsed statements with hit/miss counters.
+    A maxsize of 0 disables caching.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, ASTNode]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, query: str) -> Optional[ASTNode]:
+        with self._lock:
+            node = self._entries.get(query)
+            if node is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(query)
+            self.hits += 1
+            return node
+
+    def put(self, query: str, node: ASTNode):
+        if self.maxsize == 0:
+            return
+
+        with self._lock:
+            self._entries[query] = node
+            self._entries.move_to_end(query)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
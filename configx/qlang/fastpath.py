@@ -0,0 +1,90 @@
+"""
+ConfigXQL - Fast-path scanner
+
+Most queries are the plain forms of configxql.lark:
+
+    a.b.c            get
+    a.b.c!           safe get
+    a.b.c-           delete
+    a.b.c=<value>    set (string, int, float or bool)
+
+scan() recognizes exactly these with one precompiled regular expression and
+builds the same AST the Lark parser + transformer would. Anything else
+(functions, conditional sets, $parameters, scripts, malformed input)
+returns None and goes through Lark, which also produces the syntax errors.
+
+The token patterns mirror the grammar's terminals (IDENT, ESCAPED_STRING,
+SIGNED_INT, SIGNED_FLOAT, BOOL, inline whitespace); tests/test_fastpath.py
+checks the two paths against each other.
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+
+import re
+from typing import Optional
+
+from configx.qlang.parser import ASTNode, GetNode, SetNode, DeleteNode
+
+_WS = r"[ \t\f\r]*"
+_IDENT = r"[a-zA-Z_][a-zA-Z0-9_]*"
+
+_INT = r"[+-]?[0-9]+"
+_EXP = r"[eE][+-]?[0-9]+"
+_FLOAT = rf"[+-]?(?:[0-9]+{_EXP}|(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:{_EXP})?)"
+_STRING = r'"(?:[^"\\\n]|\\[^\n])*"'
+_BOOL = r"(?i:true|false)\b"
+
+_STATEMENT = re.compile(
+    rf"""{_WS}
+    (?P<path>{_IDENT}(?:{_WS}\.{_WS}{_IDENT})*)
+    {_WS}
+    (?:
+        =(?:{_WS})(?:
+            (?P<string>{_STRING})
+          | (?P<bool>{_BOOL})
+          | (?P<float>{_FLOAT})
+          | (?P<int>{_INT})
+        )
+      | (?P<safe>!)
+      | (?P<delete>-)
+    )?
+    {_WS}""",
+    re.VERBOSE,
+)
+
+_WS_CHARS = " \t\f\r"
+
+
+def scan(query: str) -> Optional[ASTNode]:
+    """
+    AST for a plain get/safe-get/delete/set query, or None if the query
+    needs the full parser.
+    """
+    m = _STATEMENT.fullmatch(query)
+    if m is None:
+        return None
+
+    path = tuple(part.strip(_WS_CHARS) for part in m.group("path").split("."))
+
+    if m.group("safe"):
+        return GetNode(path=path, safe=True)
+    if m.group("delete"):
+        return DeleteNode(path=path)
+
+    text = m.group("string")
+    if text is not None:
+        return SetNode(path=path, value=text[1:-1])
+
+    text = m.group("bool")
+    if text is not None:
+        return SetNode(path=path, value=text == "true")
+
+    text = m.group("float")
+    if text is not None:
+        return SetNode(path=path, value=float(text))
+
+    text = m.group("int")
+    if text is not None:
+        return SetNode(path=path, value=int(text))
+
+    return GetNode(path=path, safe=False)
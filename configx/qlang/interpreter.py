@@ -9,6 +9,13 @@ Design principles:
 - No storage logic here
 - Pure AST -> Engine mapping
 
+Each statement is compiled once into a closure with its keypath pre-split
+and the tree method already chosen; query text caches that closure, so a
+repeated query is one Python call into the tree:
+
+    run = interpreter.compile("app.ui.theme")
+    run()                          # tree._get(["app", "ui", "theme"], "app.ui.theme")
+
 Current Version Supports :
 
 `GET` 
@@ -28,13 +35,89 @@ SetNode(path=["app", "ui", "theme"], value="dark")
 DeleteNode(path=[...])
 → tree.delete("app.ui.theme")
 
+`WILDCARDS`
+
+GetNode(path=("users", Wildcard("[.]"), "active"))
+→ dict(tree.select("users.[.].active"))      {path: value} of every match
+
+SetNode(path=(Wildcard("[..]"), "userId"), value=1)
+→ tree.set_matching("[..].userId", 1)        number of values written
+
+DeleteNode(path=("sessions", Wildcard("[*]")))
+→ tree.delete_matching("sessions.[*]")       number of nodes deleted
+
+`EXPLAIN`
+
+ExplainNode(statement=GetNode(...), analyze=False)
+→ planner.plan(statement).to_dict()          nothing is executed
+
+ExplainNode(statement=..., analyze=True)
+→ the plan, plus the statement's result and measured cost under "actual"
+
+`COMPARE-AND-SET`
+
+CasNode(path=["jobs", "cursor"], expected=4, value=120)
+→ tree.compare_and_set("jobs.cursor", 4, 120)
+
+CasNode(path=["jobs", "state"], expected="idle", value="busy", by_value=True)
+→ tree.compare_and_set("jobs.state", "idle", "busy", by_value=True)
+
+`FUNCTIONS`
+
+FunctionNode(path=("sessions", "tmp_x"), name="move", arg=("sessions", "x"))
+→ tree.move("sessions.tmp_x", "sessions.x")
+
+FunctionNode(path=["ui"], name="search", arg="theme==dark")
+→ tree.search("ui", "theme", "==", "dark")
+
+FunctionNode(path=["agents"], name="search", arg="persist*")
+→ tree.search_text("agents", "persist*")
+
+FunctionNode(path=["sessions", "s1"], name="ttl", arg=30)
+→ tree.expire("sessions.s1", 30)   (no arg: seconds left, via tree.ttl)
+
+FunctionNode(path=["sessions", "s1"], name="persist", arg=None)
+→ tree.persist("sessions.s1")
+
+FunctionNode(path=["products"], name="sum", arg="price")
+→ tree.aggregate("products", "sum", field="price")   (also !count, !min, !max;
+  no arg: the children's own values)
+
+`SCRIPTS`
+
+ScriptNode(statements=(SetNode(...), DeleteNode(...)))
+→ with tree.batch(): execute each statement in order
+→ list of results; the WAL entries are fsynced once for the whole script
+
 """
 
-from typing import Any
+from dataclasses import asdict
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+import time
+
+from lark.exceptions import LarkError
 
 from configx.core.tree import ConfigTree
-from configx.core.errors import ConfigPathNotFoundError
-from configx.qlang.parser import ConfigXQLParser, GetNode, SetNode, DeleteNode
+from configx.core.aggregates import AGGREGATES
+from configx.core.errors import ConfigPathNotFoundError, ConfigQueryError, ConfigXError
+from configx.qlang.cache import StatementCache
+from configx.qlang.prepared import PreparedStatement
+from configx.qlang.parser import (
+    ConfigXQLParser,
+    ASTNode,
+    Param,
+    GetNode,
+    SetNode,
+    DeleteNode,
+    CasNode,
+    FunctionNode,
+    ScriptNode,
+    ExplainNode,
+    Wildcard,
+    parse_search,
+)
+from configx.qlang.planner import ExecutionStats, Plan, QueryPlanner, QueryStats
 
 
 class ConfigXQLInterpreter:
@@ -42,55 +125,338 @@ class ConfigXQLInterpreter:
     Executes ConfigXQL AST nodes against a ConfigTree.
     """
 
-    def __init__(self, tree: ConfigTree):
+    def __init__(
+        self,
+        tree: ConfigTree,
+        cache_size: int = 1024,
+        parser_cache: Union[bool, str, None] = None,
+        collect_stats: bool = False,
+    ):
         self.tree = tree
-        self._parser = ConfigXQLParser()
+        self._parser = ConfigXQLParser(cache=parser_cache)
+
+        # query text -> (parsed statement, compiled form), see StatementCache
+        self.cache = StatementCache(cache_size)
+
+        # access paths and cost estimates for EXPLAIN
+        self.planner = QueryPlanner(tree)
+
+        # measured cost per query text (collect_stats=True only)
+        self.stats: Optional[QueryStats] = QueryStats() if collect_stats else None
 
-    def execute(self, query: str) -> Any:
+        # statement type -> compiler
+        self._compilers = {
+            GetNode: self._compile_get,
+            SetNode: self._compile_set,
+            DeleteNode: self._compile_delete,
+            CasNode: self._compile_cas,
+            FunctionNode: self._compile_function,
+            ScriptNode: self._compile_script,
+            ExplainNode: self._compile_explain,
+        }
+
+        # built-in functions: path!name[=arg]
+        self._functions = {
+            "move": self._fn_move,
+            "search": self._fn_search,
+            "ttl": self._fn_ttl,
+            "persist": self._fn_persist,
+            "version": self._fn_version,
+            **{op: partial(self._fn_aggregate, op=op) for op in AGGREGATES},
+        }
+
+    def parse(self, query: str) -> ASTNode:
+        """
+        Parse a query, reusing the cached statement for text seen before.
+        """
+        return self._lookup(query)[0]
+
+    def compile(self, query: Union[str, ASTNode]) -> Callable[[], Any]:
+        """
+        Turn a query (text or a parsed statement) into a zero-argument
+        callable that runs it. The keypath is split and the tree method
+        picked once, so calling it does no parsing, dispatch or string work.
+        Compiled forms of query text are cached alongside the statement.
+        """
+        if isinstance(query, str):
+            return self._lookup(query)[1]
+
+        compiler = self._compilers.get(type(query))
+        if compiler is None:
+            raise TypeError(f"Unsupported AST node: {type(query)}")
+        return compiler(query)
+
+    def _lookup(self, query: str) -> Tuple[ASTNode, Callable[[], Any]]:
+        entry = self.cache.get(query)
+        if entry is None:
+            node = self._parser.parse(query)
+            if _has_params(node):
+                raise ConfigQueryError(f'"{query}" has $parameters; run it via prepare().')
+            entry = (node, self.compile(node))
+            self.cache.put(query, entry)
+        return entry
+
+    def prepare(self, query: str, route: Optional[Callable[[], "ConfigXQLInterpreter"]] = None) -> PreparedStatement:
+        """
+        Parse a query with $name placeholders once and return a statement
+        that runs it with bound parameters: prepare('a.$k=$v')(k="x", v=1).
+        `route`, if given, returns the interpreter to run on at each call.
+        """
+        return PreparedStatement(self, query, self._parser.parse(query), route)
+
+    def execute(self, query: Union[str, ASTNode]) -> Any:
         """
-        Parse and execute a single ConfigXQL query.
+        Execute a single ConfigXQL query (text or an already parsed statement).
 
         Returns:
-            - value for GET
-            - None for SET / DELETE
+            - value for GET ({path: value} with wildcards)
+            - None for SET / DELETE (number of nodes changed with wildcards)
+            - a list with one result per statement for a script
+        """
+        run = self.compile(query)
+
+        if self.stats is None or not isinstance(query, str):
+            return run()
+
+        result, stats = self._measure(run)
+        self.stats.record(query, stats)
+        return result
+
+    def execute_many(self, queries: Iterable[str]) -> List[Any]:
+        """
+        Execute several queries as one batch and return their results in
+        order. Runs of consecutive plain reads share one traversal of the
+        tree, and all writes are one WAL group commit. A query that fails
+        (syntax error, missing path ...) has its exception in its place in
+        the results instead of stopping the others. Not recorded in the
+        query stats.
+        """
+        results: List[Any] = []
+        reads: List[Tuple[int, Tuple[List[str], str, bool]]] = []
+
+        with self.tree.batch():
+            for query in queries:
+                results.append(None)
+                try:
+                    run = self._lookup(query)[1]
+                except (ConfigXError, LarkError) as exc:
+                    results[-1] = exc
+                    continue
+
+                read = getattr(run, "read", None)
+                if read is not None:
+                    reads.append((len(results) - 1, read))
+                    continue
+
+                # reads before a write must not see it
+                self._read_many(reads, results)
+                try:
+                    results[-1] = run()
+                except ConfigXError as exc:
+                    results[-1] = exc
+
+            self._read_many(reads, results)
+
+        return results
+
+    def _read_many(self, reads: List[Tuple[int, Tuple[List[str], str, bool]]], results: List[Any]):
+        """Answer the pending plain reads of execute_many(), then clear them."""
+        if not reads:
+            return
+
+        values = self.tree._get_many([read[:2] for _, read in reads])
+        for (idx, read), value in zip(reads, values):
+            if read[2] and isinstance(value, ConfigPathNotFoundError):
+                value = None
+            results[idx] = value
+        reads.clear()
+
+    def explain(self, query: Union[str, ASTNode]) -> Plan:
+        """
+        Plan a query without running it (EXPLAIN prefixes are ignored).
         """
-        node = self._parser.parse(query)
+        node = self.parse(query) if isinstance(query, str) else query
+        if isinstance(node, ExplainNode):
+            node = node.statement
+        return self.planner.plan(node)
 
-        if isinstance(node, GetNode):
-            return self._exec_get(node)
+    def _measure(self, run: Callable[[], Any]) -> Tuple[Any, ExecutionStats]:
+        """Call run(), counting node visits, WAL records and time."""
+        wal = getattr(self.tree.runtime, "wal", None)
+        logged = wal.appended() if wal is not None else 0
 
-        if isinstance(node, SetNode):
-            return self._exec_set(node)
+        start = time.perf_counter()
+        with self.tree.count_visits() as visits:
+            result = run()
+        elapsed = (time.perf_counter() - start) * 1000
 
-        if isinstance(node, DeleteNode):
-            return self._exec_delete(node)
+        logged = wal.appended() - logged if wal is not None else 0
+        return result, ExecutionStats(visits=visits[0], wal_records=logged, elapsed_ms=elapsed)
 
-        raise TypeError(f"Unsupported AST node: {type(node)}")
     # ------------------------------------------------------------------
-    # Execution helpers
+    # Compilers
     # ------------------------------------------------------------------
 
-    def _exec_get(self, node: GetNode):
-        path = ".".join(node.path)
+    def _compile_get(self, node: GetNode) -> Callable[[], Any]:
+        pattern = _pattern(node.path)
+        if pattern is not None:
+            select = self.tree.select
+            return lambda: dict(select(pattern))
 
-        try:
-            return self.tree.get(path)
-        except ConfigPathNotFoundError:
-            if node.safe:
-                return None
-            raise
+        parts, path = list(node.path), ".".join(node.path)
+        get = partial(self.tree._get, parts, path)
 
-    def _exec_set(self, node: SetNode):
-        path = ".".join(node.path)
-        return self.tree.set(path, node.value)
+        if node.safe:
+            unsafe_get = get
+
+            def get():
+                try:
+                    return unsafe_get()
+                except ConfigPathNotFoundError:
+                    return None
+
+        # plain reads are answered together by execute_many()
+        get.read = (parts, path, node.safe)
+        return get
+
+    def _compile_set(self, node: SetNode) -> Callable[[], Any]:
+        pattern = _pattern(node.path)
+        if pattern is not None:
+            return partial(self.tree.set_matching, pattern, node.value)
+
+        return partial(self.tree._set, list(node.path), ".".join(node.path), node.value)
+
+    def _compile_delete(self, node: DeleteNode) -> Callable[[], Any]:
+        pattern = _pattern(node.path)
+        if pattern is not None:
+            return partial(self.tree.delete_matching, pattern)
 
-    def _exec_delete(self, node: DeleteNode):
-        path = ".".join(node.path)
-        retr = self.tree.delete(path)
-        
         # Design-Choice : Choosing to keep DELETE idempotent/safe
-         
-        # if not retr:
-        #  raise ConfigPathNotFoundError(path)
-        
-        return retr
+        # (a missing path returns False instead of raising ConfigPathNotFoundError)
+        return partial(self.tree._delete, list(node.path), ".".join(node.path))
+
+    def _compile_cas(self, node: CasNode) -> Callable[[], Any]:
+        if _pattern(node.path) is not None:
+            raise ConfigQueryError("Wildcards are not supported in conditional sets.")
+
+        path = ".".join(node.path)
+        return partial(self.tree.compare_and_set, path, node.expected, node.value, by_value=node.by_value)
+
+    def _compile_script(self, node: ScriptNode) -> Callable[[], Any]:
+        statements = [self.compile(statement) for statement in node.statements]
+        batch = self.tree.batch
+
+        def run_script():
+            # statements before a failing one stay applied (and logged)
+            with batch():
+                return [run() for run in statements]
+
+        return run_script
+
+    def _compile_explain(self, node: ExplainNode) -> Callable[[], Any]:
+        statement = node.statement
+        if isinstance(statement, ExplainNode):
+            raise ConfigQueryError("EXPLAIN expects a statement or a script.")
+
+        plan = partial(self.planner.plan, statement)
+        if not node.analyze:
+            return lambda: plan().to_dict()
+
+        if type(statement) not in self._compilers:
+            raise ConfigQueryError("EXPLAIN expects a statement or a script.")
+        run = self.compile(statement)
+
+        def analyze():
+            # planned first: the estimates describe the tree before the run
+            explained = plan().to_dict()
+            explained["result"], stats = self._measure(run)
+            explained["actual"] = asdict(stats)
+            return explained
+
+        return analyze
+
+    def _compile_function(self, node: FunctionNode) -> Callable[[], Any]:
+        fn = self._functions.get(node.name)
+        if fn is None:
+            raise ConfigQueryError(f'Unknown function "!{node.name}".')
+
+        if _pattern(node.path) is not None:
+            raise ConfigQueryError(f'Wildcards are not supported in "!{node.name}".')
+
+        return partial(fn, ".".join(node.path), node.arg)
+
+    # ------------------------------------------------------------------
+    # Built-in functions
+    # ------------------------------------------------------------------
+
+    def _fn_move(self, path: str, arg):
+        # a path, or a string when bound from a lone $parameter
+        if isinstance(arg, str):
+            return self.tree.move(path, arg)
+
+        if not isinstance(arg, tuple):
+            raise ConfigQueryError('"!move" expects a destination path, e.g. a.b!move=a.c')
+
+        return self.tree.move(path, ".".join(arg))
+
+    def _fn_search(self, path: str, arg):
+        if not isinstance(arg, str):
+            raise ConfigQueryError('"!search" expects a string, e.g. !search="theme==dark"')
+
+        key, op, value = parse_search(arg)
+        if op is not None:
+            return self.tree.search(path, key, op, value)
+
+        # no operator: keyword search
+        return self.tree.search_text(path, arg)
+
+    def _fn_ttl(self, path: str, arg):
+        if arg is None:
+            return self.tree.ttl(path)
+
+        if isinstance(arg, bool) or not isinstance(arg, (int, float)):
+            raise ConfigQueryError('"!ttl" expects a number of seconds, e.g. sessions.s1!ttl=30')
+
+        return self.tree.expire(path, arg)
+
+    def _fn_persist(self, path: str, arg):
+        if arg is not None:
+            raise ConfigQueryError('"!persist" takes no argument')
+
+        return self.tree.persist(path)
+
+    def _fn_aggregate(self, path: str, arg, op: str):
+        # field as a string (!sum="price") or a keypath (!sum=price.net)
+        if isinstance(arg, tuple):
+            arg = ".".join(arg)
+        elif arg is not None and not isinstance(arg, str):
+            raise ConfigQueryError(f'"!{op}" expects a field name, e.g. products!{op}="price"')
+
+        return self.tree.aggregate(path, op, field=arg)
+
+    def _fn_version(self, path: str, arg):
+        if arg is not None:
+            raise ConfigQueryError('"!version" takes no argument')
+
+        return self.tree.version(path)
+
+
+def _pattern(path) -> Optional[str]:
+    """The select() pattern of a path with wildcard segments, else None."""
+    if not any(isinstance(p, Wildcard) for p in path):
+        return None
+    return ".".join(p.token if isinstance(p, Wildcard) else p for p in path)
+
+
+def _has_params(node: ASTNode) -> bool:
+    if isinstance(node, ScriptNode):
+        return any(_has_params(statement) for statement in node.statements)
+    if isinstance(node, ExplainNode):
+        return _has_params(node.statement)
+
+    for value in vars(node).values():
+        if isinstance(value, Param):
+            return True
+        if isinstance(value, tuple) and any(isinstance(p, Param) for p in value):
+            return True
+    return False
@@ -9,34 +9,81 @@ Developed & Maintained by Aditya Gaur, 2025
 """
 
 from lark import Lark, Transformer, v_args
+from lark.exceptions import LarkError
 from dataclasses import dataclass
-from typing import List, Any
+from typing import Any, Optional, Tuple, Union
+import json
 import os
+import re
+import threading
+
+from configx.core.index import OPERATORS
 
 # -----------------------------------------------------------------------------
 # AST Node Definitions
+# Frozen (paths are tuples), so one parsed statement can be cached and shared.
 # -----------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True)
 class ASTNode:
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
+class Param:
+    """Placeholder ($name) in a path segment or value of a prepared statement."""
+    name: str
+
+
+@dataclass(frozen=True)
+class Wildcard:
+    """Wildcard path segment: [.], [..] or [*] (see ConfigTree.select)."""
+    token: str
+
+
+@dataclass(frozen=True)
 class GetNode(ASTNode):
-    path: List[str]
+    path: Tuple[str, ...]
     safe: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class SetNode(ASTNode):
-    path: List[str]
+    path: Tuple[str, ...]
     value: Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class DeleteNode(ASTNode):
-    path: List[str]
+    path: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CasNode(ASTNode):
+    path: Tuple[str, ...]
+    expected: Any
+    value: Any
+    by_value: bool = False
+
+
+@dataclass(frozen=True)
+class FunctionNode(ASTNode):
+    path: Tuple[str, ...]
+    name: str
+    arg: Any = None
+
+
+@dataclass(frozen=True)
+class ScriptNode(ASTNode):
+    """Several statements (separated by ; or newlines) executed as one batch."""
+    statements: Tuple[ASTNode, ...]
+
+
+@dataclass(frozen=True)
+class ExplainNode(ASTNode):
+    """EXPLAIN [ANALYZE] <statement or script>: its plan, or plan + measured cost."""
+    statement: ASTNode
+    analyze: bool = False
 
 
 # -----------------------------------------------------------------------------
@@ -51,10 +98,16 @@ class ConfigXQLTransformer(Transformer):
 
 
     def statement_list(self, *statements):
-        return list(statements)
+        # a lone statement with stray separators ("a.b=1;") is not a script
+        if len(statements) == 1:
+            return statements[0]
+        return ScriptNode(statements=statements)
     
     def path(self, *parts):
-        return [str(p) for p in parts]
+        return tuple(
+            Param(p[1:]) if p.type == "PARAM" else Wildcard(str(p)) if p.type == "WILDCARD" else str(p)
+            for p in parts
+        )
 
         
     # --- Statements ---
@@ -71,6 +124,16 @@ class ConfigXQLTransformer(Transformer):
     def delete_stmt(self, path):
         return DeleteNode(path=path)
 
+    def cas_version(self, path, version, value):
+        expected = Param(version[1:]) if version.type == "PARAM" else int(version)
+        return CasNode(path=path, expected=expected, value=value)
+
+    def cas_value(self, path, expected, value):
+        return CasNode(path=path, expected=expected, value=value, by_value=True)
+
+    def func_stmt(self, path, name, arg=None):
+        return FunctionNode(path=path, name=str(name), arg=arg)
+
     # --- Datatypes ---
 
     def string(self, token):
@@ -86,35 +149,137 @@ class ConfigXQLTransformer(Transformer):
     def bool(self, token):
         return token == "true"
 
+    def param(self, token):
+        return Param(token[1:])
+
+
+# -----------------------------------------------------------------------------
+# Search expressions: the string argument of !search
+# -----------------------------------------------------------------------------
+
+def parse_search(arg: str) -> Tuple[Optional[str], Optional[str], Any]:
+    """
+    Split a !search argument into (key, operator, value): "theme==dark" ->
+    ("theme", "==", "dark"). Without an operator it is a keyword search and
+    (None, None, arg) is returned.
+    """
+    for op in OPERATORS:
+        if op in arg:
+            key, _, raw = arg.partition(op)
+            key = key.strip()
+            if key:
+                return key, op, _parse_literal(raw)
+
+    return None, None, arg
+
+
+def _parse_literal(text: str) -> Any:
+    """
+    Parse the value side of a search expression: numbers, true/false and
+    "quoted" strings keep their type, anything else is a bare string.
+    """
+    text = text.strip()
+    if text.lower() in ("true", "false"):
+        return text.lower() == "true"
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
 
 # -----------------------------------------------------------------------------
 # Parser Wrapper
 # -----------------------------------------------------------------------------
 
-class ConfigXQLParser:
+GRAMMAR_PATH = os.path.join(os.path.dirname(__file__), "configxql.lark")
+
+# one LALR parser per process: building the tables is the expensive part,
+# and a Lark LALR parser with an inline transformer is safe to share
+_lark: Optional[Lark] = None
+_lark_lock = threading.Lock()
+
+# cache settings already honoured (their file is written or was loaded)
+_lark_caches: set = set()
+
+
+def get_lark(cache: Union[bool, str, None] = None) -> Lark:
     """
-    Thin toffee wrapper around Lark parser + transformer.
+    Return the process-wide ConfigXQL parser, building it on first use.
+
+    cache : True keeps the parser tables in Lark's cache under the system
+            temp dir, a string names the cache file; later processes then
+            load the tables from disk instead of rebuilding them. A call
+            asking for a cache the process has not written yet writes it,
+            even when the parser already exists.
     """
+    global _lark
+    if _lark is None or (cache and cache not in _lark_caches):
+        with _lark_lock:
+            if _lark is None or (cache and cache not in _lark_caches):
+                parser = _build_lark(cache)
+                if cache:
+                    _lark_caches.add(cache)
+                if _lark is None:
+                    _lark = parser
+    return _lark
+
+
+def _build_lark(cache: Union[bool, str, None]) -> Lark:
+    with open(GRAMMAR_PATH, "r", encoding="utf-8") as f:
+        grammar = f.read()
+
+    return Lark(
+        grammar,
+        parser="lalr",
+        transformer=ConfigXQLTransformer(),
+        propagate_positions=True,
+        maybe_placeholders=False,
+        cache=cache or False,
+    )
+
+
+# EXPLAIN is a prefix rather than a grammar keyword, so keys named "EXPLAIN"
+# keep working: "explain = 5" or "explain -" is only read as EXPLAIN when the
+# rest of the text is a statement of its own
+_EXPLAIN = re.compile(r"\s*EXPLAIN(\s+ANALYZE)?\s+(?=\S)(.*)", re.IGNORECASE | re.DOTALL)
 
-    def __init__(self):
-        grammar_path = os.path.join(
-            os.path.dirname(__file__), "configxql.lark"
-        )
 
-        with open(grammar_path, "r", encoding="utf-8") as f:
-            grammar = f.read()
+class ConfigXQLParser:
+    """
+    Thin toffee wrapper around Lark parser + transformer.
+    """
 
-        self._parser = Lark(
-            grammar,
-            parser="lalr",
-            transformer=ConfigXQLTransformer(),
-            propagate_positions=True,
-            maybe_placeholders=False,
-        )
+    def __init__(self, cache: Union[bool, str, None] = None, fast_path: bool = True):
+        self._parser = get_lark(cache)
+        self._scan = scan if fast_path else None
 
     def parse(self, query: str) -> ASTNode:
         """
-        Parse a single ConfigXQL statement into an AST node.
+        Parse a ConfigXQL statement, or a script of several, into an AST node.
+        Plain get/set/delete queries are recognized by the fast-path scanner;
+        everything else goes through Lark.
         Raises Lark exceptions on syntax errors.
         """
+        explain = _EXPLAIN.match(query)
+        if explain is not None:
+            try:
+                statement = self.parse(explain.group(2))
+            except LarkError as error:
+                try:
+                    return self._parse_statement(query)
+                except LarkError:
+                    raise error from None
+            return ExplainNode(statement=statement, analyze=bool(explain.group(1)))
+
+        return self._parse_statement(query)
+
+    def _parse_statement(self, query: str) -> ASTNode:
+        if self._scan is not None:
+            node = self._scan(query)
+            if node is not None:
+                return node
         return self._parser.parse(query)
+
+
+# imported last: the scanner builds the AST classes defined above
+from configx.qlang.fastpath import scan  # noqa: E402
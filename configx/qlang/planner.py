@@ -0,0 +1,269 @@
+"""
+ConfigXQL - Query planner
+
+Decides how a parsed statement will be answered, before anything runs:
+
+    walk                    follow the keypath, one node per segment
+    wildcard-scan           stream the matches of a [.] / [..] / [*] path
+    index                   value search answered by a ValueIndex
+    text-index              keyword search answered by the TokenIndex
+    scan                    search that walks every leaf below the path
+    aggregate-scan          !count/!sum/!min/!max over every child
+    materialized-aggregate  read from a create_aggregate() total
+    script                  several statements, one WAL group commit
+
+Every Plan carries the estimated node visits and WAL records; the access
+path follows the same rules the tree uses when the statement runs (e.g. the
+covering index tree.search() will pick). Wildcard estimates extrapolate
+from the first child at every level instead of walking the whole subtree.
+
+`EXPLAIN <query>` returns the plan, `EXPLAIN ANALYZE <query>` runs the
+query and adds the measured ExecutionStats.
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from configx.core.tree import ConfigTree, WILDCARDS, ANY_CHILD, ANY_DEPTH, pattern_steps
+from configx.qlang.parser import (
+    ASTNode,
+    GetNode,
+    SetNode,
+    DeleteNode,
+    CasNode,
+    FunctionNode,
+    ScriptNode,
+    Wildcard,
+    parse_search,
+)
+
+
+@dataclass(frozen=True)
+class Plan:
+    statement: str                     # get / set / delete / cas / !<function> / script
+    access: str                        # see the module docstring
+    path: str
+    visits: int                        # estimated nodes walked
+    wal_records: int                   # estimated WAL entries written
+    index: Optional[str] = None        # the index used, if any
+    steps: Tuple["Plan", ...] = ()     # statements of a script
+
+    def to_dict(self) -> Dict[str, Any]:
+        plan: Dict[str, Any] = {
+            "statement": self.statement,
+            "access": self.access,
+            "path": self.path,
+            "visits": self.visits,
+            "wal_records": self.wal_records,
+        }
+        if self.index is not None:
+            plan["index"] = self.index
+        if self.steps:
+            plan["steps"] = [step.to_dict() for step in self.steps]
+        return plan
+
+
+@dataclass
+class ExecutionStats:
+    """Measured cost of one execution."""
+    visits: int = 0
+    wal_records: int = 0
+    elapsed_ms: float = 0.0
+
+
+class QueryPlanner:
+    """
+    Builds Plans for parsed statements against the current state of a tree.
+    """
+
+    # bound on the first-child chain followed by wildcard estimates
+    MAX_SAMPLE_DEPTH = 64
+
+    def __init__(self, tree: ConfigTree):
+        self.tree = tree
+
+    def plan(self, node: ASTNode) -> Plan:
+        if isinstance(node, ScriptNode):
+            steps = tuple(self.plan(statement) for statement in node.statements)
+            return Plan(
+                statement="script",
+                access="script",
+                path="",
+                visits=sum(step.visits for step in steps),
+                wal_records=sum(step.wal_records for step in steps),
+                steps=steps,
+            )
+
+        parts = [p.token if isinstance(p, Wildcard) else str(p) for p in node.path]
+        path = ".".join(parts)
+        logged = 1 if self.tree.runtime is not None else 0
+
+        if any(p in WILDCARDS for p in parts):
+            return self._plan_wildcard(node, parts, path, logged)
+
+        if isinstance(node, GetNode):
+            return Plan("get", "walk", path, len(parts), 0)
+
+        if isinstance(node, SetNode):
+            return Plan("set", "walk", path, len(parts), logged)
+
+        if isinstance(node, CasNode):
+            return Plan("cas", "walk", path, len(parts), logged)
+
+        if isinstance(node, DeleteNode):
+            exists = self.tree._walk(path) is not None
+            return Plan("delete", "walk", path, len(parts), logged if exists else 0)
+
+        if isinstance(node, FunctionNode):
+            return self._plan_function(node, parts, path, logged)
+
+        raise TypeError(f"Unsupported AST node: {type(node)}")
+
+    # ------------------------------------------------------------------
+    # Statement kinds
+    # ------------------------------------------------------------------
+
+    def _plan_wildcard(self, node: ASTNode, parts: List[str], path: str, logged: int) -> Plan:
+        visits, matches = self._estimate(self.tree.root, pattern_steps(parts), 0, 0)
+
+        if isinstance(node, GetNode):
+            return Plan("get", "wildcard-scan", path, visits, 0)
+        if isinstance(node, SetNode):
+            return Plan("set", "wildcard-scan", path, visits, matches * logged)
+        if isinstance(node, DeleteNode):
+            return Plan("delete", "wildcard-scan", path, visits, matches * logged)
+
+        # rejected by the interpreter; planned as the walk it never gets to
+        return Plan(_statement_name(node), "walk", path, 0, 0)
+
+    def _plan_function(self, node: FunctionNode, parts: List[str], path: str, logged: int) -> Plan:
+        name = f"!{node.name}"
+        depth = len(parts)
+
+        if node.name == "search" and isinstance(node.arg, str):
+            key, op, _ = parse_search(node.arg)
+            if op is not None:
+                index = self.tree.find_index(key, path)
+                if index is not None:
+                    label = f"key={index.key}" if index.key else f"pattern={index.pattern}"
+                    return Plan(name, "index", path, depth, 0, index=label)
+            elif self.tree.text_index is not None:
+                return Plan(name, "text-index", path, depth, 0, index="text")
+
+            return Plan(name, "scan", path, depth + self._subtree_estimate(path), 0)
+
+        if node.name in ("count", "sum", "min", "max"):
+            target = self.tree._walk(path)
+            width = len(target.children) if target is not None else 0
+            field = ".".join(node.arg) if isinstance(node.arg, tuple) else node.arg
+
+            if node.name == "count" and field is None:
+                return Plan(name, "walk", path, depth, 0)
+            if self.tree.aggregates.get(self.tree._aggregate_key(path, field)) is not None:
+                return Plan(name, "materialized-aggregate", path, depth, 0)
+
+            per_child = 1 + (len(self.tree._split(field)) if field else 0)
+            return Plan(name, "aggregate-scan", path, depth + width * per_child, 0)
+
+        if node.name == "move":
+            dst = node.arg if isinstance(node.arg, str) else ".".join(node.arg or ())
+            return Plan(name, "walk", path, depth + len(self.tree._split(dst or path)), logged)
+
+        writes = logged if node.name == "persist" or (node.name == "ttl" and node.arg is not None) else 0
+        return Plan(name, "walk", path, depth, writes)
+
+    # ------------------------------------------------------------------
+    # Estimates
+    # ------------------------------------------------------------------
+
+    def _subtree_estimate(self, path: str) -> int:
+        node = self.tree._walk(path)
+        if node is None:
+            return 0
+        return self._estimate(node, [ANY_DEPTH], 0, 0)[0]
+
+    def _estimate(self, node, steps: List[str], i: int, depth: int) -> Tuple[int, int]:
+        """
+        (node visits, matches) of steps[i:] below `node`, extrapolated from
+        the first child wherever a wildcard fans out.
+        """
+        if i == len(steps):
+            return 0, 1
+        if depth > self.MAX_SAMPLE_DEPTH:
+            return 0, 0
+
+        step = steps[i]
+        children = node.children
+
+        if step not in (ANY_CHILD, ANY_DEPTH):
+            child = children.get(step)
+            if child is None:
+                return 0, 0
+            visits, matches = self._estimate(child, steps, i + 1, depth + 1)
+            return 1 + visits, matches
+
+        visits = matches = 0
+        if step == ANY_DEPTH:
+            visits, matches = self._estimate(node, steps, i + 1, depth)
+
+        width = len(children)
+        if width:
+            sample = children.get(next(iter(children)))
+            nxt = i + 1 if step == ANY_CHILD else i
+            v, m = self._estimate(sample, steps, nxt, depth + 1)
+            visits += width * (1 + v)
+            matches += width * m
+
+        return visits, matches
+
+
+class QueryStats:
+    """
+    Execution statistics per query text: calls, time, node visits and WAL
+    records. Keeps the `maxsize` most recently run queries.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, query: str, stats: ExecutionStats):
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is None:
+                entry = self._entries[query] = {
+                    "calls": 0, "total_ms": 0.0, "max_ms": 0.0, "visits": 0, "wal_records": 0,
+                }
+            self._entries.move_to_end(query)
+
+            entry["calls"] += 1
+            entry["total_ms"] += stats.elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], stats.elapsed_ms)
+            entry["visits"] += stats.visits
+            entry["wal_records"] += stats.wal_records
+
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Per-query totals, with the mean time per call added."""
+        with self._lock:
+            return {
+                query: dict(entry, mean_ms=entry["total_ms"] / entry["calls"])
+                for query, entry in self._entries.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def _statement_name(node: ASTNode) -> str:
+    if isinstance(node, FunctionNode):
+        return f"!{node.name}"
+    return {GetNode: "get", SetNode: "set", DeleteNode: "delete", CasNode: "cas"}[type(node)]
@@ -0,0 +1,112 @@
+"""
+ConfigXQL - Prepared statements
+
+A query with $name placeholders is parsed once; each execution binds the
+parameters straight into the parsed statement. Values are passed through
+as Python objects (no quoting or escaping), and path parameters are
+dropped into the pre-split keypath.
+
+    stmt = interpreter.prepare('users.$uid.score=$n')
+    stmt(uid="u42", n=17)       # same as users.u42.score=17
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+
+from dataclasses import fields, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from configx.core.errors import ConfigQueryError
+from configx.qlang.parser import ASTNode, Param, ScriptNode
+
+
+class PreparedStatement:
+    """
+    A parsed ConfigXQL statement with unbound $parameters.
+    Call it (or .execute()) with keyword arguments to run it.
+    """
+
+    def __init__(self, interpreter, query: str, node: ASTNode, route: Optional[Callable] = None):
+        self.query = query
+        self.node = node
+        self._intp = interpreter
+
+        # picks the interpreter at every run (e.g. an open transaction's)
+        self._route = route
+
+        # statement fields holding parameters, with the positions to fill
+        self._paths: List[Tuple[str, Tuple[Any, ...], List[Tuple[int, str]]]] = []
+        self._values: List[Tuple[str, str]] = []
+
+        # a script binds each of its statements
+        self._statements: List["PreparedStatement"] = []
+
+        names: List[str] = []
+        if isinstance(node, ScriptNode):
+            self._statements = [PreparedStatement(interpreter, query, s, route) for s in node.statements]
+            for statement in self._statements:
+                names.extend(statement.params)
+
+        for f in fields(node):
+            current = getattr(node, f.name)
+            if isinstance(current, Param):
+                self._values.append((f.name, current.name))
+                names.append(current.name)
+            elif isinstance(current, tuple):
+                slots = [(i, part.name) for i, part in enumerate(current) if isinstance(part, Param)]
+                if slots:
+                    self._paths.append((f.name, current, slots))
+                    names.extend(name for _, name in slots)
+
+        # parameter names in order of first appearance
+        self.params: Tuple[str, ...] = tuple(dict.fromkeys(names))
+
+        # (interpreter, compiled statement), when there is nothing to bind
+        self._run = None
+
+    def bind(self, **params: Any) -> ASTNode:
+        """Return the statement with every parameter substituted."""
+        missing = [name for name in self.params if name not in params]
+        if missing:
+            raise ConfigQueryError(
+                f'Missing parameter(s) {", ".join("$" + m for m in missing)} for "{self.query}".'
+            )
+
+        if self._statements:
+            return ScriptNode(statements=tuple(s.bind(**params) for s in self._statements))
+
+        changes: Dict[str, Any] = {}
+        for field_name, template, slots in self._paths:
+            parts = list(template)
+            for idx, name in slots:
+                parts[idx] = _segment(name, params[name])
+            changes[field_name] = tuple(parts)
+
+        for field_name, name in self._values:
+            changes[field_name] = params[name]
+
+        return replace(self.node, **changes) if changes else self.node
+
+    def execute(self, **params: Any) -> Any:
+        intp = self._intp if self._route is None else self._route()
+        if self.params:
+            return intp.execute(self.bind(**params))
+
+        if self._run is None or self._run[0] is not intp:
+            self._run = (intp, intp.compile(self.node))
+        return self._run[1]()
+
+    __call__ = execute
+
+    def __repr__(self) -> str:
+        return f"PreparedStatement({self.query!r})"
+
+
+def _segment(name: str, value: Any) -> str:
+    """A bound path parameter must be exactly one keypath segment."""
+    if isinstance(value, bool) or not isinstance(value, (str, int)):
+        raise ConfigQueryError(f"Path parameter ${name} must be a str or int, got {type(value).__name__}.")
+
+    segment = str(value)
+    if not segment or "." in segment:
+        raise ConfigQueryError(f'Path parameter ${name} must be a single keypath segment, got "{segment}".')
+    return segment
@@ -20,29 +20,43 @@ No files
 Perfect for tests, scripts, AI agents
 """
 
-from typing import Any, Optional
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
 from configx.core.tree import ConfigTree
+from configx.core.events import Change
+from configx.core.transaction import Transaction
+from configx.core.watch import Watch, WatchRegistry
 from configx.storage.runtime import StorageRuntime
+from configx.storage.bulkload import iter_json_nodes
 from configx.qlang.interpreter import ConfigXQLInterpreter
-import os, json
+from configx.qlang.prepared import PreparedStatement
+import os
+import tempfile
+import threading
 import atexit
 
-from colorama import Fore, Style, init
-init(autoreset=True)
 
+class _TreeRenderer:
+    # colors are filled in by load_colors() on first use, so colorama is
+    # only imported (and initialized) by programs that actually print trees
+    ROOT = OBJ = VAL = TYPE = TREE = ""
+    _colors_loaded = False
 
-from colorama import Fore, Style, init
-init(autoreset=True)
-
+    @classmethod
+    def load_colors(cls):
+        if cls._colors_loaded:
+            return
 
-class _TreeRenderer:
-    ROOT = Style.BRIGHT + Fore.WHITE
+        from colorama import Fore, Style, init
+        init(autoreset=True)
 
-    OBJ = Fore.WHITE
-    VAL = Fore.GREEN              # ConfigX accent
-    TYPE = Fore.LIGHTBLACK_EX     # subtle gray
-    TREE = Fore.LIGHTBLACK_EX     # structure only
+        cls.ROOT = Style.BRIGHT + Fore.WHITE
+        cls.OBJ = Fore.WHITE
+        cls.VAL = Fore.GREEN              # ConfigX accent
+        cls.TYPE = Fore.LIGHTBLACK_EX     # subtle gray
+        cls.TREE = Fore.LIGHTBLACK_EX     # structure only
+        cls._colors_loaded = True
 
 
     @classmethod
@@ -99,6 +113,15 @@ class ConfigX:
         persistent: bool = False,
         storage_dir: Optional[str] = None,
         load_json: Optional[str] = None,
+        text_index: bool = False,
+        memory_budget: Optional[int] = None,
+        max_resident: Optional[int] = None,
+        page_depth: int = 2,
+        sweep_interval: Optional[float] = None,
+        query_cache_size: int = 1024,
+        parser_cache: Union[bool, str, None] = None,
+        collect_query_stats: bool = False,
+        banner: bool = False,
         ):
         """
         Initialize a ConfigX runtime.
@@ -106,29 +129,48 @@ class ConfigX:
         persistent: Enable WAL + snapshot persistence
         storage_dir: Custom storage directory (defaults to .configx/)
         load_json: Optional JSON file to bootstrap initial state
+        text_index: Maintain a keyword index for !search="<keyword>"
+                    (persisted next to the snapshot in persistent mode)
+        memory_budget: Approximate byte budget for the tree; writes that
+                    would exceed it raise ConfigMemoryBudgetError
+        max_resident: Keep at most this many subtrees at `page_depth` in
+                    memory; colder ones are spilled to a page file
+                    (.configx/pages.cx in persistent mode, a temp file otherwise)
+        page_depth: Depth of the spilled subtrees (2 = `agents.<id>`)
+        sweep_interval: Seconds between background sweeps of expired (TTL)
+                    keys. Without it, expired keys are hidden from reads
+                    and swept on writes or by calling sweep()
+        query_cache_size: Number of parsed queries kept for reuse (0 disables)
+        parser_cache: Keep the ConfigXQL parser tables on disk (True = temp
+                    dir, or a file path) so new processes skip building them
+        collect_query_stats: Record time, node visits and WAL records of every
+                    executed query, see query_stats()
+        banner: Print the welcome banner
         
         """
-        print(f"Welcome to {Style.BRIGHT}{Fore.GREEN}ConfigX Runtime {Fore.WHITE}(v0.1.0)")
+        if banner:
+            _TreeRenderer.load_colors()
+            from colorama import Fore, Style
+            print(f"Welcome to {Style.BRIGHT}{Fore.GREEN}ConfigX Runtime {Fore.WHITE}(v0.1.0)")
 
         # Core in-memory structure
         self._tree = ConfigTree()
-        self._intp = ConfigXQLInterpreter(self._tree)
+        if text_index:
+            self._tree.create_text_index(persist=persistent)
+        self._intp = ConfigXQLInterpreter(
+            self._tree,
+            cache_size=query_cache_size,
+            parser_cache=parser_cache,
+            collect_stats=collect_query_stats,
+        )
+        self._memory_budget = memory_budget
         self._closed = False # Made close() idempotent
+        self._watches: Optional[WatchRegistry] = None # created on first watch()
+        self._local = threading.local() # open transaction of each thread
 
 
         # Persistence runtime (optional)
         self._storage = None
-        if storage_dir:
-            snapshot_path = f"{storage_dir}/snapshot.cx"
-            wal_path = f"{storage_dir}/wal.cx"
-
-            self._storage = StorageRuntime(snapshot_path, wal_path)
-            self._tree.attach_runtime(self._storage)
-            self._storage.start(self._tree)
-
-            self._storage = None
-
-
         if persistent:
             base_dir = storage_dir or os.path.join(os.getcwd(), ".configx")
             os.makedirs(base_dir, exist_ok=True)
@@ -145,6 +187,27 @@ class ConfigX:
         if load_json:
             self.load_json(load_json)
 
+        if max_resident is not None:
+            if persistent:
+                page_path = os.path.join(storage_dir or os.path.join(os.getcwd(), ".configx"), "pages.cx")
+            else:
+                fd, page_path = tempfile.mkstemp(prefix="configx-", suffix=".pages")
+                os.close(fd)
+            self._tree.enable_paging(page_path, max_resident, depth=page_depth)
+
+        # enabled after restore/bootstrap so existing state is always admitted
+        if memory_budget is not None:
+            self._tree.enable_accounting(budget=memory_budget)
+
+        self._sweeper_stop = threading.Event()
+        self._sweeper = None
+        if sweep_interval:
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop, args=(sweep_interval,),
+                name="configx-ttl-sweeper", daemon=True,
+            )
+            self._sweeper.start()
+
         if persistent:
             atexit.register(self.close) #Auto-close on program exit as a safety feature
 
@@ -157,18 +220,188 @@ class ConfigX:
         Resolve a ConfigXQL query against the current runtime.
 
         This is the primary API surface for ConfigX.
+        A script of several statements (separated by ; or newlines) runs as
+        one batch and returns a list with one result per statement.
         """
-        return self._intp.execute(query)
-    
-    def load_json(self, path: str):
+        return self._interpreter().execute(query)
+
+    def resolve_many(self, queries: Iterable[str]) -> List[Any]:
+        """
+        Resolve several queries at once, e.g. all the keys one request needs,
+        and return their results in order:
+
+            confx.resolve_many(["app.ui.theme", "app.ui.font", "app.missing"])
+            # ['dark', 12, ConfigPathNotFoundError(...)]
+
+        Consecutive reads share one walk of the tree and all writes are one
+        WAL batch (a single fsync). A query that fails does not stop the
+        others: its exception is returned in its place.
+        """
+        return self._interpreter().execute_many(queries)
+
+    @contextmanager
+    def transaction(self) -> Iterator[Transaction]:
+        """
+        Run several writes as one atomic unit:
+
+            with confx.transaction():
+                confx.resolve('users.u1.score=10')
+                confx.resolve('users.u2.score=20')
+
+        Inside the block, resolve() and resolve_many() on this thread see the
+        transaction's writes, but nobody else does: they are applied together
+        when the block ends and, in persistent mode, logged as one WAL group
+        with a single fsync. A crash before its commit record is written
+        leaves none of them behind. An exception inside the block (or
+        calling rollback() on the yielded Transaction) discards them all.
+        A nested transaction() joins the outer one.
+        """
+        active = getattr(self._local, "tx", None)
+        if active is not None:
+            yield active[0]
+            return
+
+        tx = Transaction(self._tree)
+        self._local.tx = (tx, ConfigXQLInterpreter(tx.view))
+        try:
+            yield tx
+        except BaseException:
+            if tx.state == "open":
+                tx.rollback()
+            raise
+        else:
+            if tx.state == "open":
+                tx.commit()
+        finally:
+            self._local.tx = None
+
+    def _interpreter(self) -> ConfigXQLInterpreter:
+        """The interpreter of this thread's open transaction, else the runtime's."""
+        active = getattr(self._local, "tx", None)
+        return self._intp if active is None else active[1]
+
+    def prepare(self, query: str) -> PreparedStatement:
+        """
+        Parse a ConfigXQL query with $name placeholders once, for repeated
+        execution with different parameters:
+
+            set_score = confx.prepare('users.$uid.score=$n')
+            set_score(uid="u42", n=17)
+
+        Path parameters fill single keypath segments; value parameters are
+        used as-is (no quoting or escaping). Inside transaction() the
+        statement runs on the transaction, like resolve().
+        """
+        return self._intp.prepare(query, route=self._interpreter)
+
+    def explain(self, query: str) -> dict:
+        """
+        How a query would run, without running it: the access path (walk,
+        index, wildcard scan ...), estimated node visits and WAL records.
+        Same as resolve('EXPLAIN <query>').
+        """
+        return self._intp.explain(query).to_dict()
+
+    def query_stats(self) -> dict:
+        """
+        Measured cost per query text (calls, total/mean/max ms, node visits,
+        WAL records). Empty unless created with collect_query_stats=True.
+        """
+        if self._intp.stats is None:
+            return {}
+        return self._intp.stats.snapshot()
+
+    def select(self, pattern: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream (path, value) pairs for a wildcard pattern, e.g.
+        'users.[.].active' or '[..].userId'. Unlike resolve(), which returns
+        the matches as one dict, nothing is collected up front.
+        """
+        return self._tree.select(pattern)
+
+    def watch(
+        self,
+        pattern: str,
+        callback: Callable[[List[Change]], Any],
+        *,
+        threaded: bool = False,
+    ) -> Watch:
+        """
+        Call `callback` whenever a node matching `pattern` changes.
+
+        Patterns are keypaths whose segments may be `*` (one segment) or
+        `**` (any depth), e.g. 'agents.*.status' or 'sessions.**'.
+        The callback receives a list of Change objects; mutations grouped in
+        a batch arrive together in one call. With threaded=True callbacks run
+        on a background thread instead of the writing thread. An exception
+        raised by a callback is reported as a RuntimeWarning; it never fails
+        the write that triggered it.
+
+        Returns a Watch handle; call .cancel() to unsubscribe.
+        """
+        if self._watches is None:
+            self._watches = WatchRegistry(self._tree)
+
+        return self._watches.subscribe(pattern, callback, threaded=threaded)
+
+    def create_index(self, key: Optional[str] = None, pattern: Optional[str] = None):
+        """
+        Declare a secondary value index used by !search, either for every
+        key with a given name (key="theme") or for a path pattern
+        (pattern="agents.*.theme"). Returns the index.
+        """
+        return self._tree.create_index(key=key, pattern=pattern)
+
+    def create_aggregate(self, path: str, field: Optional[str] = None):
+        """
+        Keep !count/!sum/!min/!max of `path` (over `field` of every child,
+        e.g. path="products", field="price") up to date on every write, so
+        reading them no longer walks the children. Returns the aggregate.
+        """
+        return self._tree.create_aggregate(path, field=field)
+
+    def stats(self, top: int = 10, depth: int = 2) -> dict:
+        """
+        Memory report: totals for the whole tree plus the `top` heaviest
+        subtrees down to `depth` levels. Counters are kept incrementally,
+        so repeated calls are cheap.
+        """
+        if self._tree.accounting is None:
+            self._tree.enable_accounting(budget=self._memory_budget)
+
+        report = {
+            "total": self._tree.memory_usage(),
+            "budget": self._tree.accounting.budget,
+            "heaviest": dict(self._tree.accounting.heaviest(top=top, depth=depth)),
+        }
+        if self._tree.pager is not None:
+            report["paging"] = self._tree.pager.stats()
+        return report
+
+    def sweep(self) -> List[str]:
+        """Delete keys whose TTL has passed; returns their paths."""
+        return self._tree.sweep()
+
+    def _sweep_loop(self, interval: float):
+        while not self._sweeper_stop.wait(interval):
+            self._tree.sweep()
+
+    def load_json(self, path: str) -> int:
         """
         Load a JSON file and ingest it as initial state.
-        This mutates the current tree.
+        This mutates the current tree: objects are merged into existing
+        branches, other values replace what is at their key.
+
+        Built for large imports: the file is parsed in chunks straight into
+        nodes (never held whole as one string or dict), merged into the tree
+        in one step with no per-key WAL entries, and in persistent mode made
+        durable by a single checkpoint. Returns the number of top-level keys.
         """
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        loaded = self._tree.bulk_load(iter_json_nodes(path))
 
-        self._ingest_dict(data)
+        if self._storage:
+            self._storage.checkpoint(self._tree)
+        return loaded
 
     def close(self):
         """
@@ -178,17 +411,27 @@ class ConfigX:
         if self._closed:
             return
 
+        if self._sweeper is not None:
+            self._sweeper_stop.set()
+            self._sweeper.join()
+
+        if self._watches:
+            self._watches.close()
+
         if self._storage:
             self._storage.shutdown(self._tree)
 
+        # after shutdown: the final snapshot copies spilled pages from the file
+        if self._tree.pager is not None:
+            self._tree.pager.close(restore=False)
+
         self._closed = True
 
     def print_tree(self, hide_values=False) -> str:
         """
         Pretty-print the current ConfigX state as a tree.
         """
-        from configx.core.node import Node
-
+        _TreeRenderer.load_colors()
         root = self._tree.root
 
         lines = [
@@ -209,44 +452,71 @@ class ConfigX:
         print("\n".join(lines))
     
     # ------------------------------------------------------------------
-    # Introspection helpers
+    # Asyncio API
     # ------------------------------------------------------------------
 
-
-    def _ingest_dict(self, data: dict, prefix: str = ""):
+    async def aresolve(self, query: str) -> Any:
         """
-        Recursively ingest a Python dict into the ConfigTree.
+        resolve() for asyncio code. The query runs right away on the event
+        loop (reads never leave memory); in persistent mode, writes are
+        appended to the WAL and the coroutine then awaits their fsync, which
+        runs on the WAL's I/O thread instead of blocking the loop. Writers
+        awaiting at the same time share one fsync.
         """
-        for key, value in data.items():
-            path = f"{prefix}.{key}" if prefix else key
-
-
-            if isinstance(value, dict):
-                # Ensure branch exists
-                self._tree.ensure_branch(path)
-                self._ingest_dict(value, path)
-            else:
-                self._tree.set(path, value)
+        return await self._durable(self._interpreter().execute, query)
 
+    async def aupdate(self, path: str, value: Any) -> Any:
+        """
+        Set `path` to a Python value (no ConfigXQL quoting), durably, the
+        same way aresolve() runs writes. Returns the value.
+        """
+        return await self._durable(self._interpreter().tree.set, path, value)
 
-    def dump(self) -> dict:
+    async def aclose(self):
         """
-        Dump the entire configuration tree as a Python dict.
-        Intended for debugging, exporting, and inspection.
+        close() for asyncio code: the final snapshot is written on a worker
+        thread while the event loop keeps running.
         """
-        return self._tree.to_dict()
+        import asyncio  # only paid for by asyncio users, see _durable()
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def _durable(self, fn: Callable[..., Any], *args) -> Any:
+        # imported here, not at module level: `import configx` stays cheap
+        # for the (synchronous) majority of callers
+        import asyncio
+
+        if self._storage is None:
+            return fn(*args)
+
+        wal = self._storage.wal
+        appended = wal.appended()
+        try:
+            with self._storage.group(sync=False):
+                return fn(*args)
+        finally:
+            # also when fn failed part way: what it logged is still applied
+            if wal.appended() != appended:
+                await asyncio.wrap_future(wal.sync_later())
 
     # ------------------------------------------------------------------
-    # Explicitly unsupported (future features)
+    # Introspection helpers
     # ------------------------------------------------------------------
 
-    def transaction(self):
+
+    def fork(self) -> "ConfigX":
         """
-        Transactions are not implemented yet.
+        Return an in-memory ConfigX that starts from the current state.
+        The fork shares structure with this runtime until either side writes,
+        and is never persisted.
+        """
+        forked = ConfigX()
+        forked._tree = self._tree.fork()
+        forked._intp = ConfigXQLInterpreter(forked._tree)
+        return forked
 
-        WAL provides durability and crash recovery, but multi-operation
-        atomic transactions will be added in a future version.
+    def dump(self) -> dict:
         """
-        raise NotImplementedError(
-            "Transactions are not implemented yet. WAL-only durability is enabled."
-        )
+        Dump the entire configuration tree as a Python dict.
+        Intended for debugging, exporting, and inspection.
+        """
+        return self._tree.to_dict()
@@ -0,0 +1,236 @@
+"""
+configx.storage.bulkload
+
+Streaming JSON reader for bulk loads.
+
+json.load() needs the whole document as one string and then as one dict
+before a single node can be built. iter_json_nodes() reads the file in
+chunks instead and yields one Node per top-level key, built while reading:
+
+- objects larger than a chunk are walked key by key, so no object has to
+  fit in memory as a Python dict;
+- every other value (strings, numbers, arrays, and objects that fit in a
+  chunk) is decoded by one json.JSONDecoder.raw_decode() call, i.e. by the
+  C parser.
+
+Numeric sibling leaves are packed into columns as they are built, the same
+way ConfigTree.set() packs them. Dotted keys are keypaths: {"a.b": 1} loads
+as a.b, merged with any other keys below "a".
+
+Developed & Maintained by Aditya Gaur, 2025
+
+"""
+
+from __future__ import annotations
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List
+
+from configx.core.node import Node
+from configx.core.columnar import NumericColumn, COLUMN_MIN
+from configx.core.errors import ConfigInvalidFormatError
+
+
+CHUNK_SIZE = 1 << 20
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+# characters that may still extend a number decoded at the end of the buffer
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+
+
+def build_node(name: str, data: Any) -> Node:
+    """Node.from_primitive(), with numeric leaves packed and dotted keys nested."""
+    node = Node(name=name)
+
+    if isinstance(data, dict):
+        node.children = _merged(_keyed(key, value) for key, value in data.items())
+    else:
+        node.value = data
+        node.type = Node.infer_type(data)
+        node.version = 1
+
+    return node
+
+
+def _keypath(key: str) -> List[str]:
+    """Segments of a JSON key: "a.b" -> ["a", "b"], as ConfigTree splits paths."""
+    if key and "." not in key:
+        return [key]
+
+    parts = [p for p in key.split(".") if p]
+    if not parts:
+        raise ConfigInvalidFormatError(f'"{key}" is not a valid key.')
+    return parts
+
+
+def _nested(parts: List[str], node: Node) -> Node:
+    """Wrap `node` (named parts[-1]) in a branch for every parent segment."""
+    for part in reversed(parts[:-1]):
+        parent = Node(name=part)
+        parent.children = {node.name: node}
+        node = parent
+    return node
+
+
+def _keyed(key: str, value: Any) -> Node:
+    parts = _keypath(key)
+    return _nested(parts, build_node(parts[-1], value))
+
+
+def _merged(nodes: Iterable[Node]):
+    """Children map of `nodes`; branches sharing a name are merged."""
+    children: Dict[str, Node] = {}
+    for node in nodes:
+        _merge_into(children, node)
+    return _pack(children)
+
+
+def _merge_into(children, node: Node):
+    existing = children.get(node.name)
+    if existing is not None and existing.children and node.children:
+        for child in list(node.children.values()):
+            _merge_into(existing.children, child)
+        return
+    children[node.name] = node
+
+
+def _pack(children: Dict[str, Node]):
+    if len(children) >= COLUMN_MIN:
+        packed = NumericColumn.pack(children)
+        if packed is not None:
+            return packed
+    return children
+
+
+def iter_json_nodes(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Node]:
+    """
+    Yield a Node for every top-level key of the JSON object in `path`,
+    in file order. Raises ConfigInvalidFormatError for anything else.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _Reader(f, chunk_size)
+        if reader.peek() != "{":
+            raise ConfigInvalidFormatError("Top-level configuration must be a JSON object.")
+
+        for node in reader.members():
+            yield node
+
+        if reader.peek() != "":
+            raise ConfigInvalidFormatError(f"Unexpected data after the top-level object in {path}.")
+
+
+class _Reader:
+    """
+    Buffered cursor over a JSON text file. `buf[pos:]` is the unread part;
+    consumed text is dropped whenever the next chunk is read.
+    """
+
+    def __init__(self, f, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int = 0) -> bool:
+        """Append at least one more chunk (or `size` chars); False at end of file."""
+        if self.eof:
+            return False
+
+        chunk = self.f.read(max(size, self.chunk_size))
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            buf, pos = self.buf, self.pos
+            end = len(buf)
+            while pos < end and buf[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+
+            if pos < end:
+                return buf[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ConfigInvalidFormatError(f'Expected "{char}", found "{found or "end of file"}".')
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next JSON value, reading until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as exc:
+                # read as much again as is buffered, so a value spanning
+                # many chunks is re-parsed O(log n) times, not O(n)
+                if not self.fill(len(self.buf) - self.pos):
+                    raise ConfigInvalidFormatError(str(exc)) from None
+                continue
+
+            # a number can go on in the next chunk ("12" | "34", "1." | "5")
+            if (
+                isinstance(value, (int, float))
+                and _NUMBER_TAIL.match(self.buf, end).end() == len(self.buf)
+                and self.fill()
+            ):
+                continue
+
+            self.pos = end
+            return value
+
+    def node(self, name: str) -> Node:
+        """The next value as a Node; objects larger than a chunk are streamed."""
+        if self.peek() != "{":
+            return build_node(name, self.value())
+
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # incomplete: read one more chunk, then stream the object
+                # if it still does not fit
+                if len(self.buf) - self.pos < self.chunk_size and self.fill():
+                    continue
+                break
+
+            self.pos = end
+            return build_node(name, value)
+
+        node = Node(name=name)
+        node.children = _merged(self.members())
+        return node
+
+    def members(self) -> Iterator[Node]:
+        """A Node for every member of the object at the cursor (see _keypath)."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            if self.peek() != '"':
+                raise ConfigInvalidFormatError("Expected an object key.")
+            parts = _keypath(self.value())
+            self.expect(":")
+            yield _nested(parts, self.node(parts[-1]))
+
+            sep = self.peek()
+            self.pos += 1
+            if sep == "}":
+                return
+            if sep != ",":
+                raise ConfigInvalidFormatError(f'Expected "," or "}}", found "{sep or "end of file"}".')
@@ -0,0 +1,298 @@
+"""
+configx.storage.pager
+
+Spilling of cold subtrees to an on-disk page file.
+
+Subtrees at a fixed depth (e.g. `agents.<id>` with depth=2) are the unit of
+residency. The pager keeps them in least-recently-accessed order; once more
+than `max_resident` are in memory, the coldest ones get their children
+encoded with the snapshot node format, appended to the page file and
+replaced by a PagedChildren stub. The stub loads the children back the
+first time anything looks at them, so spilling is invisible to callers.
+
+The page file is scratch space: it is truncated on open and removed on
+close. Snapshots copy spilled pages straight into the snapshot file, so
+persistence never has to fault a subtree back in.
+
+Developed & Maintained by Aditya Gaur, 2025
+
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from collections.abc import MutableMapping
+import io
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from configx.core.node import Node
+from configx.storage.snapshot import SnapshotStore
+
+
+class PagedChildren(MutableMapping):
+    """
+    Children map of a spilled node. Any access loads the real children from
+    the page file, re-links them into the node and serves from them.
+    """
+
+    __slots__ = ("pager", "key", "node", "offset", "length", "_children")
+
+    def __init__(self, pager: "Pager", key: Tuple[str, ...], node: Node, offset: int, length: int):
+        self.pager = pager
+        self.key = key
+        self.node = node
+        self.offset = offset
+        self.length = length
+        self._children = None
+
+    @property
+    def spilled(self) -> bool:
+        return self._children is None
+
+    def _target(self):
+        children = self._children
+        if children is None:
+            children = self.pager.fault(self)
+        return children
+
+    def page_bytes(self) -> Optional[bytes]:
+        """Encoded children while still spilled, None once loaded."""
+        return self.pager.read_page(self)
+
+    def __getitem__(self, key):
+        return self._target()[key]
+
+    def __setitem__(self, key, value):
+        self._target()[key] = value
+
+    def __delitem__(self, key):
+        del self._target()[key]
+
+    def __contains__(self, key):
+        return key in self._target()
+
+    def __iter__(self):
+        return iter(self._target())
+
+    def __len__(self):
+        return len(self._target())
+
+    def get(self, key, default=None):
+        return self._target().get(key, default)
+
+    def copy(self):
+        return self._target().copy()
+
+
+class Pager:
+    """
+    LRU residency manager for the subtrees of a ConfigTree at `depth`.
+    """
+
+    # rewrite the page file once dead pages outweigh live ones by this much
+    COMPACT_MIN_BYTES = 1 << 20
+
+    def __init__(self, tree, path: str, max_resident: int, depth: int = 2):
+        if max_resident < 1:
+            raise ValueError("max_resident must be at least 1")
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+
+        self.tree = tree
+        self.path = path
+        self.max_resident = max_resident
+        self.depth = depth
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._file = open(path, "w+b")
+
+        # guards the page file, the LRU and the counters
+        self._lock = threading.RLock()
+
+        # resident units, least recently used first
+        self._resident: "OrderedDict[Tuple[str, ...], Node]" = OrderedDict()
+
+        # spilled stubs by identity
+        self._pages: Dict[int, PagedChildren] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._live_bytes = 0
+        self._dead_bytes = 0
+
+    # ------------------------------------------------------------------
+    # Residency
+    # ------------------------------------------------------------------
+
+    def touch(self, key: Tuple[str, ...], node: Node):
+        """
+        Record an access to the unit `node` at path `key`, faulting it in if
+        it is spilled, then evict the coldest units over the cap.
+        """
+        with self._lock:
+            children = node.children
+            if isinstance(children, PagedChildren) and children.spilled:
+                children._target()
+            else:
+                self.hits += 1
+
+            self._resident[key] = node
+            self._resident.move_to_end(key)
+            overflow = len(self._resident) - self.max_resident
+
+        if overflow > 0:
+            self._evict(overflow)
+
+    def _evict(self, count: int):
+        tree = self.tree
+
+        for _ in range(count):
+            with self._lock:
+                if len(self._resident) <= self.max_resident:
+                    return
+                key, node = self._resident.popitem(last=False)
+
+            # never wait for a writer: the caller may already hold a stripe,
+            # and blocking on another one could deadlock
+            lock = tree._locks[hash(key[0]) % tree.LOCK_STRIPES]
+            if not lock.acquire(blocking=False):
+                with self._lock:
+                    self._resident[key] = node
+                    self._resident.move_to_end(key, last=False)
+                return
+
+            try:
+                # skip units that were deleted, moved or replaced meanwhile
+                if self._lookup(key) is node:
+                    self.spill(key, node)
+            finally:
+                lock.release()
+
+    def _lookup(self, key: Tuple[str, ...]) -> Optional[Node]:
+        node = self.tree.root
+        for part in key:
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def spill(self, key: Tuple[str, ...], node: Node) -> bool:
+        """
+        Write `node`'s children to the page file and replace them with a
+        stub. Leaves, empty nodes and already spilled nodes are left alone.
+        """
+        children = node.children
+        if isinstance(children, PagedChildren) or not children or node.value is not None:
+            return False
+
+        buf = io.BytesIO()
+        SnapshotStore._write_children(buf, node)
+        raw = buf.getvalue()
+
+        with self._lock:
+            self._file.seek(0, io.SEEK_END)
+            offset = self._file.tell()
+            self._file.write(raw)
+
+            stub = PagedChildren(self, key, node, offset, len(raw))
+            self._pages[id(stub)] = stub
+            self._live_bytes += len(raw)
+            self.evictions += 1
+
+            node.children = stub
+
+        return True
+
+    def fault(self, stub: PagedChildren):
+        """Load a spilled stub's children back and re-link them into its node."""
+        with self._lock:
+            if stub._children is not None:
+                return stub._children
+
+            self._file.seek(stub.offset)
+            raw = self._file.read(stub.length)
+            children = SnapshotStore._read_children(io.BytesIO(raw))
+
+            # loaded nodes carry no usage; count them before anyone sees them
+            accounting = self.tree.accounting
+            if accounting is not None:
+                accounting.count(Node(name=stub.node.name, children=children))
+
+            stub._children = children
+            if stub.node.children is stub:
+                stub.node.children = children
+
+            # resident again, whoever asked; the next touch() enforces the cap
+            self._resident[stub.key] = stub.node
+            self._resident.move_to_end(stub.key)
+
+            del self._pages[id(stub)]
+            self._live_bytes -= stub.length
+            self._dead_bytes += stub.length
+            self.misses += 1
+
+            self._maybe_compact()
+            return children
+
+    def read_page(self, stub: PagedChildren) -> Optional[bytes]:
+        with self._lock:
+            if stub._children is not None:
+                return None
+            self._file.seek(stub.offset)
+            return self._file.read(stub.length)
+
+    # ------------------------------------------------------------------
+    # Page file maintenance
+    # ------------------------------------------------------------------
+
+    def _maybe_compact(self):
+        if self._dead_bytes > max(self._live_bytes, self.COMPACT_MIN_BYTES):
+            self.compact()
+
+    def compact(self):
+        """Rewrite the page file with only the pages still spilled."""
+        with self._lock:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "wb") as out:
+                for stub in self._pages.values():
+                    self._file.seek(stub.offset)
+                    raw = self._file.read(stub.length)
+                    stub.offset = out.tell()
+                    out.write(raw)
+
+            self._file.close()
+            os.replace(tmp_path, self.path)
+            self._file = open(self.path, "r+b")
+            self._dead_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "resident": len(self._resident),
+                "spilled": len(self._pages),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "page_bytes": self._live_bytes,
+            }
+
+    def close(self, restore: bool = True):
+        """
+        Close and remove the page file. With restore=True every spilled
+        subtree is loaded back first, so the tree stays fully usable.
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+            if restore:
+                for stub in list(self._pages.values()):
+                    stub._target()
+            self._file.close()
+            self._resident.clear()
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -21,6 +21,9 @@ class StorageRuntime:
         self.snapshot_path = snapshot_path
         self.wal_path = wal_path
 
+        # keyword index saved alongside the snapshot (if the tree has one)
+        self.tokens_path = snapshot_path + ".tokens"
+
         self.wal = WriteAheadLog(wal_path)
         self._logging_enabled = True
 
@@ -32,12 +35,26 @@ class StorageRuntime:
         """
         Recover system state:
         1. Load snapshot if it exists
-        2. Replay WAL
+        2. Rebuild value indexes, aggregates and memory counters declared
+           before recovery (they were built from the empty tree)
+        3. Load the keyword index saved with it, or rebuild it
+        4. Replay WAL
         """
         self._logging_enabled = False
 
         if os.path.exists(self.snapshot_path):
             SnapshotStore.load(tree, self.snapshot_path)
+            tree.rebuild_expiry()
+
+            for derived in (*tree.indexes, *tree.aggregates.values(), tree.accounting):
+                if derived is not None:
+                    derived.rebuild()
+
+        index = tree.text_index
+        if index is not None:
+            stamp = self._snapshot_stamp()
+            if not (index.persist and stamp and index.load(self.tokens_path, stamp)):
+                index.rebuild()
 
         self.wal.replay(tree)
 
@@ -47,14 +64,33 @@ class StorageRuntime:
     # Mutation Hooks (called by ConfigTree)
     # -------------------------------------------------
 
-    def before_set(self, path: str, value):
+    def before_set(self, path: str, value, version: int):
         if self._logging_enabled:
-            self.wal.log_set(path, value)
+            self.wal.log_set(path, value, version)
 
     def before_delete(self, path: str):
         if self._logging_enabled:
             self.wal.log_delete(path)
 
+    def before_move(self, src: str, dst: str):
+        if self._logging_enabled:
+            self.wal.log_move(src, dst)
+
+    def before_expire(self, path: str, when):
+        if self._logging_enabled:
+            self.wal.log_expire(path, when)
+
+    def log_transaction(self, entries):
+        if self._logging_enabled:
+            self.wal.log_transaction(entries)
+
+    def group(self, sync: bool = True):
+        """
+        One WAL fsync for all mutations made by this thread in the block
+        (none with sync=False, see WriteAheadLog.group).
+        """
+        return self.wal.group(sync)
+
     # -------------------------------------------------
     # Checkpointing
     # -------------------------------------------------
@@ -62,9 +98,27 @@ class StorageRuntime:
     def checkpoint(self, tree):
         """
         Persist full snapshot and clear WAL.
+        The snapshot is written from a pinned version of the tree, and writers
+        are held off until the WAL is cleared so no entry can be lost.
+        """
+        with tree._exclusive():
+            SnapshotStore.save(tree.pin(), self.snapshot_path)
+
+            index = tree.text_index
+            if index is not None and index.persist:
+                index.save(self.tokens_path, self._snapshot_stamp())
+
+            self.wal.clear()
+
+    def _snapshot_stamp(self):
+        """
+        Identity of the snapshot file on disk, used to pair it with the
+        keyword index saved next to it.
         """
-        SnapshotStore.save(tree, self.snapshot_path)
-        self.wal.clear()
+        if not os.path.exists(self.snapshot_path):
+            return None
+        st = os.stat(self.snapshot_path)
+        return [st.st_size, st.st_mtime_ns]
 
     # -------------------------------------------------
     # Shutdown
@@ -72,6 +126,7 @@ class StorageRuntime:
 
     def shutdown(self, tree):
         """
-        Graceful shutdown = checkpoint.
+        Graceful shutdown = checkpoint, then stop the WAL's I/O thread.
         """
         self.checkpoint(tree)
+        self.wal.close()
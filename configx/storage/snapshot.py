@@ -1,17 +1,25 @@
 # configx/storage/snapshot.py
 
 from __future__ import annotations
+from array import array
+import json
 import struct
+import sys
 import io
 import os
 
 from configx.core.node import Node
+from configx.core.columnar import NumericColumn
+from configx.core.ordered import SortedChildren
 from configx.core.errors import (
     ConfigInvalidFormatError,
     ConfigPathNotFoundError,
 )
 
 
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+
+
 class SnapshotStore:
     """
     Handles full-state persistence of a ConfigTree.
@@ -21,7 +29,13 @@ class SnapshotStore:
     """
 
     MAGIC = b"CFGX"
-    VERSION = 1
+    VERSION = 6
+
+    # versions this reader understands
+    # (1 = no packed column blocks, 2 = no node metadata, 3 = no node versions,
+    #  4 = no child order for packed columns, 5 = no tree revision
+    #  and no sorted children blocks)
+    SUPPORTED_VERSIONS = (1, 2, 3, 4, 5, 6)
 
     # ------------------------------------------------------------------
     # Public API
@@ -37,7 +51,7 @@ class SnapshotStore:
             os.makedirs(directory)
 
         with open(file_path, "wb") as f:
-            cls._write_header(f)
+            cls._write_header(f, tree.revision)
             cls._write_node(f, tree.root)
 
     @classmethod
@@ -50,17 +64,27 @@ class SnapshotStore:
             raise ConfigPathNotFoundError(file_path)
 
         with open(file_path, "rb") as f:
-            cls._read_header(f)
-            tree.root = cls._read_node(f)
+            version = cls._read_header(f)
+
+            # older snapshots carry no revision: the highest node version
+            # is the best lower bound left
+            revision = struct.unpack(">q", f.read(8))[0] if version >= 6 else None
+            tree.root = cls._read_node(f, version)
+
+        if revision is None:
+            revision = _max_version(tree.root)
+        tree._revision.observe(revision)
 
     # ------------------------------------------------------------------
     # Header
     # ------------------------------------------------------------------
 
     @classmethod
-    def _write_header(cls, f: io.BufferedWriter):
+    def _write_header(cls, f: io.BufferedWriter, revision: int):
+        """[magic][1-byte format version][8-byte tree revision]"""
         f.write(cls.MAGIC)
         f.write(struct.pack("B", cls.VERSION))
+        f.write(struct.pack(">q", revision))
 
     @classmethod
     def _read_header(cls, f: io.BufferedReader):
@@ -71,11 +95,13 @@ class SnapshotStore:
             )
 
         version = struct.unpack("B", f.read(1))[0]
-        if version != cls.VERSION:
+        if version not in cls.SUPPORTED_VERSIONS:
             raise ConfigInvalidFormatError(
                 f"Unsupported snapshot version: {version}"
             )
 
+        return version
+
     # ------------------------------------------------------------------
     # Node Serialization
     # ------------------------------------------------------------------
@@ -84,7 +110,21 @@ class SnapshotStore:
     def _write_node(cls, f: io.BufferedWriter, node: Node):
         """
         Binary node format:
-        [name_len][name][type_tag][value_len][value][child_count][children...]
+        [name_len][name][type_tag][value_len][value][meta_len][meta][version]
+        [child_count][children...][block]
+
+        type_tag is N (none), B, I (int64), F, S, or J: any other JSON
+        value (lists, dicts, integers beyond int64) as UTF-8 JSON text.
+
+        meta is the node's metadata (e.g. its TTL) as UTF-8 JSON, empty if none;
+        version is the node's 8-byte version (the tree revision of its last
+        write).
+
+        block is a 1-byte flag: \x00 for plain children, \x02 for children
+        kept in a sorted index (ConfigTree.index_children()), or \x01
+        followed by a packed column:
+        [type_tag][count][name_len][name]...[count x 8-byte big-endian values]
+        [count x 8-byte big-endian versions]
         """
         # --- NAME ---
         name_bytes = node.name.encode("utf-8")
@@ -99,7 +139,7 @@ class SnapshotStore:
             if isinstance(node.value, bool):
                 tag = b"B"
                 val_bytes = struct.pack("?", node.value)
-            elif isinstance(node.value, int):
+            elif isinstance(node.value, int) and _INT64_MIN <= node.value <= _INT64_MAX:
                 tag = b"I"
                 val_bytes = struct.pack(">q", node.value)
             elif isinstance(node.value, float):
@@ -109,23 +149,120 @@ class SnapshotStore:
                 tag = b"S"
                 val_bytes = node.value.encode("utf-8")
             else:
-                raise ConfigInvalidFormatError(
-                    f"Unsupported value type: {type(node.value)}"
-                )
+                tag = b"J"
+                try:
+                    val_bytes = json.dumps(node.value, ensure_ascii=False).encode("utf-8")
+                except (TypeError, ValueError):
+                    raise ConfigInvalidFormatError(
+                        f"Unsupported value type: {type(node.value)}"
+                    ) from None
 
         f.write(tag)
         f.write(struct.pack(">I", len(val_bytes)))
         f.write(val_bytes)
 
+        # --- METADATA ---
+        meta_bytes = json.dumps(node.metadata).encode("utf-8") if node.metadata else b""
+        f.write(struct.pack(">I", len(meta_bytes)))
+        f.write(meta_bytes)
+
+        # --- VERSION ---
+        f.write(struct.pack(">q", node.version))
+
+        cls._write_children(f, node)
+
+    @classmethod
+    def _write_children(cls, f: io.BufferedWriter, node: Node):
+        """
+        The [child_count][children...][block] tail of a node record.
+        Also used on its own as the page format for spilled subtrees.
+        """
+        # spilled subtrees are already encoded: copy their page as-is
+        # instead of faulting them back into memory
+        page_bytes = getattr(node.children, "page_bytes", None)
+        if page_bytes is not None:
+            raw = page_bytes()
+            if raw is not None:
+                f.write(raw)
+                return
+
         # --- CHILDREN ---
-        children = list(node.children.values())
+        column = node.children if isinstance(node.children, NumericColumn) else None
+        children = list(column.nodes.values() if column else node.children.values())
         f.write(struct.pack(">I", len(children)))
 
         for child in children:
             cls._write_node(f, child)
 
+        # --- PACKED COLUMN ---
+        if column is None:
+            f.write(b"\x02" if isinstance(node.children, SortedChildren) else b"\x00")
+        else:
+            f.write(b"\x01")
+            cls._write_column(f, column)
+            cls._write_order(f, [child.name for child in children] + column.names, list(column.order))
+
+    @classmethod
+    def _write_column(cls, f: io.BufferedWriter, column: NumericColumn):
+        f.write(b"I" if column.type == "INT" else b"F")
+        f.write(struct.pack(">I", len(column.names)))
+
+        for name in column.names:
+            name_bytes = name.encode("utf-8")
+            f.write(struct.pack(">I", len(name_bytes)))
+            f.write(name_bytes)
+
+        for packed in (column.values, column.versions):
+            packed = array(packed.typecode, packed)
+            if sys.byteorder == "little":
+                packed.byteswap()
+            f.write(packed.tobytes())
+
     @classmethod
-    def _read_node(cls, f: io.BufferedReader) -> Node:
+    def _write_order(cls, f: io.BufferedWriter, stored, order):
+        """
+        Child order of a column whose loose and packed children interleave:
+        \x00 when it is simply `stored` (loose, then packed), else \x01 and
+        the position in `stored` of every child, in order.
+        """
+        if order == stored:
+            f.write(b"\x00")
+            return
+
+        position = {name: i for i, name in enumerate(stored)}
+        f.write(b"\x01")
+        f.write(struct.pack(f">{len(order)}I", *(position[name] for name in order)))
+
+    @classmethod
+    def _read_column(cls, f: io.BufferedReader, version: int = VERSION) -> NumericColumn:
+        tag = f.read(1)
+        if tag not in (b"I", b"F"):
+            raise ConfigInvalidFormatError(f"Unknown column tag: {tag}")
+
+        column = NumericColumn("INT" if tag == b"I" else "FLOAT")
+        count = struct.unpack(">I", f.read(4))[0]
+
+        for _ in range(count):
+            name_len = struct.unpack(">I", f.read(4))[0]
+            name = f.read(name_len).decode("utf-8")
+            column.slots[name] = len(column.names)
+            column.names.append(name)
+
+        column.values.frombytes(f.read(8 * count))
+        if version >= 4:
+            column.versions.frombytes(f.read(8 * count))
+        else:
+            column.versions.extend([1] * count)
+
+        if sys.byteorder == "little":
+            column.values.byteswap()
+            if version >= 4:
+                column.versions.byteswap()
+
+        return column
+
+    @classmethod
+    def _read_node(cls, f: io.BufferedReader, version: int = VERSION) -> Node:
         """
         Read a node recursively from the binary snapshot.
         """
@@ -157,13 +294,68 @@ class SnapshotStore:
         elif tag == b"S":
             node.value = val_data.decode("utf-8")
             node.type = "STR"
+        elif tag == b"J":
+            node.value = json.loads(val_data.decode("utf-8"))
+            node.type = Node.infer_type(node.value)
         else:
             raise ConfigInvalidFormatError(f"Unknown value tag: {tag}")
 
+        # --- METADATA ---
+        if version >= 3:
+            meta_len = struct.unpack(">I", f.read(4))[0]
+            if meta_len:
+                node.metadata = json.loads(f.read(meta_len).decode("utf-8"))
+
+        # --- VERSION ---
+        if version >= 4:
+            node.version = struct.unpack(">q", f.read(8))[0]
+        elif node.value is not None:
+            node.version = 1
+
+        node.children = cls._read_children(f, version)
+        return node
+
+    @classmethod
+    def _read_children(cls, f: io.BufferedReader, version: int = VERSION):
+        """
+        Read the children tail written by _write_children.
+        Returns a dict, a SortedChildren when the block flag marks a sorted
+        index, or a NumericColumn when a packed block follows.
+        """
+        children = {}
+
         # --- CHILDREN ---
         child_count = struct.unpack(">I", f.read(4))[0]
         for _ in range(child_count):
-            child = cls._read_node(f)
-            node.children[child.name] = child
+            child = cls._read_node(f, version)
+            children[child.name] = child
 
-        return node
+        # --- PACKED COLUMN ---
+        block = f.read(1) if version >= 2 else b"\x00"
+        if block == b"\x02":
+            return SortedChildren(children)
+        if block == b"\x01":
+            column = cls._read_column(f, version)
+            column.nodes = children
+
+            order = list(children) + column.names
+            if version >= 5 and f.read(1) == b"\x01":
+                positions = struct.unpack(f">{len(order)}I", f.read(4 * len(order)))
+                order = [order[i] for i in positions]
+            column.order = dict.fromkeys(order)
+            return column
+
+        return children
+
+
+def _max_version(node: Node) -> int:
+    """Highest version of `node` and every node below it."""
+    highest = node.version
+    children = node.children
+    if isinstance(children, NumericColumn):
+        if len(children.versions):
+            highest = max(highest, max(children.versions))
+        children = children.nodes
+    for child in children.values():
+        highest = max(highest, _max_version(child))
+    return highest
@@ -10,14 +10,21 @@ Developed & Maintained by Aditya Gaur, 2025
 import json
 import time
 import os
-from typing import Optional
+import threading
+import uuid
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from configx.core.errors import ConfigInvalidFormatError
+from configx.core.transaction import apply_entry
 
 
 class WriteAheadLog:
     """
     Append-only Write-Ahead Log for ConfigX.
 
-    Stores logical operations (SET / DELETE) to guarantee durability
+    Stores logical operations (SET / DELETE / MOVE / EXPIRE) to guarantee durability
     and enable crash recovery via replay.
     """
 
@@ -32,18 +39,34 @@ class WriteAheadLog:
         # ensure WAL file exists
         open(self.path, "a").close()
 
+        # serializes appends; fsync runs outside it so concurrent writers
+        # can share the disk flush
+        self._lock = threading.Lock()
+
+        # per-thread group() depth, "appended since the last fsync" flag and
+        # number of appended entries
+        self._local = threading.local()
+
+        # sync_later(): futures waiting for the next fsync, and the I/O
+        # thread that runs it (started on first use)
+        self._sync_cond = threading.Condition()
+        self._sync_waiting: List[Future] = []
+        self._syncer: Optional[threading.Thread] = None
+
     # ----------------------------
     # WAL WRITE
     # ----------------------------
 
-    def log_set(self, path: str, value):
+    def log_set(self, path: str, value, version: int):
         """
-        Generates WAL Log entry for SET command
+        Generates WAL Log entry for SET command.
+        `version` is the node version the write gets, restored on replay.
         """
         entry = {
             "op": "SET",
             "path": path,
             "value": value,
+            "version": version,
             "ts": int(time.time())
         }
         self._append(entry)
@@ -59,12 +82,141 @@ class WriteAheadLog:
         }
         self._append(entry)
 
-    def _append(self, entry: dict):
+    def log_move(self, src: str, dst: str):
+        """
+        Generates WAL Log entry for MOVE command
+        """
+        entry = {
+            "op": "MOVE",
+            "src": src,
+            "dst": dst,
+            "ts": int(time.time())
+        }
+        self._append(entry)
+
+    def log_expire(self, path: str, when):
+        """
+        Generates WAL Log entry for EXPIRE (TTL) command.
+        `at` is the absolute expiry time, null when the TTL is removed.
+        """
+        entry = {
+            "op": "EXPIRE",
+            "path": path,
+            "at": when,
+            "ts": int(time.time())
+        }
+        self._append(entry)
+
+    def log_transaction(self, entries: List[dict]):
+        """
+        Generates the WAL Log entries of a transaction: its mutations tagged
+        with a transaction id, then a COMMIT record. Written back to back and
+        fsynced once; replay skips a group whose COMMIT record is missing.
+        """
+        tx = uuid.uuid4().hex
+        ts = int(time.time())
+
+        group = [dict(entry, tx=tx, ts=ts) for entry in entries]
+        group.append({"op": "COMMIT", "tx": tx, "ts": ts})
+        self._append(*group)
+
+    def _append(self, *entries: dict):
+        lines = "".join(json.dumps(entry) + "\n" for entry in entries)
+
+        f = open(self.path, "a", encoding="utf-8")
+        try:
+            with self._lock:
+                f.write(lines)
+                f.flush()
+
+            self._local.appended = getattr(self._local, "appended", 0) + len(entries)
+
+            if getattr(self._local, "group_depth", 0):
+                self._local.unsynced = True  # synced once when the group ends
+            else:
+                os.fsync(f.fileno())  # durability guarantee
+        finally:
+            f.close()
+
+    @contextmanager
+    def group(self, sync: bool = True):
+        """
+        Group commit: entries appended by this thread inside the block are
+        written in order as usual, but fsynced once when the outermost group
+        ends instead of once per entry.
+
+        With sync=False the outermost group does not fsync at all; the caller
+        takes over durability, e.g. by waiting on sync_later().
+        """
+        depth = getattr(self._local, "group_depth", 0)
+        self._local.group_depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.group_depth = depth
+            if depth == 0 and getattr(self._local, "unsynced", False):
+                self._local.unsynced = False
+                if sync:
+                    self._sync()
+
+    def sync_later(self) -> Future:
+        """
+        Future that completes once every entry appended so far is fsynced.
+        The fsync runs on the WAL's I/O thread; requests that arrive while
+        one is in progress all share the next one.
+        """
+        future: Future = Future()
+        with self._sync_cond:
+            if self._syncer is None:
+                self._syncer = threading.Thread(
+                    target=self._sync_loop, name="configx-wal-sync", daemon=True,
+                )
+                self._syncer.start()
+
+            self._sync_waiting.append(future)
+            self._sync_cond.notify()
+        return future
+
+    def _sync_loop(self):
+        me = threading.current_thread()
+        while True:
+            with self._sync_cond:
+                # runs until close() replaces it, then drains what is left
+                while not self._sync_waiting and self._syncer is me:
+                    self._sync_cond.wait()
+                if not self._sync_waiting:
+                    return
+                waiting, self._sync_waiting = self._sync_waiting, []
+
+            try:
+                self._sync()
+            except BaseException as exc:
+                for future in waiting:
+                    future.set_exception(exc)
+            else:
+                for future in waiting:
+                    future.set_result(None)
+
+    def close(self):
+        """
+        Stop the I/O thread once pending sync_later() requests are served.
+        A later sync_later() starts it again.
+        """
+        with self._sync_cond:
+            syncer, self._syncer = self._syncer, None
+            self._sync_cond.notify_all()
+
+        if syncer is not None:
+            syncer.join()
+
+    def appended(self) -> int:
+        """Number of entries the calling thread has appended so far."""
+        return getattr(self._local, "appended", 0)
+
+    def _sync(self):
+        # fsync flushes the file itself, whichever descriptor wrote to it
         with open(self.path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry))
-            f.write("\n")
-            f.flush()
-            os.fsync(f.fileno())  # durability guarantee
+            os.fsync(f.fileno())
 
     # ----------------------------
     # WAL REPLAY
@@ -77,23 +229,42 @@ class WriteAheadLog:
         if not os.path.exists(self.path):
             return
 
-        with open(self.path, "r", encoding="utf-8") as f:
+        # transaction id -> its entries, applied once its COMMIT is read;
+        # groups still here at the end were never committed
+        pending: Dict[str, List[dict]] = {}
+        torn = None     # offset of a last line cut short by a crash mid-write
+        offset = 0
+
+        with open(self.path, "rb") as f:
             for line in f:
+                start, offset = offset, offset + len(line)
                 if not line.strip():
                     continue
 
-                entry = json.loads(line)
-                self._apply_entry(tree, entry)
+                if torn is not None:
+                    raise ConfigInvalidFormatError(f"Corrupt WAL entry at byte {torn}.")
+                try:
+                    entry = json.loads(line.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    torn = start
+                    continue
 
-    def _apply_entry(self, tree, entry: dict):
-        op = entry["op"]
+                tx = entry.get("tx")
+                if tx is None:
+                    self._apply_entry(tree, entry)
+                elif entry["op"] == "COMMIT":
+                    for staged in pending.pop(tx, ()):
+                        self._apply_entry(tree, staged)
+                else:
+                    pending.setdefault(tx, []).append(entry)
 
-        if op == "SET":
-            tree.set(entry["path"], entry["value"], _internal=True)
-        elif op == "DELETE":
-            tree.delete(entry["path"], _internal=True)
-        else:
-            raise ValueError(f"Unknown WAL operation: {op}")
+        # cut the partial line off, so later entries start on a line of their own
+        if torn is not None:
+            with self._lock, open(self.path, "r+b") as f:
+                f.truncate(torn)
+
+    def _apply_entry(self, tree, entry: dict):
+        apply_entry(tree, entry)
 
     # ----------------------------
     # WAL COMPACTION
@@ -103,4 +274,5 @@ class WriteAheadLog:
         """
         Clear WAL after snapshotting.
         """
-        open(self.path, "w").close()
+        with self._lock:
+            open(self.path, "w").close()
@@ -0,0 +1,124 @@
+"""
+ConfigX Testing Suite - test_accounting.py
+
+Tests for incremental per-subtree memory accounting and memory budgets
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import copy
+import random
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.core.accounting import MemoryAccounting
+from configx.core.errors import ConfigMemoryBudgetError
+from configx.runtime.configx import ConfigX
+
+
+def fresh_usage(t, path=None):
+    """
+    Counts from scratch on a deep copy, for comparison with the live
+    counters (a fork would share, and so overwrite, the live nodes).
+    """
+    other = ConfigTree()
+    other.root = copy.deepcopy(t.root)
+    MemoryAccounting(other)
+    node = other.root if path is None else other._walk(path)
+    return {"nodes": node.usage[0], "leaves": node.usage[1], "bytes": node.usage[2]}
+
+
+def test_counts_nodes_and_leaves():
+    t = ConfigTree()
+    t.set("app.ui.theme", "dark")
+    t.set("app.ui.font", 12)
+    t.set("app.name", "x")
+
+    usage = t.memory_usage("app")
+    assert usage["nodes"] == 5
+    assert usage["leaves"] == 3
+    assert t.memory_usage()["nodes"] == 6  # + root
+
+
+def test_incremental_matches_recount():
+    rng = random.Random(7)
+    t = ConfigTree()
+    t.enable_accounting()
+
+    for step in range(600):
+        a, b = rng.randrange(4), rng.randrange(80)
+        path = f"s{a}.k{b}"
+        roll = rng.random()
+        if roll < 0.6:
+            t.set(path, rng.choice([b, b * 1.5, "v" * (b % 7), True]))
+        elif roll < 0.8 and t._walk(path) is not None:
+            t.delete(path)
+        elif roll < 0.9 and t._walk(path) is not None:
+            dst = f"s{(a + 1) % 4}.m{step}"
+            t.move(path, dst)
+        else:
+            t.set(f"s{a}.d{b}.deep.x", step)
+
+    assert t.memory_usage() == fresh_usage(t)
+    for a in range(4):
+        if t._walk(f"s{a}") is not None:
+            assert t.memory_usage(f"s{a}") == fresh_usage(t, f"s{a}")
+
+
+def test_packed_columns_are_counted():
+    t = ConfigTree()
+    t.enable_accounting()
+    for i in range(200):
+        t.set(f"metrics.m{i}", i)
+
+    usage = t.memory_usage("metrics")
+    assert usage["leaves"] == 200
+    assert usage == fresh_usage(t, "metrics")
+
+    t.set("metrics.m3", "text")  # promoted out of the column
+    t.delete("metrics.m4")
+    assert t.memory_usage("metrics") == fresh_usage(t, "metrics")
+
+
+def test_budget_rejects_before_mutating():
+    t = ConfigTree()
+    t.set("a.b", 1)
+    t.enable_accounting(budget=t.memory_usage()["bytes"] + 200)
+
+    with pytest.raises(ConfigMemoryBudgetError):
+        t.set("big.new.branch", "x" * 1000)
+
+    assert t._walk("big") is None
+    assert t.memory_usage() == fresh_usage(t)
+
+
+def test_fresh_usage_leaves_live_counters_alone():
+    t = ConfigTree()
+    t.enable_accounting()
+    t.set("a.b", "x")
+    t._walk("a").usage[2] += 1   # simulated drift
+
+    assert t.memory_usage("a") != fresh_usage(t, "a")
+
+
+def test_budget_counts_the_value_being_replaced():
+    t = ConfigTree()
+    t.set("a.b", "x" * 1000)
+    t.enable_accounting(budget=t.memory_usage()["bytes"] + 100)
+
+    t.set("a.b", "y" * 1000)          # same size: fits
+    t.set("a.b", "small")             # shrinks: fits
+    with pytest.raises(ConfigMemoryBudgetError):
+        t.set("a.b", "z" * 2000)
+
+
+def test_stats_reports_heaviest_subtrees():
+    cfg = ConfigX()
+    cfg.resolve('small.a=1')
+    for i in range(20):
+        cfg.resolve(f'big.k{i}="{"x" * 50}"')
+
+    stats = cfg.stats(top=1)
+    assert list(stats["heaviest"]) == ["big"]
+    assert stats["heaviest"]["big"]["leaves"] == 20
+    assert stats["total"]["leaves"] == 21
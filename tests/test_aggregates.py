@@ -0,0 +1,161 @@
+"""
+ConfigX Testing Suite - test_aggregates.py
+
+Tests for !count/!sum/!min/!max and incrementally materialized aggregates
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import math
+import random
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.core.errors import ConfigQueryError
+from configx.qlang.interpreter import ConfigXQLInterpreter
+
+
+OPS = ("count", "sum", "min", "max")
+
+
+@pytest.fixture()
+def q():
+    tree = ConfigTree()
+    tree.load_dict({
+        "products": {
+            "p1": {"price": 10, "name": "a"},
+            "p2": {"price": 2.5},
+            "p3": {"name": "no price"},
+            "p4": {"price": "free"},
+        }
+    })
+    return ConfigXQLInterpreter(tree)
+
+
+def scanned(tree, path, field):
+    """The aggregates computed by a walk, with no materialized aggregate in the way."""
+    other = tree.fork()
+    return {op: other.aggregate(path, op, field=field) for op in OPS}
+
+
+def test_aggregate_functions(q):
+    assert q.execute("products!count") == 4
+    assert q.execute('products!count="price"') == 2
+    assert q.execute('products!sum="price"') == 12.5
+    assert q.execute("products!min=price") == 2.5
+    assert q.execute('products!max="price"') == 10
+
+
+def test_aggregate_over_own_values():
+    q = ConfigXQLInterpreter(ConfigTree())
+    q.execute("scores.a=3; scores.b=9; scores.c=\"x\"; scores.d.e=1")
+    assert q.execute("scores!count; scores!sum; scores!min; scores!max") == [4, 12, 3, 9]
+
+    q.execute("empty.x=\"a\"")
+    assert q.execute("empty!sum; empty!min") == [0, None]
+
+
+def test_aggregate_rejects_bad_argument(q):
+    with pytest.raises(ConfigQueryError):
+        q.execute("products!sum=3")
+
+
+def test_materialized_matches_scan_under_random_writes():
+    rng = random.Random(44)
+    t = ConfigTree()
+    for n in range(20):
+        t.set(f"products.p{n}.price", rng.randint(1, 100))
+
+    agg = t.create_aggregate("products", field="price")
+    assert t.create_aggregate("products", "price") is agg
+
+    for _ in range(500):
+        n = rng.randrange(30)
+        roll = rng.random()
+        if roll < 0.5:
+            node = t._walk(f"products.p{n}.price")
+            if node is not None and node.children:
+                t.delete(f"products.p{n}.price")
+            t.set(f"products.p{n}.price", rng.choice([rng.randint(-50, 50), rng.random() * 10, "n/a"]))
+        elif roll < 0.6:
+            t.set(f"products.p{n}.name", "x")
+        elif roll < 0.65:
+            # a counted leaf becomes a branch
+            t.set(f"products.p{n}.price.net", rng.randint(1, 9))
+        elif roll < 0.8:
+            t.delete(f"products.p{n}" if rng.random() < 0.5 else f"products.p{n}.price")
+        else:
+            src, dst = f"products.p{n}", f"archive.p{n}"
+            if roll >= 0.9:
+                src, dst = dst, src
+            if t._walk(src) is not None and t._walk(dst) is None:
+                t.move(src, dst)
+
+        expected = scanned(t, "products", "price")
+        for op in OPS:
+            got = t.aggregate("products", op, field="price")
+            assert got == pytest.approx(expected[op]) if got is not None else expected[op] is None
+
+
+def test_materialized_follows_resets_and_moves_of_the_node():
+    t = ConfigTree()
+    t.set("shop.products.p1.price", 5)
+    agg = t.create_aggregate("shop.products", field="price")
+
+    t.move("shop", "old_shop")
+    assert agg.result("sum") == 0 and agg.result("max") is None
+
+    t.move("old_shop", "shop")
+    assert agg.result("sum") == 5
+
+    t.load_dict({"shop": {"products": {"a": {"price": 1}, "b": {"price": 2}}}})
+    assert agg.result("sum") == 3
+    assert agg.result("count") == 2
+
+    t.drop_aggregate(agg)
+    assert t.aggregates == {}
+    t.set("shop.products.c.price", 10)
+    assert agg.result("sum") == 3
+    assert t.aggregate("shop.products", "sum", field="price") == 13
+
+
+def test_materialized_over_packed_column():
+    t = ConfigTree()
+    for n in range(64):
+        t.set(f"metrics.m{n}", n)
+
+    agg = t.create_aggregate("metrics")
+    t.set("metrics.m3", 1000)
+    t.delete("metrics.m0")
+
+    assert agg.result("max") == 1000
+    assert agg.result("min") == 1
+    assert agg.result("sum") == sum(range(64)) - 3 + 1000
+    assert t.fork().aggregate("metrics", "sum") == agg.result("sum")
+
+
+def test_materialized_sum_stays_exact_across_magnitudes():
+    t = ConfigTree()
+    t.set("p.a.price", 1e20)
+    t.set("p.b.price", 1.0)
+    agg = t.create_aggregate("p", field="price")
+
+    t.delete("p.a")
+    assert agg.result("sum") == 1.0
+
+    t.set("p.c.price", 0.1)
+    t.set("p.d.price", 0.2)
+    t.set("p.e.price", 2 ** 62)
+    t.delete("p.e")
+    assert agg.result("sum") == math.fsum([1.0, 0.1, 0.2])
+
+    t.delete("p.b")
+    t.delete("p.c")
+    t.delete("p.d")
+    assert agg.result("sum") == 0 and isinstance(agg.result("sum"), int)
+
+    t.set("p.f.price", 3)
+    t.set("p.g.price", float("inf"))
+    assert agg.result("sum") == math.inf
+    t.delete("p.g")
+    assert agg.result("sum") == 3
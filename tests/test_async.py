@@ -0,0 +1,156 @@
+"""
+ConfigX Testing Suite - test_async.py
+
+Tests for the asyncio API (aresolve / aupdate / aclose) and the WAL's
+off-loop fsync
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import pytest
+
+from configx import ConfigX
+from configx.core.errors import ConfigPathNotFoundError
+
+
+@pytest.fixture()
+def storage_dir():
+    tmpdir = tempfile.mkdtemp()
+    yield tmpdir
+    shutil.rmtree(tmpdir)
+
+
+def count_fsyncs(monkeypatch, delay: float = 0.0):
+    """Record the thread of every fsync, optionally making each one slow."""
+    threads = []
+    fsync = os.fsync
+
+    def recording_fsync(fd):
+        threads.append(threading.current_thread())
+        time.sleep(delay)
+        fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", recording_fsync)
+    return threads
+
+
+def test_in_memory_runtime():
+    async def main():
+        cfg = ConfigX()
+        await cfg.aupdate("app.ui.theme", "dark")
+        assert await cfg.aresolve("app.ui.theme") == "dark"
+        assert await cfg.aresolve('app.ui.font=12; app.ui.font') == [12, 12]
+        await cfg.aclose()
+
+    asyncio.run(main())
+
+
+def test_writes_fsync_off_the_event_loop(storage_dir, monkeypatch):
+    threads = count_fsyncs(monkeypatch)
+
+    async def main():
+        cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+        await cfg.aresolve('app.ui.theme="dark"')
+        await cfg.aupdate("app.ui.font", 12)
+        await cfg.aresolve("app.ui.theme")
+        return cfg
+
+    cfg = asyncio.run(main())
+    assert threads
+    assert all(t.name == "configx-wal-sync" for t in threads)
+    cfg.close()
+
+
+def test_reads_do_not_fsync(storage_dir, monkeypatch):
+    async def main():
+        cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+        await cfg.aupdate("a.b", 1)
+        threads = count_fsyncs(monkeypatch)
+
+        assert await cfg.aresolve("a.b") == 1
+        assert await cfg.aresolve("a.missing!") is None
+        assert threads == []
+        await cfg.aclose()
+
+    asyncio.run(main())
+
+
+def test_concurrent_writers_share_fsyncs(storage_dir, monkeypatch):
+    async def main():
+        cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+        threads = count_fsyncs(monkeypatch, delay=0.05)
+
+        await asyncio.gather(*(cfg.aupdate(f"users.u{i}.score", i) for i in range(50)))
+        await cfg.aclose()
+        return len(threads)
+
+    fsyncs = asyncio.run(main())
+    assert fsyncs <= 3  # first writer's fsync, then one for everybody else
+
+
+def test_event_loop_keeps_running_during_fsync(storage_dir, monkeypatch):
+    async def main():
+        cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+        count_fsyncs(monkeypatch, delay=0.2)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await cfg.aupdate("a.b", 1)
+        task.cancel()
+        await cfg.aclose()
+        return ticks
+
+    assert asyncio.run(main()) >= 5
+
+
+def test_async_writes_survive_restart(storage_dir):
+    async def main():
+        cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+        await cfg.aresolve('app.ui.theme="dark"; app.ui.font=12')
+        await cfg.aupdate("app.ui.scale", 1.5)
+        await cfg.aclose()
+
+    asyncio.run(main())
+
+    cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+    assert cfg.resolve("app.ui") == {"theme": "dark", "font": 12, "scale": 1.5}
+    cfg.close()
+
+
+def test_failed_script_still_syncs_what_it_applied(storage_dir, monkeypatch):
+    async def main():
+        cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+        threads = count_fsyncs(monkeypatch)
+
+        with pytest.raises(ConfigPathNotFoundError):
+            await cfg.aresolve("a.b=1; a.missing")
+        assert len(threads) == 1
+        await cfg.aclose()
+
+    asyncio.run(main())
+
+
+def test_wal_syncer_restarts_after_close(storage_dir):
+    cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+    wal = cfg._storage.wal
+
+    wal.sync_later().result(timeout=5)
+    wal.close()
+    assert wal._syncer is None
+
+    wal.sync_later().result(timeout=5)
+    cfg.close()
+    assert wal._syncer is None
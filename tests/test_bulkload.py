@@ -0,0 +1,185 @@
+"""
+ConfigX Testing Suite - test_bulkload.py
+
+Tests for the streaming JSON reader and the bulk-load path behind
+ConfigX.load_json
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import json
+import os
+import random
+import shutil
+import tempfile
+
+import pytest
+
+from configx import ConfigX
+from configx.core.columnar import NumericColumn
+from configx.core.node import Node
+from configx.core.errors import ConfigInvalidFormatError, ConfigNodeStructureError
+from configx.core.tree import ConfigTree
+from configx.storage.bulkload import iter_json_nodes
+
+
+@pytest.fixture()
+def tmpdir():
+    path = tempfile.mkdtemp()
+    yield path
+    shutil.rmtree(path)
+
+
+def write_json(tmpdir, data, name="data.json", **kwargs):
+    path = os.path.join(tmpdir, name)
+    with open(path, "w", encoding="utf-8") as f:
+        if isinstance(data, str):
+            f.write(data)
+        else:
+            json.dump(data, f, **kwargs)
+    return path
+
+
+def random_document(rng, depth=4):
+    if depth == 0 or rng.random() < 0.3:
+        return rng.choice([7, -2.5, 1e-7, 12345678901234567890, "dark", 'q"uote', "ü", True, [1, {"a": 2}]])
+    return {f"k{i}": random_document(rng, depth - 1) for i in range(rng.randrange(0, 12))}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 16, 1 << 20])
+def test_stream_matches_json_load(tmpdir, chunk_size):
+    rng = random.Random(chunk_size)
+    for indent in (None, 2):
+        data = {f"top{i}": random_document(rng) for i in range(5)}
+        path = write_json(tmpdir, data, indent=indent, ensure_ascii=False)
+
+        tree = ConfigTree()
+        tree.bulk_load(iter_json_nodes(path, chunk_size=chunk_size))
+
+        expected = ConfigTree()
+        expected.load_dict(data)
+        assert tree.to_dict() == expected.to_dict()
+
+
+@pytest.mark.parametrize("text", ["[1, 2]", '{"a": 1', '{"a" 1}', '{"a": 1} x', '{1: 2}', '{"a": tru}'])
+def test_invalid_documents(tmpdir, text):
+    path = write_json(tmpdir, text)
+    with pytest.raises(ConfigInvalidFormatError):
+        list(iter_json_nodes(path, chunk_size=2))
+
+
+@pytest.mark.parametrize("chunk_size", [2, 1 << 20])
+def test_dotted_keys_are_keypaths(tmpdir, chunk_size):
+    path = write_json(tmpdir, {
+        "a.b": 1,
+        "a": {"c": 2, "d.e": {"f": 3}},
+        "a.d": {"g": 4},
+        "x": {"y.z": [1, {"k.v": 2}]},
+    })
+    tree = ConfigTree()
+    tree.bulk_load(iter_json_nodes(path, chunk_size=chunk_size))
+
+    assert tree.to_dict() == {
+        "a": {"b": 1, "c": 2, "d": {"e": {"f": 3}, "g": 4}},
+        "x": {"y": {"z": [1, {"k.v": 2}]}},
+    }
+    assert tree.get("a.d.e.f") == 3
+
+
+@pytest.mark.parametrize("text", ['{"": 1}', '{"a": {".": 1}}'])
+def test_empty_keys_are_rejected(tmpdir, text):
+    path = write_json(tmpdir, text)
+    with pytest.raises(ConfigInvalidFormatError):
+        ConfigTree().bulk_load(iter_json_nodes(path))
+
+
+def test_numeric_siblings_are_packed(tmpdir):
+    path = write_json(tmpdir, {"metrics": {f"m{i}": i for i in range(100)}})
+    tree = ConfigTree()
+    tree.bulk_load(iter_json_nodes(path, chunk_size=64))
+
+    assert isinstance(tree.root.children["metrics"].children, NumericColumn)
+    assert tree.get("metrics.m42") == 42
+    assert tree.aggregate("metrics", "sum") == sum(range(100))
+
+
+def test_bulk_load_merges_into_the_tree():
+    tree = ConfigTree()
+    tree.set("app.ui.theme", "light")
+    tree.set("app.ui.font", 12)
+    tree.set("app.name", "x")
+    view = tree.pin()
+
+    tree.bulk_load(Node.from_primitive(k, v) for k, v in {
+        "app": {"ui": {"theme": "dark"}, "name": {"first": "x"}},
+        "users": {},
+    }.items())
+
+    assert tree.to_dict() == {
+        "app": {"ui": {"theme": "dark", "font": 12}, "name": {"first": "x"}},
+        "users": {},
+    }
+    # pinned versions are untouched
+    assert view.get("app.ui.theme") == "light"
+
+
+def test_bulk_load_is_all_or_nothing():
+    tree = ConfigTree()
+    tree.set("app.ui.theme", "light")
+
+    with pytest.raises(ConfigNodeStructureError):
+        tree.bulk_load(Node.from_primitive(k, v) for k, v in {
+            "other": {"a": 1},
+            "app": {"ui": "flat"},
+        }.items())
+
+    assert tree.to_dict() == {"app": {"ui": {"theme": "light"}}}
+
+
+def test_listeners_see_the_loaded_data():
+    tree = ConfigTree()
+    index = tree.create_index(key="theme")
+    tree.bulk_load([Node.from_primitive("ui", {"a": {"theme": "dark"}})])
+
+    assert tree.search("ui", "theme", "==", "dark") == ["ui.a.theme"]
+    assert index is tree.indexes[0]
+
+
+def test_load_json_nested_document(tmpdir):
+    path = write_json(tmpdir, {"app": {"ui": {"theme": "dark", "font": 12}}, "flags": {"beta": True}})
+
+    cfg = ConfigX(load_json=path)
+    assert cfg.resolve("app.ui.theme") == "dark"
+    assert cfg.resolve("flags.beta") is True
+
+
+def test_persistent_load_is_one_checkpoint(tmpdir, monkeypatch):
+    path = write_json(tmpdir, {"users": {f"u{i}": {"score": i, "name": f"n{i}"} for i in range(500)}})
+    storage = os.path.join(tmpdir, "store")
+
+    cfg = ConfigX(persistent=True, storage_dir=storage)
+    fsyncs = []
+    fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: fsyncs.append(fd) or fsync(fd))
+
+    assert cfg.load_json(path) == 1
+    assert fsyncs == []
+    assert os.path.getsize(os.path.join(storage, "wal.cx")) == 0
+    cfg.close()
+
+    cfg = ConfigX(persistent=True, storage_dir=storage)
+    assert cfg.resolve("users.u499.name") == "n499"
+    cfg.close()
+
+
+def test_persistent_load_of_json_values(tmpdir):
+    data = {"app": {"tags": ["a", "b"], "rules": [{"k": 1}, None], "big": 12345678901234567890, "empty": []}}
+    path = write_json(tmpdir, data)
+    storage = os.path.join(tmpdir, "store")
+
+    cfg = ConfigX(persistent=True, storage_dir=storage)
+    cfg.load_json(path)
+    cfg.close()
+
+    cfg = ConfigX(persistent=True, storage_dir=storage)
+    assert cfg.dump() == data
+    cfg.close()
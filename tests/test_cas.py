@@ -0,0 +1,171 @@
+"""
+ConfigX Testing Suite - test_cas.py
+
+Tests for per-node versions and compare-and-set
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import os
+import shutil
+import tempfile
+import threading
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.storage.runtime import StorageRuntime
+from configx.qlang.interpreter import ConfigXQLInterpreter
+
+
+@pytest.fixture()
+def temp_storage():
+    tmpdir = tempfile.mkdtemp()
+    yield os.path.join(tmpdir, "state.snapshot"), os.path.join(tmpdir, "state.wal")
+    shutil.rmtree(tmpdir)
+
+
+def test_versions_are_tree_revisions():
+    t = ConfigTree()
+    assert t.version("a.b") == 0
+
+    t.set("a.b", 1)
+    t.set("x", 1)
+    t.set("a.b", 1)
+    t.set("a.b", "x")
+    assert t.version("a.b") == 4
+    assert t.version("x") == 2
+    assert t.version("a") == 0
+    assert t.revision == 4
+
+
+def test_versions_of_packed_leaves():
+    t = ConfigTree()
+    for i in range(100):
+        t.set(f"m.k{i}", i)
+    t.set("m.k5", 50)                        # in-place column write
+    assert t.version("m.k5") == 101
+
+    t.set("m.k5", "text")                    # promoted out of the column
+    assert t.version("m.k5") == 102
+
+    t.delete("m.k0")                         # swap-remove keeps the others right
+    assert t.version("m.k99") == 100
+
+
+def test_recreated_node_never_reuses_a_version():
+    t = ConfigTree()
+    t.set("c.x", 1)
+    t.delete("c.x")
+    t.set("c.x", 2)
+    assert not t.compare_and_set("c.x", 1, 3)
+    assert t.get("c.x") == 2
+
+    # same for loads, packed leaves and forks
+    seen = t.version("c.x")
+    t.load_dict({"c": {"x": 2}})
+    assert not t.compare_and_set("c.x", seen, 3)
+
+    for i in range(70):
+        t.set(f"m.k{i}", i)
+    seen = t.version("m.k3")
+    t.delete("m.k3")
+    t.set("m.k3", 3)
+    assert not t.compare_and_set("m.k3", seen, 4)
+
+    fork = t.fork()
+    fork.set("f", 1)
+    t.set("f", 1)
+    assert fork.version("f") != t.version("f")
+
+
+def test_compare_and_set_by_version_and_value():
+    t = ConfigTree()
+    assert t.compare_and_set("c.n", 0, 1)        # 0 = create only
+    assert not t.compare_and_set("c.n", 0, 1)
+
+    assert not t.compare_and_set("c.n", 5, 2)
+    assert t.compare_and_set("c.n", 1, 2)
+    assert t.get("c.n") == 2
+
+    assert not t.compare_and_set("c.n", 1, 3, by_value=True)
+    assert t.compare_and_set("c.n", 2, 3, by_value=True)
+    assert not t.compare_and_set("c.n", True, 4, by_value=True)
+    assert t.get("c.n") == 3
+
+
+def test_concurrent_increments_lose_nothing():
+    t = ConfigTree()
+    t.set("stats.hits", 0)
+
+    def worker():
+        for _ in range(200):
+            while True:
+                seen = t.version("stats.hits")
+                if t.compare_and_set("stats.hits", seen, t.get("stats.hits") + 1):
+                    break
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+
+    assert t.get("stats.hits") == 800
+    assert t.version("stats.hits") == t.revision == 801
+
+
+def test_versions_survive_wal_and_snapshot(temp_storage):
+    snapshot, wal = temp_storage
+
+    runtime = StorageRuntime(snapshot, wal)
+    tree = ConfigTree(runtime=runtime)
+    runtime.start(tree)
+    for i in range(3):
+        tree.set("job.cursor", i)
+    for i in range(80):
+        tree.set(f"m.k{i}", i)
+    tree.set("m.k7", 70)
+    assert not tree.compare_and_set("job.cursor", 1, 9)
+    cursor, k7 = tree.version("job.cursor"), tree.version("m.k7")
+
+    tree2 = ConfigTree(runtime=StorageRuntime(snapshot, wal))
+    tree2.runtime.start(tree2)
+    assert tree2.version("job.cursor") == cursor
+    assert tree2.revision == tree.revision
+
+    runtime.checkpoint(tree)
+    tree3 = ConfigTree(runtime=StorageRuntime(snapshot, wal))
+    tree3.runtime.start(tree3)
+    assert tree3.version("job.cursor") == cursor
+    assert tree3.version("m.k7") == k7
+    assert tree3.compare_and_set("job.cursor", cursor, 10)
+
+
+def test_revision_survives_deletes_across_restarts(temp_storage):
+    snapshot, wal = temp_storage
+
+    runtime = StorageRuntime(snapshot, wal)
+    tree = ConfigTree(runtime=runtime)
+    runtime.start(tree)
+    tree.set("c.x", 1)
+    seen = tree.version("c.x")
+    tree.delete("c.x")
+    runtime.checkpoint(tree)                 # the snapshot holds no node at all
+
+    tree2 = ConfigTree(runtime=StorageRuntime(snapshot, wal))
+    tree2.runtime.start(tree2)
+    tree2.set("c.x", 2)
+    assert not tree2.compare_and_set("c.x", seen, 3)
+
+
+def test_ql_conditional_set():
+    t = ConfigTree()
+    q = ConfigXQLInterpreter(t)
+
+    assert q.execute("jobs.state@0=\"idle\"") is True
+    assert q.execute("jobs.state!version") == 1
+    assert q.execute("jobs.state@0=\"busy\"") is False
+    assert q.execute('jobs.state?"idle"="busy"') is True
+    assert q.execute('jobs.state?"idle"="done"') is False
+    assert q.execute("jobs.state@2=\"done\"") is True
+    assert t.get("jobs.state") == "done"
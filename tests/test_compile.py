@@ -0,0 +1,77 @@
+"""
+ConfigX Testing Suite - test_compile.py
+
+Tests for ConfigXQL statements compiled into closures
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.core.errors import ConfigPathNotFoundError, ConfigQueryError
+from configx.qlang.interpreter import ConfigXQLInterpreter
+
+
+@pytest.fixture
+def q():
+    return ConfigXQLInterpreter(ConfigTree())
+
+
+def test_compiled_statements_run_against_the_tree(q):
+    q.compile('app.ui.theme="dark"')()
+    assert q.compile("app.ui.theme")() == "dark"
+    assert q.compile("app.ui.missing!")() is None
+
+    with pytest.raises(ConfigPathNotFoundError):
+        q.compile("app.ui.missing")()
+
+    assert q.compile("app.ui.theme-")() is True
+    assert q.compile("app.ui.theme-")() is False
+
+
+def test_repeated_queries_reuse_the_compiled_form(q):
+    calls = []
+    compilers = q._compilers
+    for node_type, compiler in list(compilers.items()):
+        compilers[node_type] = lambda node, c=compiler: calls.append(node) or c(node)
+
+    for i in range(5):
+        q.execute(f"a.b={i}")
+        assert q.execute("a.b") == i
+
+    # one compile per distinct query text
+    assert len(calls) == 6
+    assert q.compile("a.b") is q.compile("a.b")
+
+
+def test_compiled_reads_see_later_writes(q):
+    read = q.compile("a.b")
+    q.execute("a.b=1")
+    assert read() == 1
+    q.execute("a.b=2")
+    assert read() == 2
+
+
+def test_compiled_wildcards_scripts_and_functions(q):
+    q.execute("users.u1.score=1; users.u2.score=2")
+
+    assert q.compile("users.[.].score")() == {"users.u1.score": 1, "users.u2.score": 2}
+    assert q.compile("users!sum=score")() == 3
+    assert q.compile("users.[.].score=0; users.u1.score")() == [2, 0]
+
+
+def test_invalid_statements_fail_when_compiled(q):
+    with pytest.raises(ConfigQueryError):
+        q.compile("a.b!nope")
+    with pytest.raises(ConfigQueryError):
+        q.compile("a.[.]@0=1")
+
+    # failures are not cached
+    assert len(q.cache) == 0
+
+
+def test_prepared_statements_without_parameters_compile_once(q):
+    stmt = q.prepare("a.b=1")
+    assert stmt() == 1
+    assert stmt._run is not None
+    assert q.execute("a.b") == 1
@@ -0,0 +1,131 @@
+"""
+ConfigX Testing Suite - test_explain.py
+
+Tests for EXPLAIN / EXPLAIN ANALYZE plans and per-query execution stats
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.core.errors import ConfigQueryError
+from configx.storage.runtime import StorageRuntime
+from configx.qlang.interpreter import ConfigXQLInterpreter
+from configx.runtime.configx import ConfigX
+
+
+@pytest.fixture()
+def q():
+    intp = ConfigXQLInterpreter(ConfigTree(), collect_stats=True)
+    for n in range(20):
+        intp.execute(f'users.u{n}.score={n}; users.u{n}.theme="dark"')
+    intp.stats.clear()
+    return intp
+
+
+def test_explain_does_not_execute(q):
+    plan = q.execute("EXPLAIN users.u1-")
+    assert plan == {"statement": "delete", "access": "walk", "path": "users.u1", "visits": 2, "wal_records": 0}
+    assert q.tree.get("users.u1.score") == 1
+
+
+def test_explain_prefix_does_not_shadow_keys(q):
+    q.execute("EXPLAIN=1")
+    assert q.execute("EXPLAIN") == 1
+
+    q.execute("explain = 5")
+    assert q.execute("explain !") == 5
+    q.execute("explain -")
+    assert q.execute("explain !") is None
+
+
+@pytest.mark.parametrize("query", ["EXPLAIN EXPLAIN users.u1", "EXPLAIN ANALYZE EXPLAIN users.u1"])
+def test_nested_explain_is_rejected(q, query):
+    with pytest.raises(ConfigQueryError):
+        q.execute(query)
+
+
+def test_wildcard_estimate(q):
+    plan = q.execute("EXPLAIN users.[.].score")
+    assert plan["access"] == "wildcard-scan"
+    assert plan["visits"] == 1 + 20 * 2
+
+
+def test_search_uses_existing_indexes(q):
+    assert q.execute('EXPLAIN users!search="theme==dark"')["access"] == "scan"
+
+    q.tree.create_index(key="theme")
+    plan = q.execute('EXPLAIN users!search="theme==dark"')
+    assert plan["access"] == "index"
+    assert plan["index"] == "key=theme"
+
+    assert q.execute('EXPLAIN users!search="dark"')["access"] == "scan"
+    q.tree.create_text_index()
+    assert q.execute('EXPLAIN users!search="dark"')["access"] == "text-index"
+
+
+def test_aggregate_plans(q):
+    assert q.execute('EXPLAIN users!sum="score"')["access"] == "aggregate-scan"
+    q.tree.create_aggregate("users", field="score")
+    assert q.execute('EXPLAIN users!sum="score"')["access"] == "materialized-aggregate"
+
+
+def test_explain_analyze_measures_the_run(q):
+    plan = q.execute("EXPLAIN ANALYZE users.[.].score")
+    assert plan["result"]["users.u3.score"] == 3
+    assert plan["actual"]["visits"] >= 41
+    assert plan["actual"]["elapsed_ms"] >= 0
+
+
+@pytest.mark.parametrize("query, visits", [
+    # users, 20 children, and their 40 leaves / 20 score fields / nothing
+    ('users!search="score>10"', 61),
+    ('users!search="dark"', 61),
+    ('users!sum="score"', 41),
+    ("users!max", 21),
+])
+def test_explain_analyze_counts_scanned_nodes(q, query, visits):
+    plan = q.execute(f"EXPLAIN ANALYZE {query}")
+    assert plan["visits"] == plan["actual"]["visits"] == visits
+
+
+def test_script_plan_and_wal_estimates():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        runtime = StorageRuntime(os.path.join(tmpdir, "s.cx"), os.path.join(tmpdir, "w.cx"))
+        tree = ConfigTree(runtime=runtime)
+        runtime.start(tree)
+        q = ConfigXQLInterpreter(tree)
+        q.execute("a.x=1; a.y=2")
+
+        plan = q.execute("EXPLAIN a.z=3; a.[.]=0; missing-")
+        assert [step["wal_records"] for step in plan["steps"]] == [1, 2, 0]
+        assert plan["wal_records"] == 3
+
+        actual = q.execute("EXPLAIN ANALYZE a.z=3; a.[.]=0; missing-")["actual"]
+        assert actual["wal_records"] == 4  # a.z exists by now
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_query_stats(q):
+    q.execute("users.u1.score")
+    q.execute("users.u1.score")
+    q.execute("users.[.].theme")
+
+    stats = q.stats.snapshot()
+    assert stats["users.u1.score"]["calls"] == 2
+    assert stats["users.u1.score"]["visits"] == 6
+    assert stats["users.[.].theme"]["visits"] > 20
+
+
+def test_configx_explain_and_stats():
+    confx = ConfigX(collect_query_stats=True)
+    confx.resolve("app.theme=\"dark\"")
+    assert confx.explain("app.theme")["access"] == "walk"
+    assert confx.query_stats()['app.theme="dark"']["calls"] == 1
+    assert ConfigX().query_stats() == {}
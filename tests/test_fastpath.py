@@ -0,0 +1,89 @@
+"""
+ConfigX Testing Suite - test_fastpath.py
+
+Differential tests: the hand-written fast-path scanner against the Lark grammar
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import itertools
+
+import pytest
+from lark.exceptions import LarkError
+
+from configx.qlang.fastpath import scan
+from configx.qlang.parser import ConfigXQLParser, get_lark, GetNode, SetNode, DeleteNode
+
+
+PATHS = ["a", "a.b.c", "_x.y_1", "true", "app.false.x", "a . b", " a.b ", "a..b", "1a", "a.", ".a", "a.$p"]
+
+VALUES = [
+    '"dark"', '""', '"a b"', '"with \\"quote\\""', '"back\\\\slash"', '"unterminated',
+    "true", "false", "TRUE", "False", "true_x", "truex",
+    "0", "42", "-7", "+3", "007",
+    "1.5", "-0.25", "1.", ".5", "+.5e3", "1e3", "2E-2", "1.e5", ".", "1.2.3", "e3",
+    "dark", "$v", "[1]", "",
+]
+
+SUFFIXES = ["", "!", "-", "?", "!ttl", "!move=b", "@3=1"]
+
+
+def queries():
+    for path in PATHS:
+        for suffix in SUFFIXES:
+            yield path + suffix
+        for value in VALUES:
+            for eq in ("=", " = ", "=\t"):
+                yield path + eq + value
+    yield ""
+    yield "   "
+    yield "a.b\n"
+    yield "\ta.b!\n"
+    yield "a.b=1 "
+
+
+def lark_parse(query):
+    try:
+        return get_lark().parse(query)
+    except LarkError:
+        return None
+
+
+@pytest.mark.parametrize("query", sorted(set(queries())))
+def test_scan_agrees_with_grammar(query):
+    fast = scan(query)
+    slow = lark_parse(query)
+
+    if fast is not None:
+        assert fast == slow
+        assert type(fast.value if isinstance(fast, SetNode) else None) is \
+            type(slow.value if isinstance(slow, SetNode) else None)
+    elif slow is not None:
+        # the scanner may decline valid input, but only forms outside its scope
+        assert not isinstance(slow, (GetNode, DeleteNode)) or "$" in query or "\n" in query
+
+
+def test_scan_covers_plain_statements():
+    assert scan("a.b.c") == GetNode(path=("a", "b", "c"), safe=False)
+    assert scan("a.b!") == GetNode(path=("a", "b"), safe=True)
+    assert scan("a.b-") == DeleteNode(path=("a", "b"))
+    assert scan('a.b="x"') == SetNode(path=("a", "b"), value="x")
+    assert scan("a=-1.5e2") == SetNode(path=("a",), value=-150.0)
+    assert scan("a=false") == SetNode(path=("a",), value=False)
+
+
+def test_scan_declines_everything_else():
+    for query in ("a!move=b", "a?1=2", "a@1=2", "a!ttl=5", "a.$p=1", "a=", "a=b"):
+        assert scan(query) is None
+
+
+def test_parser_uses_fast_path_only_when_enabled(monkeypatch):
+    calls = []
+    lark = get_lark()
+    monkeypatch.setattr(lark, "parse", lambda q: calls.append(q))
+
+    ConfigXQLParser().parse("a.b=1")
+    assert calls == []
+
+    ConfigXQLParser().parse("a!ttl")
+    ConfigXQLParser(fast_path=False).parse("a.b=1")
+    assert calls == ["a!ttl", "a.b=1"]
@@ -0,0 +1,156 @@
+"""
+ConfigX Testing Suite - test_index.py
+
+Tests for secondary value indexes and !search
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.storage.runtime import StorageRuntime
+from configx.qlang.interpreter import ConfigXQLInterpreter
+
+
+def populate(t):
+    for i in range(6):
+        t.set(f"agents.a{i}.theme", "dark" if i % 2 else "light")
+        t.set(f"agents.a{i}.score", i * 10)
+    t.set("ui.theme", "dark")
+
+
+@pytest.mark.parametrize("declare", [None, {"key": "theme"}, {"pattern": "**.theme"}])
+def test_search_same_with_or_without_index(declare):
+    t = ConfigTree()
+    if declare:
+        t.create_index(**declare)
+    populate(t)
+
+    assert t.search(None, "theme", "==", "dark") == [
+        "agents.a1.theme", "agents.a3.theme", "agents.a5.theme", "ui.theme",
+    ]
+    assert t.search("agents", "theme", "==", "dark") == [
+        "agents.a1.theme", "agents.a3.theme", "agents.a5.theme",
+    ]
+
+
+def test_index_is_used_and_maintained():
+    t = ConfigTree()
+    populate(t)
+    index = t.create_index(key="theme")
+
+    assert t.find_index("theme", "agents") is index
+    assert len(index) == 7
+
+    t.set("agents.a0.theme", "dark")
+    t.delete("agents.a1")
+    t.move("agents.a3", "archive.a3")
+
+    assert sorted(index.lookup("==", "dark")) == [
+        "agents.a0.theme", "agents.a5.theme", "archive.a3.theme", "ui.theme",
+    ]
+
+    t.load_dict({"x": {"theme": "dark"}})
+    assert index.lookup("==", "dark") == {"x.theme"}
+
+
+def test_range_lookups():
+    t = ConfigTree()
+    index = t.create_index(pattern="agents.*.score")
+    populate(t)
+    t.set("agents.a9.score", 25.5)
+
+    plain = ConfigTree()
+    populate(plain)
+    plain.set("agents.a9.score", 25.5)
+
+    calls = []
+    lookup = index.lookup
+    index.lookup = lambda op, value: calls.append(op) or lookup(op, value)
+
+    assert t.find_index("score", "agents") is index
+    assert t.search("agents", "score", ">=", 30) == [
+        "agents.a3.score", "agents.a4.score", "agents.a5.score",
+    ]
+    assert t.search("agents", "score", "<", 20) == ["agents.a0.score", "agents.a1.score"]
+    assert t.search("agents", "score", "==", 20.0) == ["agents.a2.score"]
+
+    for path in (None, "agents", "agents.a2"):
+        for op, value in (("==", 20), ("!=", 20), (">", 20), (">=", 25.5), ("<", 40), ("<=", 0)):
+            assert t.search(path, "score", op, value) == plain.search(path, "score", op, value)
+
+    assert len(calls) == 21
+
+
+def test_pattern_index_coverage():
+    t = ConfigTree()
+    star = t.create_index(pattern="agents.*.score")
+    deep = t.create_index(pattern="users.**.age")
+
+    assert t.find_index("score") is star
+    assert t.find_index("score", "agents.a1") is star
+    assert t.find_index("score", "agents.a1.score") is None
+    assert t.find_index("score", "users") is None
+    assert t.find_index("age", "users.u1") is deep
+    assert t.find_index("age") is None
+
+
+def test_index_follows_wal_replay():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        snapshot, wal = os.path.join(tmpdir, "s"), os.path.join(tmpdir, "w")
+        runtime = StorageRuntime(snapshot, wal)
+        tree = ConfigTree(runtime=runtime)
+        runtime.start(tree)
+        populate(tree)
+
+        runtime2 = StorageRuntime(snapshot, wal)
+        tree2 = ConfigTree(runtime=runtime2)
+        index = tree2.create_index(key="theme")
+        runtime2.start(tree2)
+    finally:
+        shutil.rmtree(tmpdir)
+
+    assert len(index.lookup("==", "light")) == 3
+
+
+def test_index_follows_snapshot_recovery():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        snapshot, wal = os.path.join(tmpdir, "s"), os.path.join(tmpdir, "w")
+        runtime = StorageRuntime(snapshot, wal)
+        tree = ConfigTree(runtime=runtime)
+        runtime.start(tree)
+        populate(tree)
+        runtime.shutdown(tree)
+
+        runtime2 = StorageRuntime(snapshot, wal)
+        tree2 = ConfigTree(runtime=runtime2)
+        index = tree2.create_index(key="theme")
+        total = tree2.create_aggregate("agents", "score")
+        runtime2.start(tree2)
+        runtime2.shutdown(tree2)
+    finally:
+        shutil.rmtree(tmpdir)
+
+    assert len(index.lookup("==", "light")) == 3
+    assert tree2.search("agents", "theme", "==", "dark") == [
+        "agents.a1.theme", "agents.a3.theme", "agents.a5.theme",
+    ]
+    assert total.result("sum") == 150
+
+
+def test_search_via_configxql():
+    t = ConfigTree()
+    t.create_index(key="theme")
+    populate(t)
+    intp = ConfigXQLInterpreter(t)
+
+    assert intp.execute('agents!search="theme==light"') == [
+        "agents.a0.theme", "agents.a2.theme", "agents.a4.theme",
+    ]
+    assert intp.execute('agents!search="score>40"') == ["agents.a5.score"]
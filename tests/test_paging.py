@@ -0,0 +1,121 @@
+"""
+ConfigX Testing Suite - test_paging.py
+
+Tests for spilling cold subtrees to a page file
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import os
+import tempfile
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.storage.pager import PagedChildren
+from configx.storage.snapshot import SnapshotStore
+
+
+@pytest.fixture
+def workdir():
+    with tempfile.TemporaryDirectory() as d:
+        yield d
+
+
+def populate(t, agents=10):
+    for i in range(agents):
+        t.set(f"agents.a{i}.name", f"agent-{i}")
+        t.set(f"agents.a{i}.memory.turns", i)
+        for j in range(70):  # enough to pack a numeric column
+            t.set(f"agents.a{i}.scores.s{j}", j * i)
+
+
+def spilled(t):
+    return [k for k, n in t.root.children["agents"].children.items()
+            if isinstance(n.children, PagedChildren) and n.children.spilled]
+
+
+def test_cold_subtrees_are_spilled_and_faulted_back(workdir):
+    plain = ConfigTree()
+    populate(plain)
+
+    t = ConfigTree()
+    pager = t.enable_paging(os.path.join(workdir, "pages.cx"), max_resident=3)
+    populate(t)
+
+    assert len(spilled(t)) == 7
+    assert pager.stats()["resident"] == 3
+
+    assert t.get("agents.a0.name") == "agent-0"
+    assert t.get("agents.a0.scores.s5") == 0
+    assert pager.misses >= 1
+    assert "a0" not in spilled(t)
+
+    assert t.to_dict() == plain.to_dict()
+
+
+def test_hits_and_misses(workdir):
+    t = ConfigTree()
+    pager = t.enable_paging(os.path.join(workdir, "pages.cx"), max_resident=2)
+    populate(t, agents=4)
+
+    hits, misses = pager.hits, pager.misses
+    t.get("agents.a3.name")  # most recent: resident
+    assert (pager.hits, pager.misses) == (hits + 1, misses)
+
+    t.get("agents.a0.name")  # evicted long ago
+    assert pager.misses == misses + 1
+
+
+def test_writes_into_spilled_subtree(workdir):
+    t = ConfigTree()
+    t.enable_paging(os.path.join(workdir, "pages.cx"), max_resident=1)
+    populate(t, agents=3)
+
+    t.set("agents.a0.memory.turns", 99)
+    t.delete("agents.a1.name")
+    t.move("agents.a2", "archive.a2")
+
+    assert t.get("agents.a0.memory.turns") == 99
+    assert "name" not in t.get("agents.a1")
+    assert t.get("archive.a2.name") == "agent-2"
+
+
+def test_snapshot_copies_pages_without_faulting(workdir):
+    t = ConfigTree()
+    pager = t.enable_paging(os.path.join(workdir, "pages.cx"), max_resident=2)
+    populate(t, agents=6)
+
+    misses = pager.misses
+    path = os.path.join(workdir, "snapshot.cx")
+    SnapshotStore.save(t, path)
+    assert pager.misses == misses
+
+    restored = ConfigTree()
+    SnapshotStore.load(restored, path)
+    assert restored.to_dict() == t.to_dict()
+
+
+def test_accounting_survives_spill_and_fault(workdir):
+    t = ConfigTree()
+    t.enable_paging(os.path.join(workdir, "pages.cx"), max_resident=2)
+    t.enable_accounting()
+    populate(t, agents=5)
+
+    before = t.memory_usage("agents")
+    t.get("agents.a0.name")
+    t.set("agents.a0.extra", 1)
+    after = t.memory_usage("agents")
+    assert after["nodes"] == before["nodes"] + 1
+    assert after["leaves"] == before["leaves"] + 1
+
+
+def test_disable_paging_restores_everything(workdir):
+    path = os.path.join(workdir, "pages.cx")
+    t = ConfigTree()
+    t.enable_paging(path, max_resident=1)
+    populate(t, agents=3)
+
+    t.disable_paging()
+    assert spilled(t) == []
+    assert not os.path.exists(path)
+    assert t.get("agents.a1.scores.s2") == 2
@@ -0,0 +1,73 @@
+"""
+ConfigX Testing Suite - test_prepared.py
+
+Tests for prepared, parameterized ConfigXQL statements
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.core.errors import ConfigQueryError
+from configx.qlang.interpreter import ConfigXQLInterpreter
+
+
+@pytest.fixture()
+def q():
+    return ConfigXQLInterpreter(ConfigTree())
+
+
+def test_path_and_value_parameters(q):
+    set_score = q.prepare("users.$uid.score=$n")
+    assert set_score.params == ("uid", "n")
+
+    set_score(uid="u1", n=10)
+    set_score(uid=2, n=2.5)
+    assert q.tree.get("users") == {"u1": {"score": 10}, "2": {"score": 2.5}}
+
+    get_score = q.prepare("users.$uid.score")
+    assert get_score(uid="u1") == 10
+
+
+def test_values_bypass_escaping(q):
+    q.prepare("notes.$id=$text")(id="n1", text='say "hi" \\ bye')
+    assert q.tree.get("notes.n1") == 'say "hi" \\ bye'
+
+
+def test_parsed_once(q, monkeypatch):
+    stmt = q.prepare("a.$k=$v")
+    monkeypatch.setattr(q._parser, "parse", lambda text: pytest.fail("re-parsed"))
+    for i in range(10):
+        stmt(k=f"k{i}", v=i)
+    assert len(q.tree.get("a")) == 10
+
+
+def test_conditional_and_function_parameters(q):
+    cas = q.prepare("c.$name@$ver=$value")
+    assert cas(name="n", ver=0, value=1) is True
+    assert cas(name="n", ver=0, value=2) is False
+    assert cas(name="n", ver=1, value=2) is True
+
+    q.tree.set("tmp.x", 1)
+    q.prepare("tmp.$id!move=done.$id")(id="x")
+    assert q.tree.get("done.x") == 1
+
+    q.tree.set("s.a", 1)
+    q.prepare("s.$id!ttl=$seconds")(id="a", seconds=30)
+    assert q.tree.ttl("s.a") > 29
+
+
+def test_bad_bindings(q):
+    stmt = q.prepare("users.$uid.score=$n")
+
+    with pytest.raises(ConfigQueryError):
+        stmt(uid="u1")                    # missing $n
+    with pytest.raises(ConfigQueryError):
+        stmt(uid="a.b", n=1)              # would change the path depth
+    with pytest.raises(ConfigQueryError):
+        stmt(uid=None, n=1)
+
+
+def test_unprepared_parameters_are_rejected(q):
+    with pytest.raises(ConfigQueryError):
+        q.execute("users.$uid.score=1")
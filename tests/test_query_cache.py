@@ -0,0 +1,64 @@
+"""
+ConfigX Testing Suite - test_query_cache.py
+
+Tests for the LRU cache of parsed ConfigXQL statements
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import dataclasses
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.qlang.cache import StatementCache
+from configx.qlang.interpreter import ConfigXQLInterpreter
+
+
+def test_repeated_queries_skip_the_parser(monkeypatch):
+    q = ConfigXQLInterpreter(ConfigTree())
+    calls = []
+    parse = q._parser.parse
+    monkeypatch.setattr(q._parser, "parse", lambda text: calls.append(text) or parse(text))
+
+    for i in range(5):
+        q.execute('app.ui.theme="dark"')
+        assert q.execute("app.ui.theme") == "dark"
+
+    assert calls == ['app.ui.theme="dark"', "app.ui.theme"]
+    assert q.cache.stats()["hits"] == 8
+    assert q.cache.stats()["hit_rate"] == 0.8
+
+
+def test_cached_statements_are_immutable():
+    q = ConfigXQLInterpreter(ConfigTree())
+    node = q.parse("a.b=1")
+
+    assert q.parse("a.b=1") is node
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        node.value = 2
+
+
+def test_lru_eviction_and_size_limit():
+    cache = StatementCache(maxsize=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.get("a")
+    cache.put("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert len(cache) == 2
+
+
+def test_cache_can_be_disabled():
+    q = ConfigXQLInterpreter(ConfigTree(), cache_size=0)
+    q.execute("a.b=1")
+    q.execute("a.b=1")
+    assert len(q.cache) == 0
+
+
+def test_parse_errors_are_not_cached():
+    q = ConfigXQLInterpreter(ConfigTree())
+    with pytest.raises(Exception):
+        q.execute("a.b=dark")
+    assert len(q.cache) == 0
@@ -0,0 +1,116 @@
+"""
+ConfigX Testing Suite - test_resolve_many.py
+
+Tests for batched query execution (ConfigX.resolve_many)
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import os
+import random
+import shutil
+import tempfile
+import time
+
+import pytest
+from lark.exceptions import LarkError
+
+from configx import ConfigX
+from configx.core.errors import ConfigPathNotFoundError, ConfigQueryError
+from configx.core.tree import ConfigTree
+from configx.qlang.interpreter import ConfigXQLInterpreter
+
+
+@pytest.fixture
+def q():
+    tree = ConfigTree()
+    for a in range(4):
+        for b in range(5):
+            tree.set(f"agents.a{a}.limits.l{b}", a * 10 + b)
+    return ConfigXQLInterpreter(tree)
+
+
+def test_results_are_in_query_order(q):
+    queries = ["agents.a3.limits.l4", "agents.a0.limits.l0", "agents.a1.limits", "agents.a0.limits.l1"]
+    assert q.execute_many(queries) == [q.execute(query) for query in queries]
+
+
+def test_matches_one_by_one_execution(q):
+    rng = random.Random(7)
+    queries = []
+    for _ in range(300):
+        a, b = rng.randrange(5), rng.randrange(6)
+        queries.append(rng.choice([
+            f"agents.a{a}.limits.l{b}!",
+            f"agents.a{a}.limits.l{b}={rng.randrange(100)}",
+            f"agents.a{a}.limits.l{b}-",
+            f"agents.a{a}",
+            f"agents.[.].limits.l{b}",
+        ]))
+
+    other = ConfigXQLInterpreter(q.tree.fork())
+    assert q.execute_many(queries) == [other.execute(query) for query in queries]
+
+
+def test_missing_paths_do_not_fail_the_rest(q):
+    results = q.execute_many(["agents.a0.limits.l0", "agents.nope.x", "agents.nope.x!", "agents.a0.limits.l1"])
+
+    assert results[0] == 0
+    assert isinstance(results[1], ConfigPathNotFoundError)
+    assert results[2] is None
+    assert results[3] == 1
+
+
+def test_syntax_and_query_errors_are_reported_per_query(q):
+    results = q.execute_many(["agents.a0!nope", "agents..a0", "x.y=1", "x.y"])
+
+    assert isinstance(results[0], ConfigQueryError)
+    assert isinstance(results[1], LarkError)
+    assert results[2:] == [1, 1]
+
+
+def test_reads_see_earlier_writes_only(q):
+    results = q.execute_many(["agents.a0.limits.l0", "agents.a0.limits.l0=99", "agents.a0.limits.l0"])
+    assert results == [0, 99, 99]
+
+
+def test_shared_prefixes_are_walked_once(q):
+    queries = [f"agents.a1.limits.l{b}" for b in range(5)]
+
+    with q.tree.count_visits() as visits:
+        q.execute_many(queries)
+    assert visits[0] == 3 + 5
+
+    with q.tree.count_visits() as visits:
+        for query in queries:
+            q.execute(query)
+    assert visits[0] == 4 * 5
+
+
+def test_expired_nodes_are_missing(q):
+    q.tree.expire_at("agents.a2", time.time() - 1)
+    q.tree.expire_at("agents.a1.limits.l0", time.time() - 1)
+
+    results = q.execute_many(["agents.a2.limits.l0", "agents.a1.limits", "agents.a1.limits.l0!"])
+    assert isinstance(results[0], ConfigPathNotFoundError)
+    assert results[1] == {f"l{b}": 10 + b for b in range(1, 5)}
+    assert results[2] is None
+
+
+def test_writes_are_one_wal_batch(monkeypatch):
+    tmpdir = tempfile.mkdtemp()
+    try:
+        cfg = ConfigX(persistent=True, storage_dir=tmpdir)
+        fsyncs = []
+        fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: fsyncs.append(fd) or fsync(fd))
+
+        results = cfg.resolve_many([f"users.u{i}.score={i}" for i in range(20)] + ["users.u3.score"])
+        assert results[-1] == 3
+        assert len(fsyncs) == 1
+        cfg.close()
+
+        cfg = ConfigX(persistent=True, storage_dir=tmpdir)
+        assert cfg.resolve("users.u19.score") == 19
+        cfg.close()
+    finally:
+        shutil.rmtree(tmpdir)
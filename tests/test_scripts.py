@@ -0,0 +1,114 @@
+"""
+ConfigX Testing Suite - test_scripts.py
+
+Tests for multi-statement ConfigXQL scripts and WAL group commit
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import os
+import shutil
+import tempfile
+
+import pytest
+from lark.exceptions import LarkError
+
+from configx.core.tree import ConfigTree
+from configx.core.errors import ConfigPathNotFoundError
+from configx.storage.runtime import StorageRuntime
+from configx.qlang.interpreter import ConfigXQLInterpreter
+from configx.qlang.parser import ConfigXQLParser, ScriptNode, SetNode
+
+
+@pytest.fixture()
+def q():
+    return ConfigXQLInterpreter(ConfigTree())
+
+
+@pytest.fixture()
+def persistent():
+    tmpdir = tempfile.mkdtemp()
+    snapshot = os.path.join(tmpdir, "state.snapshot")
+    wal = os.path.join(tmpdir, "state.wal")
+
+    runtime = StorageRuntime(snapshot, wal)
+    tree = ConfigTree(runtime=runtime)
+    runtime.start(tree)
+
+    yield tree, snapshot, wal
+
+    shutil.rmtree(tmpdir)
+
+
+def test_script_parses_into_one_node():
+    node = ConfigXQLParser().parse('a=1; b="x"\n\n c-')
+    assert isinstance(node, ScriptNode)
+    assert len(node.statements) == 3
+
+    # stray separators around a single statement do not make a script
+    assert ConfigXQLParser().parse("a=1;\n") == SetNode(path=("a",), value=1)
+
+    with pytest.raises(LarkError):
+        ConfigXQLParser().parse("a=1 b=2")
+
+
+def test_script_returns_one_result_per_statement(q):
+    results = q.execute('app.theme="dark"; app.font=12\napp.theme; app.missing!; app.font-')
+    assert results == ["dark", 12, "dark", None, True]
+    assert q.tree.to_dict() == {"app": {"theme": "dark"}}
+
+    assert q.execute(";") == []
+
+
+def test_failing_statement_keeps_earlier_ones(q):
+    with pytest.raises(ConfigPathNotFoundError):
+        q.execute("a=1; missing; b=2")
+
+    assert q.tree.to_dict() == {"a": 1}
+
+
+def test_script_is_one_batch_for_listeners(q):
+    flushes = []
+
+    class Listener:
+        def on_change(self, change):
+            pass
+
+        def flush(self):
+            flushes.append(1)
+
+    q.tree.add_listener(Listener())
+    q.execute("a=1; b=2; c=3")
+    assert flushes == [1]
+
+
+def test_prepared_script(q):
+    stmt = q.prepare("users.$uid.score=$n; users.$uid.name=$name")
+    assert stmt.params == ("uid", "n", "name")
+
+    stmt(uid="u1", n=3, name="ann")
+    assert q.tree.to_dict() == {"users": {"u1": {"score": 3, "name": "ann"}}}
+
+
+def test_script_is_one_wal_group_commit(persistent, monkeypatch):
+    tree, snapshot, wal = persistent
+    q = ConfigXQLInterpreter(tree)
+
+    syncs = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: (syncs.append(fd), real_fsync(fd)))
+
+    q.execute("\n".join(f"items.i{n}={n}" for n in range(50)))
+    assert len(syncs) == 1
+
+    q.execute("single=1")
+    assert len(syncs) == 2
+
+    with open(wal, encoding="utf-8") as f:
+        assert sum(1 for _ in f) == 51
+
+    # every statement of the group is replayed
+    runtime2 = StorageRuntime(snapshot, wal)
+    tree2 = ConfigTree(runtime=runtime2)
+    runtime2.start(tree2)
+    assert tree2.get("items.i49") == 49
+    assert len(tree2.get("items")) == 50
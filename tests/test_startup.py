@@ -0,0 +1,65 @@
+"""
+ConfigX Testing Suite - test_startup.py
+
+Tests for cheap ConfigX construction: shared parser tables, lazy colorama
+and asyncio
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import os
+import subprocess
+import sys
+
+from configx.runtime.configx import ConfigX
+from configx.qlang.parser import ConfigXQLParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code: str) -> str:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    ).stdout
+
+
+def test_parser_tables_are_built_once():
+    assert ConfigXQLParser()._parser is ConfigXQLParser()._parser
+    assert ConfigX()._intp._parser._parser is ConfigX()._intp._parser._parser
+
+
+def test_construction_is_silent_and_skips_colorama_and_asyncio():
+    out = run_python(
+        "import sys; from configx import ConfigX; ConfigX(); "
+        "print('colorama' in sys.modules, 'asyncio' in sys.modules)"
+    )
+    assert out == "False False\n"
+
+
+def test_print_tree_loads_colors(capsys):
+    cfg = ConfigX()
+    cfg.resolve('app.ui.theme="dark"')
+    cfg.print_tree()
+    assert "theme" in capsys.readouterr().out
+
+
+def test_parser_cache_on_disk(tmp_path):
+    cache = str(tmp_path / "tables.cache")
+    code = (
+        "from configx import ConfigX; "
+        f"c = ConfigX(parser_cache={cache!r}); c.resolve('a.b=1'); print(c.resolve('a.b'))"
+    )
+    assert run_python(code) == "1\n"
+    assert os.path.exists(cache)
+    assert run_python(code) == "1\n"
+
+
+def test_parser_cache_requested_after_first_instance(tmp_path):
+    cache = str(tmp_path / "late.cache")
+    code = (
+        "from configx import ConfigX; "
+        "ConfigX().resolve('a.b=1'); "
+        f"c = ConfigX(parser_cache={cache!r}); c.resolve('a.b=2'); print(c.resolve('a.b'))"
+    )
+    assert run_python(code) == "2\n"
+    assert os.path.exists(cache)
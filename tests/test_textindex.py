@@ -0,0 +1,112 @@
+"""
+ConfigX Testing Suite - test_textindex.py
+
+Tests for the inverted token index and keyword !search
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.core.errors import ConfigPathNotFoundError
+from configx.core.textindex import tokenize, leaf_tokens
+from configx.storage.runtime import StorageRuntime
+from configx.qlang.interpreter import ConfigXQLInterpreter
+
+
+def populate(t):
+    t.set("agents.atlas.memory.lastObservation", "User asked about persistence")
+    t.set("agents.atlas.memory.note", "persistence persistence and snapshots")
+    t.set("agents.nova.memory.note", "User prefers dark mode")
+    t.set("agents.nova.bootCount", 3)
+
+
+def test_tokenizer():
+    assert tokenize("User asked, about PERSISTENCE!") == ["user", "asked", "about", "persistence"]
+    assert set(leaf_tokens("a.lastObservation", None)) == {"lastobservation", "last", "observation"}
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_and_prefix_and_ranking(indexed):
+    t = ConfigTree()
+    if indexed:
+        t.create_text_index()
+    populate(t)
+
+    assert t.search_text(None, "persistence") == [
+        "agents.atlas.memory.note", "agents.atlas.memory.lastObservation",
+    ]
+    assert t.search_text(None, "user persist*") == ["agents.atlas.memory.lastObservation"]
+    assert t.search_text("agents.nova", "user") == ["agents.nova.memory.note"]
+    assert t.search_text(None, "boot*") == ["agents.nova.bootCount"]
+    assert t.search_text(None, "missing") == []
+
+    with pytest.raises(ConfigPathNotFoundError):
+        t.search_text("agents.ghost", "user")
+
+
+def test_index_maintained_on_mutations():
+    t = ConfigTree()
+    index = t.create_text_index()
+    populate(t)
+
+    t.set("agents.nova.memory.note", "nothing here")
+    t.move("agents.atlas", "archive.atlas")
+    t.delete("archive.atlas.memory.note")
+
+    assert t.search_text(None, "dark") == []
+    assert t.search_text(None, "persistence") == ["archive.atlas.memory.lastObservation"]
+    assert len(index) == 3
+
+
+def test_budget_keeps_results_exact():
+    t = ConfigTree()
+    index = t.create_text_index(max_postings=8)
+    populate(t)
+
+    assert index._dropped
+    assert index._size <= 8
+    assert t.search_text(None, "user persistence") == ["agents.atlas.memory.lastObservation"]
+
+    unbounded = ConfigTree()
+    populate(unbounded)
+    for token in index._dropped:
+        assert sorted(t.search_text(None, token)) == sorted(unbounded.search_text(None, token))
+
+
+def test_index_persisted_with_snapshot():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        snapshot, wal = os.path.join(tmpdir, "s.cx"), os.path.join(tmpdir, "w.cx")
+        runtime = StorageRuntime(snapshot, wal)
+        tree = ConfigTree(runtime=runtime)
+        tree.create_text_index(persist=True)
+        runtime.start(tree)
+        populate(tree)
+        runtime.checkpoint(tree)
+        tree.set("agents.nova.memory.extra", "late persistence note")
+
+        assert os.path.exists(runtime.tokens_path)
+
+        runtime2 = StorageRuntime(snapshot, wal)
+        tree2 = ConfigTree(runtime=runtime2)
+        index2 = tree2.create_text_index(persist=True)
+        index2.rebuild = None  # loading must not need a rebuild
+        runtime2.start(tree2)
+    finally:
+        shutil.rmtree(tmpdir)
+
+    assert len(tree2.search_text(None, "persistence")) == 3
+
+
+def test_keyword_search_via_configxql():
+    t = ConfigTree()
+    t.create_text_index()
+    populate(t)
+    intp = ConfigXQLInterpreter(t)
+
+    assert intp.execute('agents.nova!search="dark"') == ["agents.nova.memory.note"]
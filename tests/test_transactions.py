@@ -0,0 +1,220 @@
+"""
+ConfigX Testing Suite - test_transactions.py
+
+Tests for atomic transactions: staging, commit/rollback, the WAL commit
+record and replay of uncommitted groups
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import pytest
+
+from configx import ConfigX
+from configx.core.errors import ConfigMemoryBudgetError, ConfigTransactionError
+from configx.core.transaction import Transaction
+from configx.core.tree import ConfigTree
+
+
+@pytest.fixture()
+def storage_dir():
+    tmpdir = tempfile.mkdtemp()
+    yield tmpdir
+    shutil.rmtree(tmpdir)
+
+
+def read_wal(storage_dir):
+    with open(os.path.join(storage_dir, "wal.cx"), encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_writes_are_applied_on_commit():
+    cfg = ConfigX()
+    cfg.resolve("users.u1.score=1")
+
+    with cfg.transaction() as tx:
+        cfg.resolve("users.u1.score=10")
+        cfg.resolve("users.u2.score=20")
+
+        # the transaction sees its writes, the runtime does not yet
+        assert cfg.resolve("users.u1.score") == 10
+        assert cfg._tree.get("users.u1.score") == 1
+        assert len(tx.entries) == 2
+
+    assert cfg.resolve("users") == {"u1": {"score": 10}, "u2": {"score": 20}}
+
+
+def test_other_threads_do_not_see_open_transactions():
+    cfg = ConfigX()
+    seen = []
+
+    with cfg.transaction():
+        cfg.resolve("a.b=1")
+        reader = threading.Thread(target=lambda: seen.append(cfg.resolve("a.b!")))
+        reader.start()
+        reader.join()
+
+    assert seen == [None]
+    assert cfg.resolve("a.b") == 1
+
+
+def test_exception_discards_every_write():
+    cfg = ConfigX()
+    cfg.resolve("a.b=1")
+
+    with pytest.raises(RuntimeError):
+        with cfg.transaction():
+            cfg.resolve("a.b=2; a.c=3")
+            cfg.resolve("a.b-")
+            raise RuntimeError("boom")
+
+    assert cfg.dump() == {"a": {"b": 1}}
+
+
+def test_prepared_statements_join_the_transaction():
+    cfg = ConfigX()
+    set_score = cfg.prepare("users.$uid.score=$n")
+    reset = cfg.prepare("users.u0.score=0")
+    cfg.resolve("users.u0.score=9")
+
+    with pytest.raises(RuntimeError):
+        with cfg.transaction():
+            set_score(uid="u1", n=5)
+            reset()
+            assert cfg.resolve("users.u1.score") == 5
+            raise RuntimeError("abort")
+
+    assert cfg.dump() == {"users": {"u0": {"score": 9}}}
+
+    with cfg.transaction():
+        set_score(uid="u1", n=5)
+        reset()
+    assert cfg.dump() == {"users": {"u0": {"score": 0}, "u1": {"score": 5}}}
+
+
+def test_explicit_rollback_and_reuse_errors():
+    cfg = ConfigX()
+
+    with cfg.transaction() as tx:
+        cfg.resolve("a.b=1")
+        tx.rollback()
+
+    assert cfg.dump() == {}
+    with pytest.raises(ConfigTransactionError):
+        tx.commit()
+
+
+def test_nested_transactions_join_the_outer_one():
+    cfg = ConfigX()
+
+    with cfg.transaction() as outer:
+        cfg.resolve("a.b=1")
+        with cfg.transaction() as inner:
+            cfg.resolve("a.c=2")
+        assert inner is outer
+        assert cfg._tree.to_dict() == {}
+
+    assert cfg.dump() == {"a": {"b": 1, "c": 2}}
+
+
+def test_commit_is_one_wal_group_with_one_fsync(storage_dir, monkeypatch):
+    cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+    fsyncs = []
+    fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: fsyncs.append(fd) or fsync(fd))
+
+    with cfg.transaction():
+        for i in range(100):
+            cfg.resolve(f"users.u{i}.score={i}")
+
+    assert len(fsyncs) == 1
+
+    entries = read_wal(storage_dir)
+    assert len(entries) == 101
+    assert entries[-1]["op"] == "COMMIT"
+    assert len({entry["tx"] for entry in entries}) == 1
+
+    cfg.close()
+    cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+    assert cfg.resolve("users.u99.score") == 99
+    cfg.close()
+
+
+def test_replay_skips_uncommitted_groups(storage_dir):
+    cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+    with cfg.transaction():
+        cfg.resolve("a.committed=1")
+    cfg.resolve("a.plain=2")
+
+    # a crash part way through the next transaction: no COMMIT record,
+    # and its last line cut short
+    with open(os.path.join(storage_dir, "wal.cx"), "a", encoding="utf-8") as f:
+        f.write(json.dumps({"op": "SET", "path": "a.lost", "value": 3, "tx": "t9", "ts": 0}) + "\n")
+        f.write('{"op": "SET", "path": "a.lo')
+
+    cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+    assert cfg.dump() == {"a": {"committed": 1, "plain": 2}}
+
+    # the torn line is dropped, so new entries replay cleanly
+    cfg.resolve("a.after=4")
+    cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+    assert cfg.dump() == {"a": {"committed": 1, "plain": 2, "after": 4}}
+    cfg.close()
+
+
+def test_failed_commit_rolls_back_and_logs_nothing(storage_dir):
+    cfg = ConfigX(persistent=True, storage_dir=storage_dir)
+    cfg.resolve('a.small="x"')
+    usage = cfg._tree.enable_accounting(budget=cfg._tree.memory_usage()["bytes"] + 200)
+    before = cfg._tree.memory_usage()
+
+    # staged on the transaction's own view: the budget only applies on commit
+    with pytest.raises(ConfigMemoryBudgetError):
+        with cfg.transaction():
+            cfg.resolve('a.small="y"')
+            cfg.resolve('a.big="' + "z" * 1000 + '"')
+
+    assert cfg.dump() == {"a": {"small": "x"}}
+    assert cfg._tree.memory_usage() == before
+    assert usage is cfg._tree.accounting
+    assert [entry["op"] for entry in read_wal(storage_dir)] == ["SET"]
+    cfg.close()
+
+
+def test_failed_commit_notifies_no_watcher():
+    cfg = ConfigX()
+    cfg.resolve("a.p=1")
+    calls = []
+    cfg.watch("a.**", calls.append)
+    usage = cfg._tree.enable_accounting(budget=cfg._tree.memory_usage()["bytes"] + 2000)
+
+    with pytest.raises(ConfigMemoryBudgetError):
+        with cfg.transaction():
+            cfg.resolve("a.q=7")
+            cfg.resolve('a.big="' + "z" * 4000 + '"')
+
+    assert calls == []
+    usage.budget = None
+    cfg.resolve("a.q=8")
+    assert [[(c.op, c.path, c.value) for c in changes] for changes in calls] == [[("SET", "a.q", 8)]]
+    cfg.close()
+
+
+def test_tree_level_transaction():
+    tree = ConfigTree()
+    tree.set("jobs.j1.state", "idle")
+    agg = tree.create_aggregate("jobs", field="runs")
+
+    tx = Transaction(tree)
+    tx.view.set("jobs.j1.runs", 3)
+    tx.view.set("jobs.j2.runs", 4)
+    tx.view.move("jobs.j1", "jobs.j3")
+    assert tree.get("jobs") == {"j1": {"state": "idle"}}
+
+    tx.commit()
+    assert tree.get("jobs") == {"j2": {"runs": 4}, "j3": {"state": "idle", "runs": 3}}
+    assert agg.result("sum") == 7
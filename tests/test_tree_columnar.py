@@ -0,0 +1,145 @@
+"""
+ConfigX Testing Suite - test_tree_columnar.py
+
+Tests for columnar storage of numeric sibling leaves
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import os
+import shutil
+import tempfile
+import threading
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.core.columnar import NumericColumn, COLUMN_MIN
+from configx.storage.snapshot import SnapshotStore
+
+
+@pytest.fixture()
+def packed_tree():
+    t = ConfigTree()
+    for i in range(COLUMN_MIN):
+        t.set(f"metrics.m{i}", i)
+    return t
+
+
+def column(t, path="metrics"):
+    return t._walk(path).children
+
+
+def test_numeric_siblings_get_packed(packed_tree):
+    children = column(packed_tree)
+    assert isinstance(children, NumericColumn)
+    assert children.type == "INT"
+    assert len(children.names) == COLUMN_MIN
+    assert packed_tree.get("metrics.m5") == 5
+
+
+def test_semantics_unchanged_when_packed(packed_tree):
+    t = packed_tree
+    expected = {f"m{i}": i for i in range(COLUMN_MIN)}
+
+    t.set("metrics.m1", 100)          # in-place slot write
+    t.set("metrics.extra", 7)         # new key appended to the column
+    t.set("metrics.label", "cpu")     # non-numeric sibling kept as a Node
+    t.set("metrics.m2", 2.5)          # type change leaves the column
+    t.set("metrics.m3.sub", 1)        # leaf becomes interior
+    t.delete("metrics.m4")
+
+    expected.update({"m1": 100, "extra": 7, "label": "cpu", "m2": 2.5, "m3": {"sub": 1}})
+    del expected["m4"]
+
+    assert t.get("metrics") == expected
+    assert list(t.get("metrics")) == list(expected)
+    assert "m4" not in column(t)
+
+
+def test_insertion_order_survives_packing():
+    t = ConfigTree()
+    # packing is checked at power-of-two sizes: 2 + 126 = 128 children
+    n = 2 * COLUMN_MIN - 2
+    t.set("metrics.label", "cpu")
+    for i in range(n):
+        t.set(f"metrics.m{i}", i)
+        if i == 3:
+            t.set("metrics.unit", "ms")
+
+    expected = ["label"] + [f"m{i}" for i in range(4)] + ["unit"] + [f"m{i}" for i in range(4, n)]
+    assert isinstance(column(t), NumericColumn)
+    assert list(t.get("metrics")) == expected
+
+    t.set("metrics.m5", 1.5)
+    t.delete("metrics.m0")
+    expected.remove("m0")
+    assert list(t.get("metrics")) == expected
+
+
+def test_lock_free_reads_never_see_another_slot(packed_tree):
+    t = packed_tree
+    stop = threading.Event()
+    wrong = []
+
+    def read():
+        while not stop.is_set():
+            for i in range(0, COLUMN_MIN, 7):
+                node = column(t).get(f"m{i}")
+                if node is not None and node.value != i:
+                    wrong.append((i, node.value))
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        for _ in range(200):
+            for i in range(1, COLUMN_MIN, 7):
+                t.delete(f"metrics.m{i}")
+            for i in range(1, COLUMN_MIN, 7):
+                t.set(f"metrics.m{i}", i)
+    finally:
+        stop.set()
+        reader.join()
+
+    assert wrong == []
+
+
+def test_pinned_view_of_packed_parent(packed_tree):
+    t = packed_tree
+    view = t.pin()
+    t.set("metrics.m0", -1)
+
+    assert view.get("metrics.m0") == 0
+    assert t.get("metrics.m0") == -1
+
+
+def test_vectorized_aggregates(packed_tree):
+    t = packed_tree
+    t.set("metrics.label", "cpu")
+
+    n = COLUMN_MIN
+    assert t.aggregate("metrics", "count") == n + 1
+    assert t.aggregate("metrics", "sum") == n * (n - 1) // 2
+    assert t.aggregate("metrics", "min") == 0
+    assert t.aggregate("metrics", "max") == n - 1
+
+
+def test_snapshot_round_trip_packed(packed_tree):
+    t = packed_tree
+    t.set("metrics.label", "cpu")
+    t.set("metrics.m3", "n/a")
+    t.delete("metrics.m1")
+    t.set("metrics.m1", 1)
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmpdir, "snap.cx")
+        SnapshotStore.save(t, path)
+
+        t2 = ConfigTree()
+        SnapshotStore.load(t2, path)
+    finally:
+        shutil.rmtree(tmpdir)
+
+    assert isinstance(column(t2), NumericColumn)
+    assert t2.to_dict() == t.to_dict()
+    assert list(t2.get("metrics")) == list(t.get("metrics"))
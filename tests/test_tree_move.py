@@ -0,0 +1,107 @@
+"""
+ConfigX Testing Suite - test_tree_move.py
+
+Tests for ConfigTree.move(), its WAL record and the !move function
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.storage.runtime import StorageRuntime
+from configx.qlang.interpreter import ConfigXQLInterpreter
+from configx.core.errors import (
+    ConfigPathNotFoundError,
+    ConfigStrictModeError,
+    ConfigNodeStructureError,
+)
+
+
+@pytest.fixture()
+def temp_storage():
+    tmpdir = tempfile.mkdtemp()
+    yield os.path.join(tmpdir, "state.snapshot"), os.path.join(tmpdir, "state.wal")
+    shutil.rmtree(tmpdir)
+
+
+def test_move_reparents_same_node():
+    t = ConfigTree()
+    t.set("sessions.tmp_x.a", 1)
+    t.set("sessions.tmp_x.b.c", 2)
+    node = t.root.children["sessions"].children["tmp_x"]
+
+    assert t.move("sessions.tmp_x", "archive.x") is True
+
+    assert t.root.children["archive"].children["x"] is node
+    assert node.name == "x"
+    assert t.get("archive.x") == {"a": 1, "b": {"c": 2}}
+    assert t.get("sessions") == {}
+
+
+def test_move_validation():
+    t = ConfigTree()
+    t.set("a.b.c", 1)
+    t.set("leaf", 5)
+
+    with pytest.raises(ConfigPathNotFoundError):
+        t.move("missing", "x")
+    with pytest.raises(ConfigNodeStructureError):
+        t.move("a", "a.b.z")
+    with pytest.raises(ConfigNodeStructureError):
+        t.move("a.b.c", "a.b.c")
+    with pytest.raises(ConfigNodeStructureError):
+        t.move("a.b", "leaf.b")
+
+    t.set_strict_mode(True)
+    with pytest.raises(ConfigStrictModeError):
+        t.move("a.b", "new.b")
+
+    assert t.to_dict() == {"a": {"b": {"c": 1}}, "leaf": 5}
+
+
+def test_move_keeps_pinned_view():
+    t = ConfigTree()
+    t.set("a.x.v", 1)
+    view = t.pin()
+
+    t.move("a.x", "a.y")
+
+    assert view.get("a") == {"x": {"v": 1}}
+    assert t.get("a") == {"y": {"v": 1}}
+    assert not hasattr(view, "move")
+
+
+def test_move_single_wal_record_and_replay(temp_storage):
+    snapshot, wal = temp_storage
+    runtime = StorageRuntime(snapshot, wal)
+    tree = ConfigTree(runtime=runtime)
+    runtime.start(tree)
+
+    tree.set("sessions.tmp_x.a", 1)
+    tree.set("sessions.tmp_x.b", 2)
+    tree.move("sessions.tmp_x", "sessions.x")
+
+    with open(wal, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+    assert len(lines) == 3
+    assert '"MOVE"' in lines[-1]
+
+    runtime2 = StorageRuntime(snapshot, wal)
+    tree2 = ConfigTree(runtime=runtime2)
+    runtime2.start(tree2)
+    assert tree2.to_dict() == {"sessions": {"x": {"a": 1, "b": 2}}}
+
+
+def test_move_via_configxql():
+    t = ConfigTree()
+    intp = ConfigXQLInterpreter(t)
+
+    intp.execute('sessions.tmp_x.token="abc"')
+    intp.execute('sessions.tmp_x!move=sessions.x')
+
+    assert intp.execute('sessions.x.token') == "abc"
+    assert intp.execute('sessions.tmp_x!') is None
@@ -0,0 +1,92 @@
+"""
+ConfigX Testing Suite - test_tree_scan.py
+
+Tests for ordered children index and ConfigTree.scan()
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.core.node import Node
+from configx.storage.runtime import StorageRuntime
+from configx.core.ordered import SortedChildren
+from configx.core.errors import ConfigPathNotFoundError
+
+
+def make_tree(indexed):
+    t = ConfigTree()
+    t.set("agents.seed", 0)
+    if indexed:
+        t.index_children("agents")
+    for name in ["user_3", "user_10", "user_1000", "user_1001", "bot_1", "user_2"]:
+        t.set(f"agents.{name}.score", len(name))
+    t.delete("agents.seed")
+    return t
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_scan_sorted_order(indexed):
+    t = make_tree(indexed)
+    keys = [k for k, _ in t.scan("agents")]
+    assert keys == sorted(["user_3", "user_10", "user_1000", "user_1001", "bot_1", "user_2"])
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_scan_prefix_range_limit(indexed):
+    t = make_tree(indexed)
+
+    assert [k for k, _ in t.scan("agents", prefix="user_100")] == ["user_1000", "user_1001"]
+    assert [k for k, _ in t.scan("agents", start="user_1", end="user_2")] == [
+        "user_10", "user_1000", "user_1001",
+    ]
+    assert [k for k, _ in t.scan("agents", prefix="user_", limit=2)] == ["user_10", "user_1000"]
+
+
+def test_scan_yields_values():
+    t = make_tree(True)
+    assert dict(t.scan("agents", prefix="bot")) == {"bot_1": {"score": 5}}
+
+
+def test_index_survives_pin_and_delete():
+    t = make_tree(True)
+    t.pin()
+    t.delete("agents.user_10")
+
+    children = t.root.children["agents"].children
+    assert isinstance(children, SortedChildren)
+    assert "user_10" not in children.sorted_keys
+    assert [k for k, _ in t.scan("agents", prefix="user_1")] == ["user_1000", "user_1001"]
+
+
+def test_index_survives_reloads(tmp_path):
+    def indexed(tree):
+        children = tree.root.children["agents"].children
+        return isinstance(children, SortedChildren) and children.sorted_keys == sorted(children)
+
+    snapshot, wal = str(tmp_path / "state.snapshot"), str(tmp_path / "state.wal")
+    runtime = StorageRuntime(snapshot, wal)
+    t = make_tree(True)
+    t.runtime = runtime
+    runtime.checkpoint(t)
+
+    restored = ConfigTree(runtime=StorageRuntime(snapshot, wal))
+    restored.runtime.start(restored)
+    assert indexed(restored)
+    assert [k for k, _ in restored.scan("agents", prefix="user_100")] == ["user_1000", "user_1001"]
+
+    t.load_dict({"agents": {"b": 1, "a": 2}})
+    assert indexed(t)
+    assert [k for k, _ in t.scan("agents")] == ["a", "b"]
+
+    t.delete("agents.a")
+    t.delete("agents.b")
+    t.bulk_load([Node.from_primitive("agents", {"z": 1, "y": 2})])
+    assert indexed(t)
+    assert [k for k, _ in t.scan("agents")] == ["y", "z"]
+
+
+def test_scan_missing_path_raises():
+    t = ConfigTree()
+    with pytest.raises(ConfigPathNotFoundError):
+        list(t.scan("missing"))
@@ -0,0 +1,81 @@
+"""
+ConfigX Testing Suite - test_tree_versions.py
+
+Tests for pinned versions and forks of ConfigTree (structural sharing)
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.core.errors import ConfigPathNotFoundError
+
+
+def test_pinned_view_is_stable():
+    t = ConfigTree()
+    t.set("app.ui.theme", "dark")
+    view = t.pin()
+
+    t.set("app.ui.theme", "light")
+    t.set("app.ui.accent", "blue")
+    t.delete("app")
+
+    assert view.get("app.ui.theme") == "dark"
+    assert view.to_dict() == {"app": {"ui": {"theme": "dark"}}}
+    assert t.to_dict() == {}
+
+
+def test_untouched_subtrees_are_shared():
+    t = ConfigTree()
+    t.set("a.x", 1)
+    t.set("b.y", 2)
+    view = t.pin()
+
+    t.set("a.x", 10)
+
+    assert t.root is not view.root
+    assert t.root.children["a"] is not view.root.children["a"]
+    assert t.root.children["b"] is view.root.children["b"]
+
+
+def test_writes_after_copy_stay_in_place():
+    t = ConfigTree()
+    t.set("a.x", 1)
+    t.pin()
+
+    t.set("a.x", 2)
+    copied = t.root.children["a"]
+    t.set("a.y", 3)
+
+    assert t.root.children["a"] is copied
+    assert t.get("a") == {"x": 2, "y": 3}
+
+
+def test_view_missing_path_raises():
+    t = ConfigTree()
+    view = t.pin()
+    t.set("a", 1)
+
+    with pytest.raises(ConfigPathNotFoundError):
+        view.get("a")
+
+
+def test_missing_delete_does_not_copy():
+    t = ConfigTree()
+    t.set("a.x", 1)
+    view = t.pin()
+
+    assert t.delete("a.missing") is False
+    assert t.root is view.root
+
+
+def test_fork_is_independent():
+    t = ConfigTree()
+    t.set("a.x", 1)
+    f = t.fork()
+
+    f.set("a.x", 2)
+    t.set("a.y", 3)
+
+    assert t.get("a") == {"x": 1, "y": 3}
+    assert f.get("a") == {"x": 2}
@@ -0,0 +1,174 @@
+"""
+ConfigX Testing Suite - test_ttl.py
+
+Tests for key TTLs and the timer-wheel expiry engine
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import math
+import os
+import random
+import shutil
+import tempfile
+import time
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.core.timerwheel import TimerWheel
+from configx.core.errors import ConfigPathNotFoundError, ConfigValueError
+from configx.storage.runtime import StorageRuntime
+from configx.qlang.interpreter import ConfigXQLInterpreter
+
+
+@pytest.fixture()
+def temp_storage():
+    tmpdir = tempfile.mkdtemp()
+    yield os.path.join(tmpdir, "state.snapshot"), os.path.join(tmpdir, "state.wal")
+    shutil.rmtree(tmpdir)
+
+
+def test_wheel_matches_naive_schedule():
+    rng = random.Random(3)
+    wheel = TimerWheel(now=0.0, tick=1.0, slots=8, levels=2)
+    naive = {}
+    now = 0.0
+
+    for _ in range(2000):
+        roll = rng.random()
+        key = rng.randrange(40)
+        if roll < 0.5:
+            when = now + rng.choice([0.5, 5, 70, 900]) * rng.random()
+            wheel.schedule(key, when)
+            naive[key] = math.ceil(when)
+        elif roll < 0.6:
+            wheel.cancel(key)
+            naive.pop(key, None)
+        else:
+            now += rng.choice([0.3, 4, 60])
+            expected = sorted(k for k, due in naive.items() if due <= int(now))
+            for k in expected:
+                del naive[k]
+            assert sorted(wheel.advance(now)) == expected
+
+
+def test_expired_keys_are_invisible_before_sweep():
+    t = ConfigTree()
+    t.set("sessions.s1.user", "ann")
+    t.set("sessions.s2.user", "bob")
+    t.expire_at("sessions.s1", time.time() - 1)
+
+    with pytest.raises(ConfigPathNotFoundError):
+        t.get("sessions.s1.user")
+    assert t.get("sessions") == {"s2": {"user": "bob"}}
+    assert t.to_dict() == {"sessions": {"s2": {"user": "bob"}}}
+
+    # still physically present until swept
+    assert "s1" in t.root.children["sessions"].children
+    assert t.sweep() == ["sessions.s1"]
+    assert "s1" not in t.root.children["sessions"].children
+
+
+def test_expired_keys_stay_hidden_in_views_forks_and_transactions():
+    from configx import ConfigX
+
+    cx = ConfigX()
+    cx.resolve('s.tok="abc"; s.keep=1')
+    cx._tree.expire_at("s.tok", time.time() - 1)
+
+    view = cx._tree.pin()
+    with pytest.raises(ConfigPathNotFoundError):
+        view.get("s.tok")
+    assert view.get("s") == {"keep": 1}
+    assert view.to_dict() == {"s": {"keep": 1}}
+
+    assert cx.fork().resolve("s.tok!") is None
+    with cx.transaction():
+        assert cx.resolve("s.tok!") is None
+        cx.resolve("s.other=2")
+
+    assert cx.dump() == {"s": {"keep": 1, "other": 2}}
+    cx.close()
+
+
+def test_sweep_only_removes_due_keys():
+    t = ConfigTree()
+    for i in range(5):
+        t.set(f"tmp.k{i}", i)
+        t.expire(f"tmp.k{i}", 10 * (i + 1))
+
+    now = time.time()
+    assert t.sweep(now + 25) == ["tmp.k0", "tmp.k1"]
+    assert sorted(t.sweep(now + 1000)) == ["tmp.k2", "tmp.k3", "tmp.k4"]
+
+
+def test_persist_and_ttl_queries():
+    t = ConfigTree()
+    t.set("a.b", 1)
+    assert t.ttl("a.b") is None
+
+    t.expire("a.b", 30)
+    assert 29 < t.ttl("a.b") <= 30
+
+    t.persist("a.b")
+    assert t.ttl("a.b") is None
+    assert t.sweep(time.time() + 60) == []
+    assert t.get("a.b") == 1
+
+    with pytest.raises(ConfigValueError):
+        t.expire("a.b", 0)
+
+
+def test_write_over_expired_path_starts_fresh():
+    t = ConfigTree()
+    t.set("cache.x.old", 1)
+    t.expire_at("cache.x", time.time() - 1)
+
+    t.set("cache.x.new", 2)
+    assert t.get("cache.x") == {"new": 2}
+
+
+def test_ttl_follows_move():
+    t = ConfigTree()
+    t.set("tmp.x.v", 1)
+    t.expire("tmp.x", 5)
+    t.move("tmp.x", "done.x")
+
+    assert t.sweep(time.time() + 10) == ["done.x"]
+
+
+def test_ttl_survives_wal_and_snapshot(temp_storage):
+    snapshot, wal = temp_storage
+    deadline = time.time() + 3600
+
+    runtime = StorageRuntime(snapshot, wal)
+    tree = ConfigTree(runtime=runtime)
+    runtime.start(tree)
+    tree.set("s.a", 1)
+    tree.set("s.b", 2)
+    tree.expire_at("s.a", deadline)
+
+    # WAL only
+    tree2 = ConfigTree(runtime=StorageRuntime(snapshot, wal))
+    tree2.runtime.start(tree2)
+    assert tree2.root.children["s"].children["a"].metadata["expires_at"] == deadline
+
+    # snapshot
+    runtime.checkpoint(tree)
+    tree3 = ConfigTree(runtime=StorageRuntime(snapshot, wal))
+    tree3.runtime.start(tree3)
+    assert tree3.ttl("s.a") > 3500
+    assert tree3.sweep(deadline + 1) == ["s.a"]
+    assert tree3.get("s") == {"b": 2}
+
+
+def test_ql_ttl_functions():
+    t = ConfigTree()
+    q = ConfigXQLInterpreter(t)
+    q.execute('sessions.s1.user="ann"')
+
+    assert q.execute("sessions.s1!ttl") is None
+    q.execute("sessions.s1!ttl=60")
+    assert 59 < q.execute("sessions.s1!ttl") <= 60
+    q.execute("sessions.s1!persist")
+    assert q.execute("sessions.s1!ttl") is None
@@ -0,0 +1,136 @@
+"""
+ConfigX Testing Suite - test_watch.py
+
+Tests for change subscriptions (WatchRegistry / ConfigX.watch)
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import threading
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.core.watch import WatchRegistry
+
+
+def collect(registry, pattern, threaded=False):
+    calls = []
+    registry.subscribe(pattern, calls.append, threaded=threaded)
+    return calls
+
+
+def test_exact_and_wildcard_patterns():
+    t = ConfigTree()
+    reg = WatchRegistry(t)
+    exact = collect(reg, "app.ui.theme")
+    star = collect(reg, "agents.*.status")
+    deep = collect(reg, "sessions.**")
+
+    t.set("app.ui.theme", "dark")
+    t.set("app.ui.accent", "blue")
+    t.set("agents.a1.status", "idle")
+    t.set("agents.a1.name", "x")
+    t.set("sessions.s1.user.id", 3)
+
+    assert [c[0].path for c in exact] == ["app.ui.theme"]
+    assert [c[0].path for c in star] == ["agents.a1.status"]
+    assert [c[0].path for c in deep] == ["sessions.s1.user.id"]
+
+
+def test_branch_watch_sees_descendants_and_deletes():
+    t = ConfigTree()
+    reg = WatchRegistry(t)
+    branch = collect(reg, "app.ui")
+    leaf = collect(reg, "app.ui.theme")
+
+    t.set("app.ui.theme", "dark")
+    t.delete("app")
+
+    assert [(c[0].op, c[0].path) for c in branch] == [("SET", "app.ui.theme"), ("DELETE", "app")]
+    assert [c[0].op for c in leaf] == ["SET", "DELETE"]
+    assert leaf[0][0].old is None and leaf[0][0].value == "dark"
+
+
+def test_move_notifies_source_and_destination():
+    t = ConfigTree()
+    reg = WatchRegistry(t)
+    src = collect(reg, "sessions.tmp.*")
+    dst = collect(reg, "sessions.final")
+
+    t.set("sessions.tmp.a", 1)
+    t.move("sessions.tmp", "sessions.final")
+
+    assert src[-1][0].op == "MOVE"
+    assert dst[0][0].dst == "sessions.final"
+
+
+def test_batch_is_coalesced():
+    t = ConfigTree()
+    reg = WatchRegistry(t)
+    calls = collect(reg, "users.**")
+
+    with t.batch():
+        for i in range(5):
+            t.set(f"users.u{i}.score", i)
+        assert calls == []
+
+    assert len(calls) == 1
+    assert [c.path for c in calls[0]] == [f"users.u{i}.score" for i in range(5)]
+
+
+def test_cancel_and_threaded_delivery():
+    t = ConfigTree()
+    reg = WatchRegistry(t)
+    seen = []
+    writer = threading.get_ident()
+
+    w = reg.subscribe("a", lambda changes: seen.append(threading.get_ident()), threaded=True)
+    t.set("a", 1)
+    reg.wait()
+    w.cancel()
+    t.set("a", 2)
+    reg.wait()
+    reg.close()
+
+    assert len(seen) == 1 and seen[0] != writer
+
+
+def test_configx_watch():
+    from configx import ConfigX
+
+    cx = ConfigX()
+    calls = []
+    cx.watch("app.*", calls.append)
+    cx.resolve('app.theme="dark"')
+    cx.close()
+
+    assert calls[0][0].value == "dark"
+
+
+def test_reset_notifies_every_watch():
+    from configx import ConfigX
+
+    cx = ConfigX()
+    calls = []
+    cx.watch("app.**", calls.append)
+    cx.watch("agents.*.status", calls.append)
+    cx.resolve('app.theme="dark"')
+
+    cx._tree.load_dict({"app": {"theme": "light"}})
+
+    assert [c[0].op for c in calls] == ["SET", "RESET", "RESET"]
+    assert cx.resolve("app.theme") == "light"
+    cx.close()
+
+
+def test_failing_callback_is_reported_not_raised():
+    t = ConfigTree()
+    reg = WatchRegistry(t)
+    reg.subscribe("a", lambda changes: 1 / 0)
+    after = collect(reg, "a")
+
+    with pytest.warns(RuntimeWarning, match="ZeroDivisionError"):
+        t.set("a", 1)
+
+    assert t.get("a") == 1
+    assert len(after) == 1
@@ -0,0 +1,132 @@
+"""
+ConfigX Testing Suite - test_wildcards.py
+
+Tests for [.], [..] and [*] wildcard selection, updates and deletes
+
+Developed & Maintained by Aditya Gaur, 2025
+"""
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from configx.core.tree import ConfigTree
+from configx.core.errors import ConfigQueryError
+from configx.storage.runtime import StorageRuntime
+from configx.qlang.interpreter import ConfigXQLInterpreter
+
+
+DATA = {
+    "users": {
+        "u1": {"active": False, "userId": 1, "profile": {"userId": 11}},
+        "u2": {"active": True, "userId": 2},
+    },
+    "userId": 0,
+}
+
+
+@pytest.fixture()
+def q():
+    tree = ConfigTree()
+    tree.load_dict(DATA)
+    return ConfigXQLInterpreter(tree)
+
+
+def test_child_wildcard(q):
+    assert q.execute("users.[.].active") == {"users.u1.active": False, "users.u2.active": True}
+    assert q.execute("users.[.].missing") == {}
+
+
+def test_depth_wildcard_includes_zero_levels(q):
+    assert q.execute("[..].userId") == {
+        "userId": 0,
+        "users.u1.userId": 1,
+        "users.u1.profile.userId": 11,
+        "users.u2.userId": 2,
+    }
+
+
+def test_descendant_wildcard(q):
+    matches = q.execute("users.u1.[*]")
+    assert list(matches) == [
+        "users.u1.active", "users.u1.userId", "users.u1.profile", "users.u1.profile.userId",
+    ]
+
+
+def test_repeated_depth_wildcards_match_once(q):
+    assert list(q.tree.select("[..].[..].userId")) == list(q.tree.select("[..].userId"))
+    assert list(q.tree.select("[..].profile.[..].userId")) == [("users.u1.profile.userId", 11)]
+
+
+def test_select_is_a_generator(q):
+    stream = q.tree.select("[..].userId")
+    assert next(stream) == ("userId", 0)
+
+
+def test_set_updates_existing_values_only(q):
+    assert q.execute("users.[.].active=true") == 2
+    assert q.execute("users.[.].userId=7") == 2
+    assert q.tree.get("users.u1.profile.userId") == 11
+    assert q.tree.get("users.u1.active") is True
+
+    # no match: nothing created
+    assert q.execute("users.[.].email=\"x\"") == 0
+    assert "email" not in q.tree.get("users.u1")
+
+    # a branch that matches is not overwritten
+    assert q.execute("users.[.]=1") == 0
+
+
+def test_delete(q):
+    assert q.execute("[..].userId-") == 4
+    assert q.tree.to_dict() == {"users": {"u1": {"active": False, "profile": {}}, "u2": {"active": True}}}
+
+    # u1 and u2 go first; the matches below them are gone with them
+    assert q.execute("users.[*]-") == 2
+    assert q.tree.to_dict() == {"users": {}}
+
+
+def test_wildcards_hide_expired_nodes(q):
+    q.tree.expire_at("users.u2", 1.0)
+    assert q.execute("users.[.].active") == {"users.u1.active": False}
+
+
+def test_wildcards_rejected_where_unsupported(q):
+    with pytest.raises(ConfigQueryError):
+        q.execute("users.[.].userId@1=5")
+    with pytest.raises(ConfigQueryError):
+        q.execute("users.[.]!version")
+
+
+def test_prepared_path_parameter_is_never_a_wildcard(q):
+    q.prepare("users.$uid.active=true")(uid="[*]")
+    assert q.tree.get("users.[*].active") is True
+    assert q.tree.get("users.u1.active") is False
+
+
+def test_bulk_update_is_one_wal_group(monkeypatch):
+    tmpdir = tempfile.mkdtemp()
+    try:
+        snapshot = os.path.join(tmpdir, "state.snapshot")
+        wal = os.path.join(tmpdir, "state.wal")
+        runtime = StorageRuntime(snapshot, wal)
+        tree = ConfigTree(runtime=runtime)
+        runtime.start(tree)
+        with runtime.group():
+            for n in range(20):
+                tree.set(f"agents.a{n}.status", "idle")
+
+        syncs = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: (syncs.append(fd), real_fsync(fd)))
+
+        assert tree.set_matching("agents.[.].status", "busy") == 20
+        assert len(syncs) == 1
+
+        runtime2 = StorageRuntime(snapshot, wal)
+        tree2 = ConfigTree(runtime=runtime2)
+        runtime2.start(tree2)
+        assert set(dict(tree2.select("agents.[.].status")).values()) == {"busy"}
+    finally:
+        shutil.rmtree(tmpdir)